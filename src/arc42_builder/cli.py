@@ -1,9 +1,8 @@
 import click
+import os
 from pathlib import Path
 import logging
 
-from .core.builder import BuildPipeline
-from .config.loader import ConfigLoader
 from .converters import list_converters
 
 # Default config path inside the container
@@ -15,17 +14,39 @@ DEFAULT_CONFIG_PATH = Path("/app/config/build.yaml")
 @click.pass_context
 def cli(ctx, config_path, verbose):
     """arc42 template build system"""
-    # Initial logging setup with minimal level for config loading
-    logging.basicConfig(level="ERROR", format='%(asctime)s - %(levelname)s - %(name)s - %(message)s')
+    # Initial logging setup with minimal level for config loading.
+    # Timestamps are only formatted in verbose mode, and the thread/process
+    # fields are never used, so LogRecord creation skips them.
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    if verbose:
+        log_format = '%(asctime)s - %(levelname)s - %(name)s - %(message)s'
+    else:
+        log_format = '%(levelname)s - %(name)s - %(message)s'
+    logging.basicConfig(level="ERROR", format=log_format)
 
     ctx.ensure_object(dict)
+    # The configuration is loaded lazily by the commands that need it.
+    ctx.obj['config_path'] = config_path
+    ctx.obj['verbose'] = verbose
+
+
+def _get_config(ctx):
+    """Load the configuration on first access and apply its logging settings."""
+    if 'config' in ctx.obj:
+        return ctx.obj['config']
+
+    from .config.loader import ConfigLoader
+
+    config_path = ctx.obj['config_path']
     try:
         config = ConfigLoader().load(config_path)
         ctx.obj['config'] = config
 
         # Now configure logging based on config file and CLI options
         # CLI --verbose flag overrides config file setting
-        if verbose:
+        if ctx.obj['verbose']:
             log_level = "DEBUG"
         else:
             log_level = config.logging.level if hasattr(config, 'logging') else "INFO"
@@ -45,6 +66,8 @@ def cli(ctx, config_path, verbose):
         logging.error(f"Error loading configuration: {e}", exc_info=True)
         ctx.exit(1)
 
+    return config
+
 
 @cli.command()
 @click.option('--lang', multiple=True, help='Language(s) to build (e.g., EN). Overrides config file.')
@@ -54,7 +77,9 @@ def cli(ctx, config_path, verbose):
 @click.pass_context
 def build(ctx, lang, formats, flavor, build_all):
     """Build arc42 templates based on the configuration."""
-    config = ctx.obj['config']
+    from .core.builder import BuildPipeline
+
+    config = _get_config(ctx)
     
     if not build_all and not any([lang, formats, flavor]):
         click.echo("Please specify what to build or use --all.")
@@ -65,9 +90,14 @@ def build(ctx, lang, formats, flavor, build_all):
     if lang:
         config.languages = list(lang)
     if formats:
-        # Filter formats from config
-        enabled_formats = {f: config.formats[f] for f in formats if f in config.formats}
-        config.formats = enabled_formats
+        requested = set(formats)
+        unknown = requested - config.formats.keys()
+        if unknown:
+            click.echo(click.style(
+                f"Warning: ignoring format(s) not in config: {', '.join(sorted(unknown))}", fg="yellow"), err=True)
+        # Filter formats from config, keeping it as-is when every format was requested
+        if requested != config.formats.keys():
+            config.formats = {f: config.formats[f] for f in formats if f in config.formats}
     if flavor:
         config.flavors = list(flavor)
     
@@ -82,7 +112,9 @@ def build(ctx, lang, formats, flavor, build_all):
 @click.pass_context
 def validate(ctx):
     """Validate template sources and build environment."""
-    config = ctx.obj['config']
+    from .core.builder import BuildPipeline
+
+    config = _get_config(ctx)
     try:
         # The validator is initialized in the pipeline
         pipeline = BuildPipeline(config)
@@ -112,20 +144,23 @@ def test(ctx):
 
     # Try to run pytest if available
     try:
-        result = subprocess.run(
+        # Stream output line by line instead of buffering the whole run
+        with subprocess.Popen(
             ["pytest", "/app/tests", "-v"],
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=1,
             text=True
-        )
-        click.echo(result.stdout)
-        if result.stderr:
-            click.echo(result.stderr, err=True)
+        ) as proc:
+            for line in proc.stdout:
+                click.echo(line, nl=False)
+        returncode = proc.wait()
 
-        if result.returncode == 0:
+        if returncode == 0:
             click.echo(click.style("✓ All tests passed", fg="green"))
         else:
             click.echo(click.style("✗ Some tests failed", fg="red"))
-            ctx.exit(result.returncode)
+            ctx.exit(returncode)
     except FileNotFoundError:
         # pytest not found, run basic smoke test
         click.echo("pytest not found, running basic smoke test...")
@@ -139,7 +174,7 @@ def test(ctx):
         click.echo(f"✓ Found {len(converters)} converters")
 
         # Check that config can be loaded
-        config = ctx.obj.get('config')
+        config = _get_config(ctx)
         if not config:
             click.echo(click.style("✗ Config not loaded", fg="red"))
             ctx.exit(1)
@@ -153,7 +188,9 @@ def test(ctx):
 @click.pass_context
 def test_artifacts(ctx, build_dir):
     """Validate build artifacts for syntax correctness and missing images."""
-    config = ctx.obj['config']
+    from .core.builder import BuildPipeline
+
+    config = _get_config(ctx)
 
     if not build_dir:
         build_dir = Path(config.build.output_dir)
@@ -164,7 +201,6 @@ def test_artifacts(ctx, build_dir):
         ctx.exit(1)
 
     try:
-        from .core.builder import BuildPipeline
         pipeline = BuildPipeline(config)
         pipeline.validator.validate_build_artifacts(build_dir)
         click.echo(click.style("✓ All build artifacts validated successfully", fg="green"))
@@ -174,16 +210,96 @@ def test_artifacts(ctx, build_dir):
         ctx.exit(1)
 
 
+# Formats whose artifacts are already compressed containers; deflating them
+# again costs CPU for next to no size reduction.
+_STORED_FORMATS = {"pdf", "docx", "epub"}
+# Files up to this size are read in one go and added with writestr();
+# larger ones are streamed into the archive in chunks of this size.
+_ZIP_BUFFER_SIZE = 1 << 20
+
+
+def _iter_files(root: str):
+    """
+    Yield (path, stat_result) for all regular files below root.
+
+    Uses os.scandir so the file type comes from the directory read; the
+    single lstat per file is reused for the archive metadata.
+    """
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    yield entry.path, entry.stat(follow_symlinks=False)
+
+
+def _iter_format_dirs(build_dir: str):
+    """
+    Yield (lang, flavor, format, path) for every {LANG}/{FLAVOR}/{FORMAT} directory.
+
+    The directory type comes from the cached dirent, so no Path objects or
+    extra stat calls are needed for the intermediate levels.
+    """
+    def subdirs(path):
+        with os.scandir(path) as it:
+            return [entry for entry in it if entry.is_dir(follow_symlinks=False)]
+
+    for lang_entry in subdirs(build_dir):
+        for flavor_entry in subdirs(lang_entry.path):
+            for format_entry in subdirs(flavor_entry.path):
+                yield lang_entry.name, flavor_entry.name, format_entry.name, format_entry.path
+
+
+def _make_zip(format_dir: Path, zip_path: Path) -> Path:
+    """Archive all files below format_dir into zip_path (runs in a worker process)."""
+    import shutil
+    import time
+    import zipfile
+
+    if format_dir.name in _STORED_FORMATS:
+        compression, compresslevel = zipfile.ZIP_STORED, None
+    elif format_dir.name == "html":
+        # Fastest DEFLATE level; images next to the HTML are PNG/JPEG anyway
+        compression, compresslevel = zipfile.ZIP_DEFLATED, 1
+    else:
+        compression, compresslevel = zipfile.ZIP_DEFLATED, None
+
+    root = os.fspath(format_dir)
+    with zipfile.ZipFile(zip_path, 'w', compression, compresslevel=compresslevel) as zipf:
+        # Add all files from the format directory
+        for file_path, st in _iter_files(root):
+            # Create relative path for the archive
+            arcname = os.path.relpath(file_path, root)
+            zinfo = zipfile.ZipInfo(arcname, time.localtime(st.st_mtime)[:6])
+            zinfo.external_attr = (st.st_mode & 0xFFFF) << 16
+            # The known size lets zipfile decide on ZIP64 itself
+            zinfo.file_size = st.st_size
+            zinfo.compress_type = compression
+
+            if st.st_size <= _ZIP_BUFFER_SIZE:
+                with open(file_path, 'rb') as f:
+                    zipf.writestr(zinfo, f.read(), compresslevel=compresslevel)
+            elif compresslevel is None:
+                with open(file_path, 'rb') as src, zipf.open(zinfo, 'w') as dst:
+                    shutil.copyfileobj(src, dst, _ZIP_BUFFER_SIZE)
+            else:
+                # ZipFile.open() takes no compresslevel for a ZipInfo; write()
+                # streams the file at the archive's level
+                zipf.write(file_path, arcname)
+    return zip_path
+
+
 @cli.command("dist")
 @click.option('--build-dir', type=click.Path(exists=True, path_type=Path), default=None, help="Path to build directory (defaults to config)")
 @click.option('--dist-dir', type=click.Path(path_type=Path), default=None, help="Path to dist directory (defaults to config)")
 @click.pass_context
 def dist(ctx, build_dir, dist_dir):
     """Create ZIP distributions of build artifacts."""
-    import zipfile
-    import datetime
+    from concurrent.futures import ProcessPoolExecutor, as_completed
 
-    config = ctx.obj['config']
+    config = _get_config(ctx)
 
     if not build_dir:
         build_dir = Path(config.build.output_dir)
@@ -202,40 +318,33 @@ def dist(ctx, build_dir, dist_dir):
     click.echo(f"Creating ZIP distributions from {build_dir} to {dist_dir}...")
 
     # Create ZIPs following the structure: workspace/dist/{LANG}/{FLAVOR}/{FORMAT}/
-    zip_count = 0
-    for lang_dir in build_dir.iterdir():
-        if not lang_dir.is_dir():
-            continue
-
-        lang = lang_dir.name
-        for flavor_dir in lang_dir.iterdir():
-            if not flavor_dir.is_dir():
-                continue
-
-            flavor = flavor_dir.name
-            for format_dir in flavor_dir.iterdir():
-                if not format_dir.is_dir():
-                    continue
-
-                format_name = format_dir.name
-
-                # Create output directory structure
-                output_zip_dir = dist_dir / lang / flavor / format_name
+    jobs = []
+    created_dirs = set()
+    for lang, flavor, format_name, format_dir in _iter_format_dirs(build_dir):
+        # Create output directory structure; directories created earlier in
+        # this run are skipped, and the {LANG}/{FLAVOR} parent only needs the
+        # parents=True walk once
+        output_zip_dir = dist_dir / lang / flavor / format_name
+        if output_zip_dir not in created_dirs:
+            if output_zip_dir.parent in created_dirs:
+                output_zip_dir.mkdir(exist_ok=True)
+            else:
                 output_zip_dir.mkdir(parents=True, exist_ok=True)
+                created_dirs.add(output_zip_dir.parent)
+            created_dirs.add(output_zip_dir)
 
-                # Create ZIP file
-                zip_filename = f"arc42-template-{lang}-{flavor}-{format_name}.zip"
-                zip_path = output_zip_dir / zip_filename
+        zip_filename = f"arc42-template-{lang}-{flavor}-{format_name}.zip"
+        jobs.append((Path(format_dir), output_zip_dir / zip_filename))
 
-                with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-                    # Add all files from the format directory
-                    for file_path in format_dir.rglob('*'):
-                        if file_path.is_file():
-                            # Create relative path for the archive
-                            arcname = file_path.relative_to(format_dir)
-                            zipf.write(file_path, arcname)
-
-                click.echo(f"  ✓ Created {zip_filename}")
+    # DEFLATE compression is CPU-bound and independent per archive
+    zip_count = 0
+    if jobs:
+        max_workers = min(len(jobs), config.build.max_workers)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(_make_zip, format_dir, zip_path): zip_path for format_dir, zip_path in jobs}
+            for future in as_completed(futures):
+                future.result()
+                click.echo(f"  ✓ Created {futures[future].name}")
                 zip_count += 1
 
     click.echo(click.style(f"✓ Created {zip_count} ZIP distributions in {dist_dir}", fg="green"))
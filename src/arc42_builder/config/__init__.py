@@ -1,6 +1,6 @@
 """Configuration module for arc42 build system."""
 
-from .loader import load_config, ConfigLoader, ConfigError
+from .loader import load_config, ConfigLoader, ConfigError, default_cache_dir
 from .models import (
     BuildConfig,
     TemplateConfig,
@@ -17,6 +17,7 @@ __all__ = [
     "load_config",
     "ConfigLoader",
     "ConfigError",
+    "default_cache_dir",
     "BuildConfig",
     "TemplateConfig",
     "FormatConfig",
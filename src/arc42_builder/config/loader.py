@@ -2,13 +2,21 @@
 
 import os
 import json
+import pickle
+import hashlib
+import tempfile
+from functools import cached_property
 from pathlib import Path
 from typing import Dict, Any, Optional
 
 import yaml
-import jsonschema
-from jsonschema import ValidationError
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+from . import models
 from .models import (
     BuildConfig,
     TemplateConfig,
@@ -18,6 +26,36 @@ from .models import (
     AdvancedSettings,
 )
 
+# Prefer the libyaml-backed loader; fall back to the pure-Python one
+# when PyYAML was built without libyaml.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _to_bool(value: str) -> bool:
+    """Interpret an environment variable value as a boolean."""
+    return value.lower() == "true"
+
+
+# Environment variable overrides: (variable, config path, converter).
+# Their values are also part of the config cache key.
+_ENV_OVERRIDES = (
+    ("ARC42_BUILD_PARALLEL", ("build", "parallel"), _to_bool),
+    ("ARC42_BUILD_MAX_WORKERS", ("build", "max_workers"), int),
+    ("ARC42_BUILD_VALIDATE", ("build", "validate"), _to_bool),
+    ("ARC42_LOG_LEVEL", ("logging", "level"), str),
+    ("ARC42_TEMPLATE_PATH", ("template", "path"), str),
+)
+
+
+def default_cache_dir() -> Path:
+    """
+    Return the builder's per-user cache directory, ~/.cache/arc42-builder
+    (or below $XDG_CACHE_HOME). Holds parsed configurations and the
+    incremental build caches.
+    """
+    base = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "arc42-builder"
+
 
 class ConfigError(Exception):
     """Raised when configuration is invalid."""
@@ -27,19 +65,26 @@ class ConfigError(Exception):
 class ConfigLoader:
     """Loads and validates build configuration."""
 
-    def __init__(self, schema_path: Optional[Path] = None):
+    def __init__(self, schema_path: Optional[Path] = None, cache_dir: Optional[Path] = None):
         """
         Initialize config loader.
 
         Args:
             schema_path: Path to JSON schema file. If None, uses default location.
+            cache_dir: Directory for cached, already validated configurations.
+                If None, uses ~/.cache/arc42-builder (or $XDG_CACHE_HOME).
         """
         if schema_path is None:
             # Default to config/schema.json relative to project root
             schema_path = Path(__file__).parent.parent.parent.parent / "config" / "schema.json"
 
         self.schema_path = schema_path
-        self.schema = self._load_schema()
+        self.cache_dir = cache_dir if cache_dir is not None else default_cache_dir()
+
+    @cached_property
+    def schema(self) -> Dict[str, Any]:
+        """JSON schema, read on first use so cache hits never touch it."""
+        return self._load_schema()
 
     def _load_schema(self) -> Dict[str, Any]:
         """Load JSON schema from file."""
@@ -47,17 +92,23 @@ class ConfigLoader:
             raise ConfigError(f"Schema file not found: {self.schema_path}")
 
         try:
-            with open(self.schema_path, 'r') as f:
-                return json.load(f)
+            # orjson is optional; its decode error subclasses json.JSONDecodeError
+            return _json_loads(self.schema_path.read_bytes())
         except json.JSONDecodeError as e:
             raise ConfigError(f"Invalid JSON schema: {e}")
 
-    def load(self, config_path: Path) -> BuildConfig:
+    def load(self, config_path: Path, use_cache: bool = True, validate_schema: bool = True) -> BuildConfig:
         """
         Load and validate configuration from YAML file.
 
+        A validated configuration is cached on disk and reused as long as
+        the YAML file, the schema and the environment overrides are unchanged.
+
         Args:
             config_path: Path to build.yaml file
+            use_cache: Read and write the on-disk config cache
+            validate_schema: Validate against the JSON schema. Configurations
+                loaded without schema validation are never written to the cache.
 
         Returns:
             BuildConfig object
@@ -65,6 +116,21 @@ class ConfigLoader:
         Raises:
             ConfigError: If configuration is invalid
         """
+        cache_file = self._cache_file(config_path) if use_cache else None
+        if cache_file is not None:
+            cached = self._read_cache(cache_file)
+            if cached is not None:
+                return cached
+
+        build_config = self._load_uncached(config_path, validate_schema)
+
+        if cache_file is not None and validate_schema:
+            self._write_cache(cache_file, build_config)
+
+        return build_config
+
+    def _load_uncached(self, config_path: Path, validate_schema: bool = True) -> BuildConfig:
+        """Parse, validate and convert the YAML file without the cache."""
         # Load YAML
         config_data = self._load_yaml(config_path)
 
@@ -72,7 +138,8 @@ class ConfigLoader:
         config_data = self._apply_env_overrides(config_data)
 
         # Validate against schema
-        self._validate_schema(config_data)
+        if validate_schema:
+            self._validate_schema(config_data)
 
         # Convert to dataclass models
         build_config = self._build_config_from_dict(config_data)
@@ -84,6 +151,56 @@ class ConfigLoader:
 
         return build_config
 
+    def _cache_file(self, config_path: Path) -> Optional[Path]:
+        """
+        Return the cache file for a configuration, or None if the
+        configuration file cannot be stat'ed.
+
+        The key covers the config file (path, mtime, size), the schema and
+        models module mtimes, and the values of all environment overrides.
+        """
+        try:
+            config_stat = config_path.stat()
+            key = (
+                str(config_path.resolve()),
+                config_stat.st_mtime_ns,
+                config_stat.st_size,
+                str(self.schema_path),
+                self.schema_path.stat().st_mtime_ns,
+                Path(models.__file__).stat().st_mtime_ns,
+                tuple(os.environ.get(name) for name, _, _ in _ENV_OVERRIDES),
+            )
+        except OSError:
+            return None
+
+        digest = hashlib.blake2b(repr(key).encode("utf-8"), digest_size=16).hexdigest()
+        return self.cache_dir / f"{digest}.pkl"
+
+    def _read_cache(self, cache_file: Path) -> Optional[BuildConfig]:
+        """Return the cached BuildConfig, or None on a miss or unreadable entry."""
+        try:
+            with open(cache_file, 'rb') as f:
+                cached = pickle.load(f)
+        except Exception:
+            return None
+        return cached if isinstance(cached, BuildConfig) else None
+
+    def _write_cache(self, cache_file: Path, build_config: BuildConfig) -> None:
+        """Atomically store a validated BuildConfig. Failures are ignored."""
+        tmp_name = None
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(dir=cache_file.parent, suffix=".tmp", delete=False) as f:
+                tmp_name = f.name
+                pickle.dump(build_config, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_name, cache_file)
+        except (OSError, pickle.PicklingError):
+            if tmp_name is not None:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
+
     def _load_yaml(self, config_path: Path) -> Dict[str, Any]:
         """Load YAML configuration file."""
         if not config_path.exists():
@@ -91,17 +208,27 @@ class ConfigLoader:
 
         try:
             with open(config_path, 'r') as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=_YAML_LOADER)
                 if not isinstance(data, dict):
                     raise ConfigError("Configuration must be a YAML object/dictionary")
                 return data
         except yaml.YAMLError as e:
             raise ConfigError(f"Invalid YAML syntax: {e}")
 
+    @cached_property
+    def _validator(self):
+        """JSON schema validator, compiled once per loader."""
+        import jsonschema
+
+        validator_cls = jsonschema.validators.validator_for(self.schema)
+        return validator_cls(self.schema)
+
     def _validate_schema(self, config_data: Dict[str, Any]) -> None:
         """Validate configuration against JSON schema."""
+        from jsonschema import ValidationError
+
         try:
-            jsonschema.validate(instance=config_data, schema=self.schema)
+            self._validator.validate(config_data)
         except ValidationError as e:
             # Provide more user-friendly error message
             path = " -> ".join(str(p) for p in e.path) if e.path else "root"
@@ -115,35 +242,13 @@ class ConfigLoader:
         Examples:
             ARC42_BUILD_PARALLEL=false
             ARC42_BUILD_MAX_WORKERS=8
-            ARC42_BUILD_LOG_LEVEL=DEBUG
+            ARC42_LOG_LEVEL=DEBUG
         """
-        # Build settings
-        if os.getenv("ARC42_BUILD_PARALLEL"):
-            if "build" not in config_data:
-                config_data["build"] = {}
-            config_data["build"]["parallel"] = os.getenv("ARC42_BUILD_PARALLEL").lower() == "true"
-
-        if os.getenv("ARC42_BUILD_MAX_WORKERS"):
-            if "build" not in config_data:
-                config_data["build"] = {}
-            config_data["build"]["max_workers"] = int(os.getenv("ARC42_BUILD_MAX_WORKERS"))
-
-        if os.getenv("ARC42_BUILD_VALIDATE"):
-            if "build" not in config_data:
-                config_data["build"] = {}
-            config_data["build"]["validate"] = os.getenv("ARC42_BUILD_VALIDATE").lower() == "true"
-
-        # Logging settings
-        if os.getenv("ARC42_LOG_LEVEL"):
-            if "logging" not in config_data:
-                config_data["logging"] = {}
-            config_data["logging"]["level"] = os.getenv("ARC42_LOG_LEVEL")
-
-        # Template path override
-        if os.getenv("ARC42_TEMPLATE_PATH"):
-            if "template" not in config_data:
-                config_data["template"] = {}
-            config_data["template"]["path"] = os.getenv("ARC42_TEMPLATE_PATH")
+        environ = os.environ
+        for name, (section, key), convert in _ENV_OVERRIDES:
+            value = environ.get(name)
+            if value:
+                config_data.setdefault(section, {})[key] = convert(value)
 
         return config_data
 
@@ -177,6 +282,7 @@ class ConfigLoader:
             clean_before=build_data.get("clean_before", True),
             create_zips=build_data.get("create_zips", True),
             verify_fonts=build_data.get("verify_fonts", True),
+            incremental=build_data.get("incremental", True),
             output_dir=build_data.get("output_dir", "workspace/build"),
             dist_dir=build_data.get("dist_dir", "workspace/dist"),
             log_dir=build_data.get("log_dir", "workspace/logs")
@@ -1,23 +1,38 @@
 """Configuration data models for arc42 build system."""
 
 from dataclasses import dataclass, field
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any
 
+# The converters own the context they receive; re-exported for existing imports
+from ..converters.base import BuildContext
 
-@dataclass
+# Allowed values checked by BuildConfig.validate_basic
+_VALID_LANGUAGES = frozenset({"EN", "DE", "FR", "CZ", "ES", "IT", "NL", "PT", "RU", "UKR", "ZH"})
+_VALID_FLAVORS = frozenset({"plain", "withHelp"})
+_VALID_PRIORITIES = frozenset({1, 2, 3})
+_VALID_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR"})
+
+
+@dataclass(slots=True)
 class TemplateConfig:
     """Configuration for the template repository."""
     repository: str
     ref: str
     path: str
+    # Resolved paths keyed by the path string, so reassigning path still works
+    _resolved: Dict[str, Path] = field(default_factory=dict, init=False, repr=False, compare=False)
 
     def get_path(self) -> Path:
-        """Get template path as Path object."""
-        return Path(self.path).expanduser().resolve()
+        """Get template path as Path object (resolved once per path value)."""
+        resolved = self._resolved.get(self.path)
+        if resolved is None:
+            resolved = self._resolved[self.path] = Path(self.path).expanduser().resolve()
+        return resolved
 
 
-@dataclass
+@dataclass(slots=True)
 class FormatOptions:
     """Options for a specific output format."""
     options: Dict[str, Any] = field(default_factory=dict)
@@ -27,7 +42,7 @@ class FormatOptions:
         return self.options.get(key, default)
 
 
-@dataclass
+@dataclass(slots=True)
 class FormatConfig:
     """Configuration for an output format."""
     enabled: bool
@@ -43,7 +58,7 @@ class FormatConfig:
         return self.options.get(key, default)
 
 
-@dataclass
+@dataclass(slots=True)
 class BuildSettings:
     """Build execution settings."""
     parallel: bool = True
@@ -52,24 +67,33 @@ class BuildSettings:
     clean_before: bool = True
     create_zips: bool = True
     verify_fonts: bool = True
+    incremental: bool = True
     output_dir: str = "workspace/build"
     dist_dir: str = "workspace/dist"
     log_dir: str = "workspace/logs"
+    # Path objects keyed by the directory string they were built from
+    _paths: Dict[str, Path] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def _path_for(self, value: str) -> Path:
+        path = self._paths.get(value)
+        if path is None:
+            path = self._paths[value] = Path(value)
+        return path
 
     def get_output_path(self) -> Path:
         """Get output directory as Path."""
-        return Path(self.output_dir)
+        return self._path_for(self.output_dir)
 
     def get_dist_path(self) -> Path:
         """Get distribution directory as Path."""
-        return Path(self.dist_dir)
+        return self._path_for(self.dist_dir)
 
     def get_log_path(self) -> Path:
         """Get log directory as Path."""
-        return Path(self.log_dir)
+        return self._path_for(self.log_dir)
 
 
-@dataclass
+@dataclass(slots=True)
 class LoggingConfig:
     """Logging configuration."""
     level: str = "INFO"
@@ -82,7 +106,7 @@ class LoggingConfig:
         return self.level.upper()
 
 
-@dataclass
+@dataclass(slots=True)
 class AdvancedSettings:
     """Advanced build options."""
     fail_fast: bool = False
@@ -91,7 +115,7 @@ class AdvancedSettings:
     continue_on_error: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class BuildConfig:
     """Complete build configuration."""
     version: str
@@ -131,74 +155,48 @@ class BuildConfig:
     def validate_basic(self) -> List[str]:
         """
         Perform basic validation of configuration values.
-        Returns list of error messages (empty if valid).
+        Returns list of error messages (empty if valid). With
+        advanced.fail_fast set, stops at the first error.
         """
-        errors = []
+        limit = 1 if self.advanced.fail_fast else None
+        return list(islice(self._iter_errors(), limit))
 
+    def _iter_errors(self) -> Iterator[str]:
+        """Yield validation error messages, cheapest checks first."""
         # Validate version format
         if not self.version or '.' not in self.version:
-            errors.append("Invalid version format. Expected 'X.Y'")
+            yield "Invalid version format. Expected 'X.Y'"
 
-        # Validate languages
+        # Validate languages, flavors and formats are not empty
         if not self.languages:
-            errors.append("At least one language must be specified")
-
-        valid_languages = {"EN", "DE", "FR", "CZ", "ES", "IT", "NL", "PT", "RU", "UKR", "ZH"}
-        for lang in self.languages:
-            if lang not in valid_languages:
-                errors.append(f"Invalid language: {lang}")
+            yield "At least one language must be specified"
 
-        # Validate flavors
         if not self.flavors:
-            errors.append("At least one flavor must be specified")
+            yield "At least one flavor must be specified"
 
-        valid_flavors = {"plain", "withHelp"}
-        for flavor in self.flavors:
-            if flavor not in valid_flavors:
-                errors.append(f"Invalid flavor: {flavor}")
-
-        # Validate at least one format is enabled
         if not self.get_enabled_formats():
-            errors.append("At least one output format must be enabled")
-
-        # Validate format priorities
-        for name, format_config in self.formats.items():
-            if format_config.priority not in [1, 2, 3]:
-                errors.append(f"Invalid priority for format {name}: {format_config.priority}")
+            yield "At least one output format must be enabled"
 
         # Validate build settings
         if self.build.max_workers < 1:
-            errors.append("max_workers must be at least 1")
+            yield "max_workers must be at least 1"
 
         # Validate logging level
-        valid_levels = {"DEBUG", "INFO", "WARNING", "ERROR"}
-        if self.logging.level.upper() not in valid_levels:
-            errors.append(f"Invalid log level: {self.logging.level}")
-
-        return errors
-
-
-@dataclass
-class BuildContext:
-    """
-    Context object passed to format converters.
-    Contains all information needed to perform a conversion.
-    """
-    language: str
-    flavor: str
-    source_dir: Path
-    output_dir: Path
-    version_props: Dict[str, str]
-    config: FormatConfig
-    template_path: Path = None
-
-    def get_version_attr(self, key: str, default: str = "") -> str:
-        """Get a version property with default."""
-        return self.version_props.get(key, default)
-
-    def get_format_option(self, key: str, default: Any = None) -> Any:
-        """Get a format-specific option."""
-        return self.config.get_option(key, default)
+        if self.logging.level.upper() not in _VALID_LEVELS:
+            yield f"Invalid log level: {self.logging.level}"
+
+        for lang in self.languages:
+            if lang not in _VALID_LANGUAGES:
+                yield f"Invalid language: {lang}"
+
+        for flavor in self.flavors:
+            if flavor not in _VALID_FLAVORS:
+                yield f"Invalid flavor: {flavor}"
+
+        # Validate format priorities
+        for name, format_config in self.formats.items():
+            if format_config.priority not in _VALID_PRIORITIES:
+                yield f"Invalid priority for format {name}: {format_config.priority}"
 
 
 # Compatibility alias for existing code
@@ -1,44 +1,57 @@
-from typing import Dict, Type
+from functools import lru_cache
+from importlib import import_module
+from typing import Dict, List
 from .base import ConverterPlugin
-from .html import HtmlConverter
-from .pdf import PdfConverter
-from .asciidoc import AsciidocConverter
-from .docx import DocxConverter
-from .markdown import MarkdownConverter
-from .markdown_mp import MarkdownMpConverter
-from .github_markdown import GithubMarkdownConverter
-from .github_markdown_mp import GithubMarkdownMpConverter
-from .rst import RstConverter
-from .textile import TextileConverter
-from .confluence import ConfluenceConverter
 
 # A registry of all available converter plugins
-# The key is the format name (e.g., 'html')
-CONVERTERS: Dict[str, ConverterPlugin] = {
-    "html": HtmlConverter(),
-    "pdf": PdfConverter(),
-    "asciidoc": AsciidocConverter(),
-    "docx": DocxConverter(),
-    "markdown": MarkdownConverter(),
-    "markdown_mp": MarkdownMpConverter(),
-    "github_markdown": GithubMarkdownConverter(),
-    "github_markdown_mp": GithubMarkdownMpConverter(),
-    "rst": RstConverter(),
-    "textile": TextileConverter(),
-    "confluence": ConfluenceConverter(),
+# The key is the format name (e.g., 'html'), the value is "module:Class".
+# Converter modules are only imported when the format is first requested.
+CONVERTERS: Dict[str, str] = {
+    "html": "arc42_builder.converters.html:HtmlConverter",
+    "pdf": "arc42_builder.converters.pdf:PdfConverter",
+    "asciidoc": "arc42_builder.converters.asciidoc:AsciidocConverter",
+    "docx": "arc42_builder.converters.docx:DocxConverter",
+    "markdown": "arc42_builder.converters.markdown:MarkdownConverter",
+    "markdown_mp": "arc42_builder.converters.markdown_mp:MarkdownMpConverter",
+    "github_markdown": "arc42_builder.converters.github_markdown:GithubMarkdownConverter",
+    "github_markdown_mp": "arc42_builder.converters.github_markdown_mp:GithubMarkdownMpConverter",
+    "rst": "arc42_builder.converters.rst:RstConverter",
+    "textile": "arc42_builder.converters.textile:TextileConverter",
+    "confluence": "arc42_builder.converters.confluence:ConfluenceConverter",
 }
 
+# Converter instances created so far, keyed by format name
+_instances: Dict[str, ConverterPlugin] = {}
+
+def available_formats() -> List[str]:
+    """
+    Returns the registered format names without importing any converter.
+    """
+    return list(CONVERTERS)
+
 def get_converter(format_name: str) -> ConverterPlugin:
     """
     Factory function to get a converter instance by its format name.
+    The converter module is imported and instantiated on first use.
     """
-    converter = CONVERTERS.get(format_name)
-    if not converter:
-        raise ValueError(f"No converter found for format: {format_name}")
+    converter = _instances.get(format_name)
+    if converter is None:
+        spec = CONVERTERS.get(format_name)
+        if not spec:
+            raise ValueError(f"No converter found for format: {format_name}")
+        module_name, class_name = spec.split(":")
+        converter_cls = getattr(import_module(module_name), class_name)
+        # setdefault keeps a single instance if two threads race here
+        converter = _instances.setdefault(format_name, converter_cls())
     return converter
 
+@lru_cache(maxsize=1)
 def list_converters() -> Dict[str, ConverterPlugin]:
     """
-    Returns the dictionary of all registered converters.
+    Returns the dictionary of all registered converters, ordered by priority.
+    This imports every converter module; use available_formats() when only
+    the names are needed. The result is computed once; use
+    list_converters.cache_clear() after modifying CONVERTERS.
     """
-    return CONVERTERS
+    converters = {name: get_converter(name) for name in CONVERTERS}
+    return dict(sorted(converters.items(), key=lambda item: item[1].priority))
@@ -0,0 +1,191 @@
+"""
+Long-lived Asciidoctor processes shared by the converters.
+
+Starting Ruby and loading the asciidoctor gem costs more than converting a
+single arc42 document, and the build matrix runs Asciidoctor dozens of times.
+The pool keeps warm Ruby processes that accept one command line per request
+(as a JSON array on stdin) and run it through Asciidoctor's own CLI invoker,
+so options behave exactly like the `asciidoctor` executable.
+
+One process serves one request at a time; parallel builds get one process per
+concurrent worker. `asciidoctor-pdf` command lines are served by the same
+processes, with the PDF backend required on demand. When Ruby or the gem is
+not available, commands fall back to a plain `subprocess.run`.
+"""
+
+import atexit
+import json
+import logging
+import subprocess
+import sys
+import threading
+from typing import List, Optional
+
+from .base import resolve_command
+
+logger = logging.getLogger(__name__)
+
+# Reads argv arrays line by line, answers with {"code", "stdout", "stderr"}.
+# $stdout is pointed at stderr so stray output cannot corrupt the protocol.
+_SERVER = r"""
+require 'json'
+require 'stringio'
+require 'asciidoctor'
+require 'asciidoctor/cli'
+STDOUT.sync = true
+$stdout = $stderr
+STDOUT.puts 'ready'
+STDIN.each_line do |line|
+  out = StringIO.new
+  err = StringIO.new
+  begin
+    invoker = Asciidoctor::Cli::Invoker.new(*JSON.parse(line))
+    invoker.redirect_streams(out, err)
+    invoker.invoke!
+    code = invoker.code
+  rescue SystemExit => e
+    code = e.status
+  rescue Exception => e
+    err.puts "#{e.class}: #{e.message}"
+    code = 1
+  end
+  STDOUT.puts JSON.generate('code' => code, 'stdout' => out.string, 'stderr' => err.string)
+end
+"""
+
+
+# Executables the server can stand in for, with the CLI options that make
+# Asciidoctor's invoker behave like them
+_EXECUTABLES = {
+    "asciidoctor": [],
+    "asciidoctor-pdf": ["-r", "asciidoctor-pdf"],
+}
+
+
+class _AsciidoctorProcess:
+    """A single Ruby process running the request loop."""
+
+    def __init__(self):
+        self.proc = subprocess.Popen(
+            resolve_command(["ruby", "-e", _SERVER]),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+            bufsize=1,
+        )
+        if self.proc.stdout.readline().strip() != "ready":
+            self.close()
+            raise OSError("Asciidoctor server did not start")
+
+    def invoke(self, args: List[str]) -> dict:
+        self.proc.stdin.write(json.dumps(args) + "\n")
+        self.proc.stdin.flush()
+        reply = self.proc.stdout.readline()
+        if not reply:
+            raise OSError("Asciidoctor server exited unexpectedly")
+        return json.loads(reply)
+
+    def close(self):
+        try:
+            self.proc.stdin.close()
+            self.proc.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            self.proc.kill()
+
+
+class AsciidoctorPool:
+    """Hands out warm Asciidoctor processes, starting them on demand."""
+
+    def __init__(self):
+        self._idle: List[_AsciidoctorProcess] = []
+        self._lock = threading.Lock()
+        self._available: Optional[bool] = None
+
+    def _acquire(self) -> Optional[_AsciidoctorProcess]:
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+            if self._available is False:
+                return None
+            try:
+                process = _AsciidoctorProcess()
+            except OSError as e:
+                logger.debug(f"Asciidoctor server unavailable, using one process per conversion: {e}")
+                self._available = False
+                return None
+            self._available = True
+            return process
+
+    def _release(self, process: _AsciidoctorProcess):
+        with self._lock:
+            self._idle.append(process)
+
+    def run(self, cmd: List[str], capture_output: bool = False,
+            discard_stdout: bool = False) -> subprocess.CompletedProcess:
+        """
+        Run an `asciidoctor ...` or `asciidoctor-pdf ...` command line, like
+        subprocess.run(cmd, check=True).
+
+        With discard_stdout, standard output is neither captured nor shown, so
+        callers that only report stderr on failure do not pay for reading it.
+
+        Raises subprocess.CalledProcessError if the conversion fails.
+        """
+        extra_args = _EXECUTABLES.get(cmd[0])
+        process = self._acquire() if extra_args is not None else None
+        if process is None:
+            return self._run_subprocess(cmd, capture_output, discard_stdout)
+
+        try:
+            reply = process.invoke(extra_args + cmd[1:])
+        except (OSError, ValueError) as e:
+            logger.warning(f"Asciidoctor server failed ({e}), retrying in a new process")
+            process.close()
+            return self._run_subprocess(cmd, capture_output, discard_stdout)
+        self._release(process)
+
+        stdout, stderr = reply.get("stdout", ""), reply.get("stderr", "")
+        if discard_stdout:
+            stdout = None
+        if not capture_output:
+            # Match subprocess.run without capturing: output goes to the console
+            if stdout:
+                sys.stdout.write(stdout)
+            sys.stderr.write(stderr)
+        if reply["code"] != 0:
+            raise subprocess.CalledProcessError(reply["code"], cmd, output=stdout, stderr=stderr)
+        return subprocess.CompletedProcess(cmd, 0, stdout=stdout, stderr=stderr)
+
+    @staticmethod
+    def _run_subprocess(cmd: List[str], capture_output: bool, discard_stdout: bool) -> subprocess.CompletedProcess:
+        pipe = subprocess.PIPE if capture_output else None
+        return subprocess.run(
+            resolve_command(cmd),
+            check=True,
+            stdout=subprocess.DEVNULL if discard_stdout else pipe,
+            stderr=pipe,
+            text=True,
+            encoding="utf-8",
+        )
+
+    def close(self):
+        """Stop all idle processes."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for process in idle:
+            process.close()
+
+
+_pool: Optional[AsciidoctorPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_asciidoctor_pool() -> AsciidoctorPool:
+    """Return the process-wide pool, creating it on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = AsciidoctorPool()
+            atexit.register(_pool.close)
+        return _pool
@@ -0,0 +1,262 @@
+"""
+Content-addressed cache of converter outputs for incremental builds.
+
+A task's inputs are the language's template sources, its version properties,
+the flavor, the format options, the code of the whole converters package
+(converters share helpers such as the Asciidoctor pool and the chapter
+splitter), the reported versions of Asciidoctor, Asciidoctor PDF and Pandoc,
+and the builder-provided PDF themes. When their hash matches an earlier
+successful build, the cached output directory is copied into place instead
+of running the toolchain again.
+
+Source trees are only re-read when one of their files changed size or
+modification time since the last run; a manifest in the cache directory
+remembers the content hash that belongs to each tree's stat signature.
+
+Entries not used for 30 days are removed at the end of a build, so
+outputs of edited sources or converters do not pile up in the cache.
+
+Other gems such as asciidoctor-confluence and the installed fonts are not
+part of the hash; disable `build.incremental` after changing them.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import shutil
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .base import BuildContext, ConverterPlugin, probe_tool
+from .pdf import BUILDER_THEMES_DIR
+
+# Records the converter's return value relative to the cached output directory
+_OUTPUT_MARKER = ".arc42-output"
+
+# Maps a source tree to [stat digest, content digest] of its last hashing
+_SOURCES_MANIFEST = "sources.json"
+
+# Cached intermediate HTML renderings live in this subdirectory
+_HTML_DIR = "html"
+
+# Cache entries unused for this long are pruned
+_MAX_AGE_DAYS = 30
+
+_PACKAGE_DIR = Path(__file__).parent
+
+# Bytes read at a time when hashing file contents
+_READ_SIZE = 1 << 20
+
+# Version probes of the external tools whose output ends up in the artifacts
+_TOOLCHAIN_PROBES = (
+    ("asciidoctor", "--version"),
+    ("asciidoctor-pdf", "--version"),
+    ("pandoc", "--version"),
+)
+
+
+def _file_digest(path) -> bytes:
+    """Hash the content of one file, reading it in chunks."""
+    digest = hashlib.blake2b()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_READ_SIZE), b""):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def _tree_digest(root: Path) -> str:
+    """Hash the relative path and content of every file below root."""
+    digest = hashlib.blake2b(digest_size=16)
+    if root.is_dir():
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames.sort()
+            for name in sorted(filenames):
+                path = os.path.join(dirpath, name)
+                digest.update(os.path.relpath(path, root).encode("utf-8") + b"\0")
+                digest.update(_file_digest(path))
+    return digest.hexdigest()
+
+
+def _package_digest(package_dir: Path) -> str:
+    """Hash the name and content of every Python module in package_dir."""
+    digest = hashlib.blake2b(digest_size=16)
+    with os.scandir(package_dir) as entries:
+        modules = sorted(entry.name for entry in entries if entry.name.endswith(".py"))
+    for name in modules:
+        digest.update(name.encode("utf-8") + b"\0")
+        digest.update(_file_digest(package_dir / name))
+    return digest.hexdigest()
+
+
+def _tree_stat_digest(root: Path) -> str:
+    """Hash the relative path, size and mtime of every file below root."""
+    digest = hashlib.blake2b(digest_size=16)
+    if root.is_dir():
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames.sort()
+            for name in sorted(filenames):
+                path = os.path.join(dirpath, name)
+                st = os.stat(path)
+                digest.update(f"{os.path.relpath(path, root)}\0{st.st_size}\0{st.st_mtime_ns}\0".encode("utf-8"))
+    return digest.hexdigest()
+
+
+class ArtifactCache:
+    """Stores and restores converter output directories keyed by input hash."""
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = cache_dir
+        self.html_dir = cache_dir / _HTML_DIR
+        self._digests: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self._manifest: Optional[Dict[str, List[str]]] = None
+
+    def source_digest(self, source_dir: Path) -> str:
+        """Return the content hash of a template source tree, computed once per run."""
+        return self._memoized(f"src:{source_dir}", lambda: self._source_digest(source_dir))
+
+    def _source_digest(self, source_dir: Path) -> str:
+        stat_digest = _tree_stat_digest(source_dir)
+        tree = str(Path(source_dir).absolute())
+        with self._lock:
+            known = self._load_manifest().get(tree)
+        if known is not None and known[0] == stat_digest:
+            return known[1]
+
+        digest = _tree_digest(source_dir)
+        with self._lock:
+            self._manifest[tree] = [stat_digest, digest]
+            self._save_manifest()
+        return digest
+
+    def _load_manifest(self) -> Dict[str, List[str]]:
+        if self._manifest is None:
+            try:
+                self._manifest = json.loads((self.cache_dir / _SOURCES_MANIFEST).read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                self._manifest = {}
+        return self._manifest
+
+    def _save_manifest(self) -> None:
+        tmp = self.cache_dir / f".{_SOURCES_MANIFEST}.{uuid.uuid4().hex}"
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(self._manifest), encoding="utf-8")
+            os.replace(tmp, self.cache_dir / _SOURCES_MANIFEST)
+        except OSError:
+            tmp.unlink(missing_ok=True)
+
+    def code_digest(self) -> str:
+        """Return the hash of the converters package, computed once per run."""
+        return self._memoized("code", lambda: _package_digest(_PACKAGE_DIR))
+
+    def toolchain_digest(self) -> str:
+        """
+        Return the hash of the external tool versions and builder PDF themes,
+        computed once per run.
+        """
+        def compute() -> str:
+            digest = hashlib.blake2b(digest_size=16)
+            digest.update(repr([probe_tool(*probe) for probe in _TOOLCHAIN_PROBES]).encode("utf-8"))
+            digest.update(_tree_digest(BUILDER_THEMES_DIR).encode("utf-8"))
+            return digest.hexdigest()
+
+        return self._memoized("toolchain", compute)
+
+    def _memoized(self, key: str, compute) -> str:
+        with self._lock:
+            value = self._digests.get(key)
+        if value is None:
+            value = compute()
+            with self._lock:
+                self._digests[key] = value
+        return value
+
+    def inputs_hash(self, context: BuildContext, converter: ConverterPlugin) -> str:
+        """Return the cache key for running converter on context."""
+        # Every format of a language reads the same sources; hash them once per run
+        sources = self.source_digest(context.source_dir)
+        # Converters are usually defined in the package, which code_digest()
+        # covers; include the module of one defined elsewhere as well
+        code_file = inspect.getfile(type(converter))
+        code = [self.code_digest()]
+        if Path(code_file).parent != _PACKAGE_DIR:
+            code.append(self._memoized(f"code:{code_file}", lambda: hashlib.blake2b(Path(code_file).read_bytes()).hexdigest()))
+
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(json.dumps([
+            converter.name,
+            context.language,
+            context.flavor,
+            sorted(context.version_props.items()),
+            context.config,
+            sources,
+            code,
+            self.toolchain_digest(),
+        ], sort_keys=True, default=str).encode("utf-8"))
+        return digest.hexdigest()
+
+    def restore(self, key: str, output_dir: Path) -> Optional[Path]:
+        """Copy a cached output into output_dir; return the output path on a hit."""
+        entry = self.cache_dir / key
+        try:
+            relative = (entry / _OUTPUT_MARKER).read_text(encoding="utf-8")
+            shutil.copytree(entry, output_dir, dirs_exist_ok=True,
+                            ignore=shutil.ignore_patterns(_OUTPUT_MARKER))
+            # Mark the entry as used so prune() keeps it
+            os.utime(entry)
+        except OSError:
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return (output_dir / relative).absolute()
+
+    def store(self, key: str, output_dir: Path, output_path: Path) -> None:
+        """Save output_dir under key; failures only cost the next cache hit."""
+        try:
+            relative = Path(output_path).absolute().relative_to(output_dir.absolute())
+        except ValueError:
+            return
+
+        entry = self.cache_dir / key
+        if entry.exists():
+            return
+        tmp = self.cache_dir / f".{key}.{uuid.uuid4().hex}"
+        try:
+            shutil.copytree(output_dir, tmp)
+            (tmp / _OUTPUT_MARKER).write_text(str(relative), encoding="utf-8")
+            os.replace(tmp, entry)
+        except OSError:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    def prune(self, max_age_days: float = _MAX_AGE_DAYS) -> int:
+        """Remove cache entries unused for max_age_days; return how many were removed."""
+        cutoff = time.time() - max_age_days * 86400
+        removed = 0
+        # The manifest and the HTML directory itself are kept; renderings are pruned one by one
+        for parent, keep in ((self.cache_dir, {_SOURCES_MANIFEST, _HTML_DIR}), (self.html_dir, set())):
+            try:
+                with os.scandir(parent) as entries:
+                    candidates = [entry for entry in entries if entry.name not in keep]
+            except OSError:
+                continue
+            for entry in candidates:
+                try:
+                    if entry.stat(follow_symlinks=False).st_mtime >= cutoff:
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        shutil.rmtree(entry.path)
+                    else:
+                        os.unlink(entry.path)
+                except OSError:
+                    continue
+                removed += 1
+        return removed
@@ -0,0 +1,62 @@
+"""
+Chapter splitting for the multi-page converters.
+
+Asciidoctor renders every arc42 chapter as a level-1 section headed by an
+h2. The multi-page Markdown converters cut the intermediate HTML at those
+headers and convert each chapter on its own, concurrently on the pipeline's
+shared chapter executor when there is one.
+"""
+
+import html
+import re
+from concurrent.futures import Executor
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+try:
+    from lxml import etree as _etree, html as _lxml_html
+except ImportError:
+    _lxml_html = None
+
+_TAG_RE = re.compile(r'<[^>]+>')
+
+_T = TypeVar('_T')
+_R = TypeVar('_R')
+
+
+def iter_chapters(content: str) -> Iterator[Tuple[str, str]]:
+    """
+    Yield (title, html) chapters of Asciidoctor HTML, one per h2 header.
+    A chapter holds the header and what follows it up to the next h2.
+    Uses lxml when installed and falls back to a substring scan.
+    """
+    if _lxml_html is not None:
+        for h2 in _lxml_html.fromstring(content).iter('h2'):
+            pieces = [_etree.tostring(h2, encoding='unicode')]
+            for sibling in h2.itersiblings():
+                if sibling.tag == 'h2':
+                    break
+                pieces.append(_etree.tostring(sibling, encoding='unicode'))
+            yield h2.text_content(), ''.join(pieces)
+        return
+
+    # Walk header offsets with str.find and slice between consecutive headers
+    start = content.find('<h2')
+    while start != -1:
+        title_start = content.find('>', start) + 1
+        title_end = content.find('</h2>', title_start)
+        if title_start == 0 or title_end == -1:
+            return
+        following = content.find('<h2', title_end)
+        end = following if following != -1 else len(content)
+        yield html.unescape(_TAG_RE.sub('', content[title_start:title_end])), content[start:end]
+        start = following
+
+
+def map_chapters(executor: Optional[Executor], convert: Callable[[_T], _R], chapters: Sequence[_T]) -> List[_R]:
+    """
+    Return convert applied to every chapter, in chapter order. Runs on executor
+    when given, so all tasks of a run together stay within its worker limit.
+    """
+    if executor is None or len(chapters) < 2:
+        return [convert(chapter) for chapter in chapters]
+    return list(executor.map(convert, chapters))
@@ -0,0 +1,166 @@
+"""
+Intermediate HTML shared by the pandoc-based converters.
+
+DOCX, Markdown (single and multi-page), GitHub Markdown, RST and Textile all
+start by rendering the same AsciiDoc source to HTML. The HTML only refers to
+images via the relative `images/` directory, so one rendering per
+(source, flavor, attributes) can be fed to every pandoc run, whatever its
+output directory.
+
+The build pipeline owns an IntermediateHtmlBuilder for the duration of a run
+and hands it to converters through BuildContext.html_builder; its temporary
+files are removed when the builder is closed. Converters used on their own
+fall back to a process-wide builder that is closed at exit.
+
+For incremental builds the builder is given an ArtifactCache, and renderings
+are also kept in a cache directory under the content hash of the language's
+template sources, the converters package and the tool versions. A converter whose own output cache missed (for example
+because its options changed) then still skips Asciidoctor.
+"""
+
+import atexit
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import uuid
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from ._asciidoctor_pool import get_asciidoctor_pool
+from ._cache import ArtifactCache
+
+logger = logging.getLogger(__name__)
+
+# Extra attribute for the GitHub converters. `sectids`, which some converters
+# used to pass, is on by default and needs no variant of its own.
+TOC_LEFT = ("toc=left",)
+
+_Key = Tuple[str, str, int, Tuple[str, ...]]
+
+
+class IntermediateHtmlBuilder:
+    """Renders each (source, flavor, attributes) combination to HTML once."""
+
+    def __init__(self, artifact_cache: Optional[ArtifactCache] = None):
+        self._html_files: Dict[_Key, Path] = {}
+        self._key_locks: Dict[_Key, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._tmp_dir: Optional[Path] = None
+        self._artifact_cache = artifact_cache
+        self.hits = 0
+        self.misses = 0
+
+    def __enter__(self) -> "IntermediateHtmlBuilder":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        """Remove all rendered files."""
+        with self._lock:
+            tmp_dir, self._tmp_dir = self._tmp_dir, None
+            self._html_files.clear()
+            self._key_locks.clear()
+        if tmp_dir is not None:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    def _temp_dir(self) -> Path:
+        with self._lock:
+            if self._tmp_dir is None:
+                self._tmp_dir = Path(tempfile.mkdtemp(prefix="arc42-html-"))
+            return self._tmp_dir
+
+    def build(self, source_adoc: Path, flavor: str, attributes: Tuple[str, ...] = ()) -> Path:
+        """
+        Return an HTML rendering of source_adoc for flavor, running Asciidoctor
+        only the first time a (source, mtime, flavor, attributes) combination is
+        requested. Concurrent callers for the same key wait for one rendering.
+        """
+        source_adoc = source_adoc.absolute()
+        key = (str(source_adoc), flavor, source_adoc.stat().st_mtime_ns, attributes)
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            html_file = self._html_files.get(key)
+            if html_file is None:
+                html_file = self._cached_or_render(source_adoc, flavor, attributes)
+                self._html_files[key] = html_file
+            else:
+                logger.debug(f"Reusing intermediate HTML {html_file} for {source_adoc} ({flavor})")
+        return html_file
+
+    def _cached_or_render(self, source_adoc: Path, flavor: str, attributes: Tuple[str, ...]) -> Path:
+        cache = self._artifact_cache
+        if cache is None:
+            return self._render(source_adoc, flavor, attributes)
+
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(repr((cache.source_digest(source_adoc.parent), cache.code_digest(),
+                            cache.toolchain_digest(), source_adoc.name, flavor, attributes)).encode("utf-8"))
+        cached = cache.html_dir / f"{digest.hexdigest()}.html"
+        if cached.is_file():
+            logger.debug(f"Up to date, reused cached intermediate HTML: {cached}")
+            try:
+                # Mark the rendering as used so ArtifactCache.prune() keeps it
+                os.utime(cached)
+            except OSError:
+                pass
+            with self._lock:
+                self.hits += 1
+            return cached
+
+        with self._lock:
+            self.misses += 1
+        html_file = self._render(source_adoc, flavor, attributes)
+        tmp = cached.with_name(f".{cached.name}.{uuid.uuid4().hex}")
+        try:
+            cached.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(html_file, tmp)
+            os.replace(tmp, cached)
+        except OSError:
+            # Only costs the next cache hit
+            tmp.unlink(missing_ok=True)
+        return html_file
+
+    def _render(self, source_adoc: Path, flavor: str, attributes: Tuple[str, ...]) -> Path:
+        name = hashlib.blake2b(repr((str(source_adoc), flavor, attributes)).encode("utf-8"), digest_size=8).hexdigest()
+        html_file = self._temp_dir() / f"{name}.html"
+
+        asciidoctor_cmd = [
+            "asciidoctor",
+            "-b", "html5",
+            "-a", f"flavor={flavor}",
+            # Use relative path to images directory
+            "-a", "imagesdir=images",
+        ]
+        for attribute in attributes:
+            asciidoctor_cmd.extend(["-a", attribute])
+        asciidoctor_cmd.extend([str(source_adoc), "-o", str(html_file)])
+        if flavor == "withHelp":
+            asciidoctor_cmd.append("-a show-help")
+
+        logger.debug(f"Executing Asciidoctor for intermediate HTML: {' '.join(asciidoctor_cmd)}")
+        get_asciidoctor_pool().run(asciidoctor_cmd)
+        return html_file
+
+
+_default_builder: Optional[IntermediateHtmlBuilder] = None
+_default_lock = threading.Lock()
+
+
+def intermediate_html(context, attributes: Tuple[str, ...] = ()) -> Path:
+    """Return the shared HTML rendering of the template described by context."""
+    builder = context.html_builder
+    if builder is None:
+        global _default_builder
+        with _default_lock:
+            if _default_builder is None:
+                _default_builder = IntermediateHtmlBuilder()
+                atexit.register(_default_builder.close)
+            builder = _default_builder
+    return builder.build(context.source_dir / "arc42-template.adoc", context.flavor, attributes)
@@ -0,0 +1,183 @@
+"""
+Long-lived pandoc server shared by the text-output converters.
+
+Every pandoc run pays for starting the Haskell runtime, and the multi-page
+converters run pandoc once per chapter. Pandoc 3 can instead serve
+conversions over HTTP (`pandoc server`); one such process handles
+concurrent requests from all build threads.
+
+The server never touches the file system, so only command lines that read
+one input file and write text output are sent to it; media is never
+embedded for those formats, so `--resource-path` can be dropped. Anything
+else, such as DOCX, as well as installations without server support, falls
+back to a plain `subprocess.run`.
+"""
+
+import atexit
+import json
+import logging
+import socket
+import subprocess
+import threading
+import time
+import urllib.request
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .base import resolve_command
+
+logger = logging.getLogger(__name__)
+
+# Output formats pandoc produces as binary documents
+_BINARY_FORMATS = frozenset({"docx", "odt", "epub", "epub2", "epub3", "pptx", "pdf"})
+
+_STARTUP_TIMEOUT = 10.0
+_REQUEST_TIMEOUT = 300.0
+
+
+def _server_request(cmd: List[str]) -> Optional[Tuple[Dict[str, str], str, str]]:
+    """
+    Translate a pandoc command line into (options, input file, output file),
+    or return None if it uses anything the server cannot do.
+    """
+    options: Dict[str, str] = {}
+    input_file = output_file = None
+    args = iter(cmd[1:])
+    try:
+        for arg in args:
+            if arg in ("-f", "--from"):
+                options["from"] = next(args)
+            elif arg in ("-t", "--to"):
+                options["to"] = next(args)
+            elif arg in ("-o", "--output"):
+                output_file = next(args)
+            elif arg == "--resource-path":
+                # Only used to embed media, which text formats never do
+                next(args)
+            elif arg.startswith("--wrap="):
+                options["wrap"] = arg.partition("=")[2]
+            elif arg == "--atx-headers":
+                options["markdown-headings"] = "atx"
+            elif arg.startswith("-") or input_file is not None:
+                return None
+            else:
+                input_file = arg
+    except StopIteration:
+        return None
+
+    if input_file is None or output_file is None or options.get("to", "docx") in _BINARY_FORMATS:
+        return None
+    return options, input_file, output_file
+
+
+class PandocServer:
+    """Starts `pandoc server` on first use and sends conversions to it."""
+
+    def __init__(self):
+        self._proc: Optional[subprocess.Popen] = None
+        self._url: Optional[str] = None
+        self._lock = threading.Lock()
+        self._available: Optional[bool] = None
+
+    def _ensure_started(self) -> Optional[str]:
+        with self._lock:
+            if self._available is False:
+                return None
+            if self._proc is not None and self._proc.poll() is None:
+                return self._url
+            try:
+                self._url = self._start()
+            except OSError as e:
+                logger.debug(f"pandoc server unavailable, using one process per conversion: {e}")
+                self._available = False
+                return None
+            self._available = True
+            return self._url
+
+    def _start(self) -> str:
+        # Let the OS pick a free port; pandoc server cannot report one itself
+        with socket.socket() as probe:
+            probe.bind(("127.0.0.1", 0))
+            port = probe.getsockname()[1]
+
+        proc = subprocess.Popen(
+            resolve_command(["pandoc", "server", "--port", str(port)]),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        deadline = time.monotonic() + _STARTUP_TIMEOUT
+        while True:
+            if proc.poll() is not None:
+                raise OSError("pandoc server exited during startup")
+            try:
+                socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+                break
+            except OSError:
+                if time.monotonic() > deadline:
+                    proc.kill()
+                    raise OSError("pandoc server did not start")
+                time.sleep(0.05)
+
+        self._proc = proc
+        return f"http://127.0.0.1:{port}/"
+
+    def run(self, cmd: List[str]) -> subprocess.CompletedProcess:
+        """
+        Run a `pandoc ...` command line, like subprocess.run(cmd, check=True).
+
+        Raises subprocess.CalledProcessError if the conversion fails.
+        """
+        request = _server_request(cmd)
+        url = self._ensure_started() if request is not None else None
+        if url is None:
+            return subprocess.run(resolve_command(cmd), check=True)
+
+        options, input_file, output_file = request
+        body = dict(options, text=Path(input_file).read_text(encoding="utf-8"))
+        http_request = urllib.request.Request(
+            url,
+            data=json.dumps(body).encode("utf-8"),
+            headers={"Content-Type": "application/json", "Accept": "application/json"},
+        )
+        try:
+            with urllib.request.urlopen(http_request, timeout=_REQUEST_TIMEOUT) as response:
+                reply = json.loads(response.read())
+            output = reply["output"]
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            # Let the command line report real conversion errors
+            logger.warning(f"pandoc server failed ({e}), retrying in a new process")
+            return subprocess.run(resolve_command(cmd), check=True)
+
+        for message in reply.get("messages", []):
+            logger.debug(f"pandoc: {message}")
+
+        # The command line ends text output with a newline, the server does not
+        if not output.endswith("\n"):
+            output += "\n"
+        Path(output_file).write_text(output, encoding="utf-8")
+        return subprocess.CompletedProcess(cmd, 0)
+
+    def close(self):
+        """Stop the server process."""
+        with self._lock:
+            proc, self._proc = self._proc, None
+        if proc is not None:
+            proc.terminate()
+            try:
+                proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+
+
+_server: Optional[PandocServer] = None
+_server_lock = threading.Lock()
+
+
+def get_pandoc_server() -> PandocServer:
+    """Return the process-wide server, creating it on first use."""
+    global _server
+    with _server_lock:
+        if _server is None:
+            _server = PandocServer()
+            atexit.register(_server.close)
+        return _server
@@ -1,17 +1,38 @@
+import io
+import os
 import subprocess
 from pathlib import Path
 import logging
 import re
+from typing import Dict, List, Optional, TextIO, Tuple
 from .base import ConverterPlugin, BuildContext
 
 logger = logging.getLogger(__name__)
 
+# Bundled templates are a few MB; write them in large chunks
+_WRITE_BUFFER_SIZE = 1 << 20
+
 class AsciidocConverter(ConverterPlugin):
     """
     A 'pass-through' converter that produces a single, self-contained AsciiDoc file
     with all includes processed. This is useful for consumers who want a single
     file without having to handle the include structure themselves.
     """
+    # One pass per line covers include, ifdef/ifndef and endif directives
+    _DIRECTIVE_RE = re.compile(
+        r'^\s*(?:include::(?P<include>[^\[]+)\[(?P<attrs>.*)\]'
+        r'|(?P<cond>ifdef|ifndef)::(?P<attr>[^\[]+)\[\]'
+        r'|endif::(?P<endif>[^\[]*)\[\])\s*$'
+    )
+
+    # The only attribute whose value the bundler knows; it follows the flavor
+    _HELP_ATTR = "show-help"
+
+    # Processed file contents keyed by (path, base_dir, flavor, depth). Each
+    # entry records the mtime of every file it was built from (None for a
+    # missing include) so that an edit anywhere in the include tree misses.
+    _cache: Dict[Tuple[str, str, str, int], Tuple[str, List[Tuple[str, Optional[int]]]]] = {}
+
     def __init__(self):
         super().__init__("asciidoc", priority=1)
 
@@ -26,15 +47,14 @@ class AsciidocConverter(ConverterPlugin):
         logger.debug(f"Processing AsciiDoc includes from {main_adoc_file}")
 
         try:
-            # Process the main file and all includes
-            content = self._process_includes(
-                main_adoc_file,
-                context.source_dir,
-                context.flavor
-            )
-
-            # Write the bundled content
-            output_file.write_text(content, encoding='utf-8')
+            # Process the main file and all includes straight into the output file
+            with output_file.open('w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as out:
+                self._process_includes_into(
+                    out,
+                    main_adoc_file,
+                    context.source_dir,
+                    context.flavor
+                )
 
             logger.info(f"Successfully created bundled AsciiDoc file: {output_file}")
             return output_file
@@ -56,82 +76,123 @@ class AsciidocConverter(ConverterPlugin):
         Returns:
             The processed content as a string
         """
+        out = io.StringIO()
+        self._process_includes_into(out, adoc_file, base_dir, flavor, depth)
+        return out.getvalue()
+
+    def _process_includes_into(self, out: TextIO, adoc_file: Path, base_dir: Path,
+                               flavor: str, depth: int = 0,
+                               deps: Optional[List[Tuple[str, Optional[int]]]] = None) -> None:
+        """
+        Write the processed content of adoc_file and its includes into out.
+
+        Lines are streamed from the file and included files are written into
+        the same buffer. The files the result depends on are appended to deps.
+        """
+        if deps is None:
+            deps = []
+
         if depth > 10:
             logger.warning(f"Maximum include depth reached at {adoc_file}")
-            return f"// ERROR: Maximum include depth exceeded for {adoc_file}\n"
+            out.write(f"// ERROR: Maximum include depth exceeded for {adoc_file}\n")
+            return
 
-        if not adoc_file.exists():
+        path = str(adoc_file)
+        mtime_ns = _mtime_ns(path)
+        if mtime_ns is None:
             logger.warning(f"Include file not found: {adoc_file}")
-            return f"// WARNING: File not found: {adoc_file}\n"
+            out.write(f"// WARNING: File not found: {adoc_file}\n")
+            deps.append((path, None))
+            return
+
+        key = (path, str(base_dir), flavor, depth)
+        cached = self._cache.get(key)
+        if cached is not None and all(_mtime_ns(p) == m for p, m in cached[1]):
+            out.write(cached[0])
+            deps.extend(cached[1])
+            return
 
         logger.debug(f"Processing file: {adoc_file} (depth={depth})")
 
-        content = adoc_file.read_text(encoding='utf-8')
-        lines = content.splitlines(keepends=True)
-        result = []
+        # Process into a buffer of our own so the result can be cached
+        file_out = io.StringIO()
+        file_deps = [(path, mtime_ns)]
 
-        # Track if we're inside a conditional block
-        in_conditional = False
-        conditional_matches = True
+        # Stack of open conditionals: True/False once evaluated here, None for
+        # attributes we cannot resolve and leave to Asciidoctor
         conditional_stack = []
+        active = True
+
+        with adoc_file.open('r', encoding='utf-8') as lines:
+            for line in lines:
+                # Fast path: every directive contains '::', most content lines don't
+                if '::' not in line:
+                    if active:
+                        file_out.write(line)
+                    continue
+
+                match = self._DIRECTIVE_RE.match(line)
+                if not match:
+                    if active:
+                        file_out.write(line)
+                    continue
+
+                # Handle include directives; includes in dropped branches are never read
+                include_path = match.group('include')
+                if include_path is not None:
+                    if not active:
+                        continue
+                    include_attrs = match.group('attrs')
+
+                    # Resolve include path relative to current file's directory
+                    if adoc_file.parent != base_dir:
+                        include_file = adoc_file.parent / include_path
+                    else:
+                        include_file = base_dir / include_path
+
+                    # Add a comment showing the original include
+                    file_out.write(f"// BEGIN INCLUDE: {include_path}\n")
+
+                    # Recursively process the included file into the same buffer
+                    self._process_includes_into(file_out, include_file, base_dir, flavor, depth + 1, file_deps)
+
+                    file_out.write(f"// END INCLUDE: {include_path}\n")
+                    continue
+
+                # Handle conditional directives for flavor filtering
+                # ifdef::show-help[] or ifndef::show-help[]
+                directive = match.group('cond')
+                if directive:
+                    if match.group('attr') == self._HELP_ATTR:
+                        defined = flavor == "withHelp"
+                        matches = defined if directive == 'ifdef' else not defined
+                    else:
+                        matches = None
+                    # Only unresolved conditionals are kept in the output
+                    emit = active and matches is None
+                    conditional_stack.append(matches)
+                    active = active and matches is not False
+                else:
+                    # endif::[]
+                    matches = conditional_stack.pop() if conditional_stack else None
+                    active = all(m is not False for m in conditional_stack)
+                    emit = active and matches is None
 
-        for line in lines:
-            # Handle include directives
-            include_match = re.match(r'^\s*include::([^\[]+)\[(.*)\]\s*$', line)
-            if include_match:
-                include_path = include_match.group(1)
-                include_attrs = include_match.group(2)
+                if emit:
+                    file_out.write(line)
 
-                # Resolve include path relative to current file's directory
-                if adoc_file.parent != base_dir:
-                    include_file = adoc_file.parent / include_path
-                else:
-                    include_file = base_dir / include_path
-
-                # Add a comment showing the original include
-                result.append(f"// BEGIN INCLUDE: {include_path}\n")
-
-                # Recursively process the included file
-                included_content = self._process_includes(include_file, base_dir, flavor, depth + 1)
-                result.append(included_content)
-
-                result.append(f"// END INCLUDE: {include_path}\n")
-                continue
-
-            # Handle conditional directives for flavor filtering
-            # ifdef::show-help[] or ifndef::show-help[]
-            ifdef_match = re.match(r'^\s*ifdef::([^\[]+)\[\]\s*$', line)
-            ifndef_match = re.match(r'^\s*ifndef::([^\[]+)\[\]\s*$', line)
-            endif_match = re.match(r'^\s*endif::\[\]\s*$', line)
-
-            if ifdef_match:
-                attr = ifdef_match.group(1)
-                # Check if this attribute should be defined based on flavor
-                matches = (flavor == "withHelp" and attr == "show-help")
-                conditional_stack.append((True, matches))
-                # Keep the conditional in output for clarity
-                result.append(line)
-                continue
-
-            if ifndef_match:
-                attr = ifndef_match.group(1)
-                # Check if this attribute should NOT be defined
-                matches = not (flavor == "withHelp" and attr == "show-help")
-                conditional_stack.append((False, matches))
-                # Keep the conditional in output
-                result.append(line)
-                continue
-
-            if endif_match:
-                if conditional_stack:
-                    conditional_stack.pop()
-                result.append(line)
-                continue
-
-            # Add the line to result
-            result.append(line)
-
-        return ''.join(result)
+        content = file_out.getvalue()
+        self._cache[key] = (content, file_deps)
+        out.write(content)
+        deps.extend(file_deps)
 
     def get_output_extension(self) -> str:
         return ".adoc"
+
+
+def _mtime_ns(path: str) -> Optional[int]:
+    """Return the file's modification time in nanoseconds, or None if it is missing."""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
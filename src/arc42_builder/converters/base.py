@@ -1,16 +1,95 @@
+import os
+import shutil
+import subprocess
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 
-@dataclass
+@dataclass(slots=True)
 class BuildContext:
+    """
+    Context object passed to format converters.
+    Contains all information needed to perform a conversion.
+    """
     language: str
     flavor: str
     source_dir: Path
     output_dir: Path
     version_props: Dict[str, str]
     config: Dict[str, Any]
+    template_path: Optional[Path] = None
+    # IntermediateHtmlBuilder shared by the tasks of a pipeline run
+    html_builder: Optional[Any] = None
+    # Executor for per-chapter conversions, shared by the tasks of a parallel
+    # pipeline run and sized by build.max_workers; None converts serially
+    chapter_executor: Optional[Executor] = None
+
+    def get_version_attr(self, key: str, default: str = "") -> str:
+        """Get a version property with default."""
+        return self.version_props.get(key, default)
+
+    def get_format_option(self, key: str, default: Any = None) -> Any:
+        """Get a format-specific option."""
+        return self.config.get(key, default)
+
+@lru_cache(maxsize=None)
+def probe_tool(*cmd: str) -> Optional[str]:
+    """
+    Run a dependency probe such as `pandoc --version` once per process.
+    Returns the command's stdout, or None if the tool is missing or failed.
+    """
+    # A tool that is not on PATH needs no process to find out
+    if shutil.which(cmd[0]) is None:
+        return None
+    try:
+        return subprocess.run(list(cmd), capture_output=True, check=True, text=True).stdout
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return None
+
+@lru_cache(maxsize=None)
+def _which(name: str, path: Optional[str]) -> Optional[str]:
+    return shutil.which(name, path=path)
+
+def resolve_command(cmd: List[str]) -> List[str]:
+    """
+    Return cmd with its executable replaced by the full path found on PATH,
+    so repeated runs skip the PATH search. Looked up once per PATH value;
+    cmd is returned unchanged if the executable is not found.
+    """
+    executable = _which(cmd[0], os.environ.get("PATH"))
+    return [executable, *cmd[1:]] if executable else cmd
+
+def _link_or_copy(src: str, dst: str) -> None:
+    try:
+        os.link(src, dst)
+    except OSError:
+        # Different filesystem or no hardlink support
+        shutil.copy2(src, dst)
+
+def _inodes(root: Path) -> Dict[str, tuple]:
+    """Map every file below root to its (device, inode)."""
+    inodes = {}
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            path = os.path.join(dirpath, name)
+            st = os.stat(path)
+            inodes[os.path.relpath(path, root)] = (st.st_dev, st.st_ino)
+    return inodes
+
+def link_images(source_images_dir: Path, output_images_dir: Path) -> None:
+    """
+    Replace output_images_dir with the contents of source_images_dir.
+    Files are hardlinked where possible, so no image bytes are copied.
+    Nothing is done if output_images_dir already links exactly these files.
+    """
+    if output_images_dir.exists():
+        if _inodes(output_images_dir) == _inodes(source_images_dir):
+            return
+        shutil.rmtree(output_images_dir)
+    shutil.copytree(source_images_dir, output_images_dir, copy_function=_link_or_copy)
 
 class ConverterPlugin(ABC):
     """Abstract base for all format converters"""
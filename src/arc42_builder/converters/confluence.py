@@ -1,8 +1,8 @@
 import subprocess
 from pathlib import Path
 import logging
-import shutil
-from .base import ConverterPlugin, BuildContext
+from .base import ConverterPlugin, BuildContext, link_images, probe_tool
+from ._asciidoctor_pool import get_asciidoctor_pool
 
 logger = logging.getLogger(__name__)
 
@@ -13,23 +13,16 @@ class ConfluenceConverter(ConverterPlugin):
         super().__init__("confluence", priority=2)
 
     def check_dependencies(self) -> bool:
-        try:
-            # Check for asciidoctor-confluence gem
-            result = subprocess.run(
-                ["gem", "list", "asciidoctor-confluence"],
-                capture_output=True,
-                check=True,
-                text=True
-            )
-            if "asciidoctor-confluence" not in result.stdout:
-                logger.error("asciidoctor-confluence gem not found. Install with: gem install asciidoctor-confluence")
-                return False
+        # Check for asciidoctor-confluence gem
+        gems = probe_tool("gem", "list", "asciidoctor-confluence")
+        if gems is not None and "asciidoctor-confluence" not in gems:
+            logger.error("asciidoctor-confluence gem not found. Install with: gem install asciidoctor-confluence")
+            return False
 
-            subprocess.run(["asciidoctor", "--version"], capture_output=True, check=True)
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        if gems is None or probe_tool("asciidoctor", "--version") is None:
             logger.error("Confluence conversion requires Asciidoctor and asciidoctor-confluence gem.")
             return False
+        return True
 
     def convert(self, context: BuildContext) -> Path:
         """Convert to Confluence XHTML format"""
@@ -41,10 +34,8 @@ class ConfluenceConverter(ConverterPlugin):
         output_images_dir = context.output_dir / "images"
 
         if source_images_dir.exists():
-            if output_images_dir.exists():
-                shutil.rmtree(output_images_dir)
-            shutil.copytree(source_images_dir, output_images_dir)
-            logger.debug(f"Copied images from {source_images_dir} to {output_images_dir}")
+            link_images(source_images_dir, output_images_dir)
+            logger.debug(f"Linked images from {source_images_dir} to {output_images_dir}")
 
         # Build asciidoctor command with Confluence backend
         cmd = [
@@ -66,14 +57,12 @@ class ConfluenceConverter(ConverterPlugin):
         logger.debug(f"Executing command: {' '.join(cmd)}")
 
         try:
-            result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+            get_asciidoctor_pool().run(cmd, capture_output=True, discard_stdout=True)
             logger.info(f"Successfully created Confluence XHTML file: {output_file}")
             return output_file
         except subprocess.CalledProcessError as e:
             logger.error(f"Confluence conversion failed for {context.language}-{context.flavor}")
             logger.error(f"Command: {' '.join(cmd)}")
-            if e.stdout:
-                logger.error(f"STDOUT: {e.stdout}")
             if e.stderr:
                 logger.error(f"STDERR: {e.stderr}")
             raise
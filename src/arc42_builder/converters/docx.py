@@ -1,8 +1,8 @@
-import subprocess
 from pathlib import Path
 import logging
-import shutil
-from .base import ConverterPlugin, BuildContext
+from .base import ConverterPlugin, BuildContext, link_images, probe_tool
+from ._intermediate_cache import intermediate_html
+from ._pandoc_server import get_pandoc_server
 
 logger = logging.getLogger(__name__)
 
@@ -11,48 +11,30 @@ class DocxConverter(ConverterPlugin):
         super().__init__("docx", priority=1)
 
     def check_dependencies(self) -> bool:
-        try:
-            result = subprocess.run(["pandoc", "--version"], capture_output=True, check=True, text=True)
-            logger.info(f"Found Pandoc: {result.stdout.splitlines()[0]}")
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        version = probe_tool("pandoc", "--version")
+        if version is None:
             logger.error("Pandoc not found. Please ensure it is installed.")
             return False
+        first_line = version.partition("\n")[0]
+        logger.info(f"Found Pandoc: {first_line}")
+        return True
 
     def convert(self, context: BuildContext) -> Path:
         output_file = (context.output_dir / f"arc42-template-{context.language}-{context.flavor}.docx").absolute()
-        main_adoc_file = context.source_dir / "arc42-template.adoc"
 
-        # Pandoc works best converting from a single file. We first let Asciidoctor
-        # create a single intermediate HTML file, then convert that to DOCX.
-
-        # Create a temporary HTML file
-        temp_html_file = (context.output_dir / f"temp-{context.language}-{context.flavor}.html").absolute()
+        # Pandoc works best converting from a single file. Asciidoctor renders
+        # one intermediate HTML file, shared with the other pandoc-based formats,
+        # which is then converted to DOCX.
 
         # Copy images directory to output directory for relative referencing
         source_images_dir = context.source_dir / "images"
         output_images_dir = context.output_dir / "images"
 
         if source_images_dir.exists():
-            if output_images_dir.exists():
-                shutil.rmtree(output_images_dir)
-            shutil.copytree(source_images_dir, output_images_dir)
-            logger.debug(f"Copied images from {source_images_dir} to {output_images_dir}")
-
-        asciidoctor_cmd = [
-            "asciidoctor",
-            "-b", "html5",
-            "-a", f"flavor={context.flavor}",
-            # Use relative path to images directory
-            "-a", "imagesdir=images",
-            str(main_adoc_file),
-            "-o", str(temp_html_file)
-        ]
-        if context.flavor == "withHelp":
-            asciidoctor_cmd.append("-a show-help")
+            link_images(source_images_dir, output_images_dir)
+            logger.debug(f"Linked images from {source_images_dir} to {output_images_dir}")
 
-        logger.debug(f"Executing Asciidoctor for intermediate HTML: {' '.join(asciidoctor_cmd)}")
-        subprocess.run(asciidoctor_cmd, check=True)
+        temp_html_file = intermediate_html(context)
 
         # Convert the intermediate HTML to DOCX using Pandoc
         # Use --resource-path to tell Pandoc where to find images
@@ -66,10 +48,7 @@ class DocxConverter(ConverterPlugin):
         ]
 
         logger.debug(f"Executing Pandoc for DOCX conversion: {' '.join(pandoc_cmd)}")
-        subprocess.run(pandoc_cmd, check=True)
-
-        # Clean up the temporary HTML file
-        temp_html_file.unlink()
+        get_pandoc_server().run(pandoc_cmd)
 
         logger.info(f"Successfully created DOCX file: {output_file}")
         return output_file
@@ -1,12 +1,68 @@
-import subprocess
 from pathlib import Path
 import logging
+import os
 import re
-import shutil
-from .base import ConverterPlugin, BuildContext
+from functools import partial
+from typing import Callable, Dict
+from .base import ConverterPlugin, BuildContext, link_images, probe_tool
+from ._intermediate_cache import TOC_LEFT, intermediate_html
+from ._pandoc_server import get_pandoc_server
 
 logger = logging.getLogger(__name__)
 
+# Admonition patterns converted to GitHub's alert syntax
+_ADMONITION_MAP = {
+    'Note': '> [!NOTE]',
+    'Warning': '> [!WARNING]',
+    'Important': '> [!IMPORTANT]',
+}
+# Pre-built for ASCII, where GitHub's anchor rules reduce to a character map:
+# whitespace becomes '-', characters other than word characters and '-' go
+_SLUG_TABLE = str.maketrans({
+    c: '-' if c.isspace() else None
+    for c in map(chr, range(128))
+    if not (c.isalnum() or c in '_-')
+})
+# The general rules, needed for anchors with non-ASCII characters
+_ANCHOR_STRIP = re.compile(r'[^\w\s-]')
+_ANCHOR_DASH = re.compile(r'[-\s]+')
+
+
+def _slugify(anchor: str) -> str:
+    """Turn an anchor into the form GitHub generates from headers"""
+    # Lowercase, map spaces to hyphens and drop special characters in one C-level pass
+    slug = anchor.lower().translate(_SLUG_TABLE)
+    if not slug.isascii():
+        slug = _ANCHOR_STRIP.sub('', slug)
+        return _ANCHOR_DASH.sub('-', slug)
+    # Collapse runs of hyphens
+    while '--' in slug:
+        slug = slug.replace('--', '-')
+    return slug
+
+
+def _compile_github_rewrite(admonitions: Dict[str, str]) -> Callable[[str], str]:
+    """
+    Build a function applying all GitHub rewrites to Markdown in one regex pass:
+    internal anchor links are slugified and the given admonitions become alerts.
+    """
+    pattern = re.compile(
+        r'\(#(?P<anchor>[^)]+)\)'
+        r'|^\*\*(?P<admonition>' + '|'.join(map(re.escape, admonitions)) + r'):\*\*',
+        re.MULTILINE
+    )
+
+    def replace(match) -> str:
+        anchor = match.group('anchor')
+        if anchor is None:
+            return admonitions[match.group('admonition')]
+        return f'(#{_slugify(anchor)})'
+
+    return partial(pattern.sub, replace)
+
+
+_rewrite_for_github = _compile_github_rewrite(_ADMONITION_MAP)
+
 class GithubMarkdownConverter(ConverterPlugin):
     """GitHub Flavored Markdown converter with GitHub-specific optimizations"""
 
@@ -14,49 +70,26 @@ class GithubMarkdownConverter(ConverterPlugin):
         super().__init__("github_markdown", priority=2)
 
     def check_dependencies(self) -> bool:
-        try:
-            subprocess.run(["asciidoctor", "--version"], capture_output=True, check=True)
-            subprocess.run(["pandoc", "--version"], capture_output=True, check=True)
+        if probe_tool("asciidoctor", "--version") is not None and probe_tool("pandoc", "--version") is not None:
             return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            logger.error("GitHub Markdown conversion requires both Asciidoctor and Pandoc.")
-            return False
+        logger.error("GitHub Markdown conversion requires both Asciidoctor and Pandoc.")
+        return False
 
     def convert(self, context: BuildContext) -> Path:
         """Convert to single-file GitHub Flavored Markdown"""
         output_file = (context.output_dir / f"arc42-template-{context.language}-{context.flavor}.md").absolute()
-        main_adoc_file = context.source_dir / "arc42-template.adoc"
 
         # Copy images directory to output directory for relative referencing
         source_images_dir = context.source_dir / "images"
         output_images_dir = context.output_dir / "images"
 
         if source_images_dir.exists():
-            if output_images_dir.exists():
-                shutil.rmtree(output_images_dir)
-            shutil.copytree(source_images_dir, output_images_dir)
-            logger.debug(f"Copied images from {source_images_dir} to {output_images_dir}")
-
-        # Create a temporary HTML file via Asciidoctor
-        temp_html_file = (context.output_dir / f"temp-{context.language}-{context.flavor}.html").absolute()
-
-        asciidoctor_cmd = [
-            "asciidoctor",
-            "-b", "html5",
-            "-a", f"flavor={context.flavor}",
-            # Use relative path to images directory
-            "-a", "imagesdir=images",
-            "-a", "sectids",  # Generate section IDs for better anchors
-            "-a", "toc=left",  # Table of contents
-            str(main_adoc_file),
-            "-o", str(temp_html_file)
-        ]
-
-        if context.flavor == "withHelp":
-            asciidoctor_cmd.append("-a show-help")
+            link_images(source_images_dir, output_images_dir)
+            logger.debug(f"Linked images from {source_images_dir} to {output_images_dir}")
 
-        logger.debug(f"Executing Asciidoctor for intermediate HTML: {' '.join(asciidoctor_cmd)}")
-        subprocess.run(asciidoctor_cmd, check=True)
+        # Intermediate HTML via Asciidoctor with a table of contents, shared
+        # with the multi-page GitHub converter
+        temp_html_file = intermediate_html(context, TOC_LEFT)
 
         # Convert the intermediate HTML to GitHub Flavored Markdown using Pandoc
         # Use --resource-path to tell Pandoc where to find images
@@ -72,63 +105,29 @@ class GithubMarkdownConverter(ConverterPlugin):
         ]
 
         logger.debug(f"Executing Pandoc for GitHub Markdown conversion: {' '.join(pandoc_cmd)}")
-        subprocess.run(pandoc_cmd, check=True)
+        get_pandoc_server().run(pandoc_cmd)
 
         # Post-process for GitHub-specific optimizations
         if context.config.get("optimize_for_github", True):
             self._optimize_for_github(output_file)
 
-        # Clean up the temporary HTML file
-        temp_html_file.unlink()
-
         logger.info(f"Successfully created GitHub Markdown file: {output_file}")
         return output_file
 
     def _optimize_for_github(self, md_file: Path):
         """Apply GitHub-specific optimizations to the Markdown file"""
-        with open(md_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # Fix anchor links to work with GitHub's auto-generated anchors
-        # GitHub auto-generates anchors from headers in lowercase with hyphens
-        def fix_anchor(match):
-            anchor = match.group(1)
-            # Convert to lowercase and replace spaces with hyphens
-            github_anchor = anchor.lower().replace(' ', '-')
-            # Remove special characters that GitHub strips
-            github_anchor = re.sub(r'[^\w\s-]', '', github_anchor)
-            github_anchor = re.sub(r'[-\s]+', '-', github_anchor)
-            return f'(#{github_anchor})'
-
-        # Fix internal anchor references
-        content = re.sub(r'\(#([^)]+)\)', fix_anchor, content)
+        content = md_file.read_text(encoding='utf-8')
+
+        # Fix internal anchor references and convert admonitions to GitHub alerts
+        content = _rewrite_for_github(content)
 
         # Ensure code blocks have language hints when possible
         # (Pandoc usually handles this, but we can add fallbacks)
 
-        # Add alert/admonition support using GitHub's alert syntax
-        # Convert common admonition patterns to GitHub alerts
-        content = re.sub(
-            r'^\*\*Note:\*\*',
-            '> [!NOTE]',
-            content,
-            flags=re.MULTILINE
-        )
-        content = re.sub(
-            r'^\*\*Warning:\*\*',
-            '> [!WARNING]',
-            content,
-            flags=re.MULTILINE
-        )
-        content = re.sub(
-            r'^\*\*Important:\*\*',
-            '> [!IMPORTANT]',
-            content,
-            flags=re.MULTILINE
-        )
-
-        with open(md_file, 'w', encoding='utf-8') as f:
-            f.write(content)
+        # Replace the file atomically so an interrupted build cannot truncate it
+        tmp_file = md_file.with_name(md_file.name + '.tmp')
+        tmp_file.write_text(content, encoding='utf-8')
+        os.replace(tmp_file, md_file)
 
         logger.debug(f"Applied GitHub-specific optimizations to {md_file}")
 
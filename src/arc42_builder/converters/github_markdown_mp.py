@@ -1,12 +1,34 @@
-import subprocess
 from pathlib import Path
 import logging
+import os
 import re
-import shutil
-from .base import ConverterPlugin, BuildContext
+from .base import ConverterPlugin, BuildContext, link_images, probe_tool
+from ._chapters import iter_chapters, map_chapters
+from ._intermediate_cache import TOC_LEFT, intermediate_html
+from ._pandoc_server import get_pandoc_server
+from .github_markdown import _compile_github_rewrite
 
 logger = logging.getLogger(__name__)
 
+# Chapter titles are turned into file names like "03-context-and-scope.md"
+_FILENAME_STRIP = re.compile(r'[^\w\s-]')
+_FILENAME_DASH = re.compile(r'[-\s]+')
+
+# Collect the README in one buffer and write it with a single syscall
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Admonition patterns converted to GitHub's alert syntax
+_ADMONITION_MAP = {
+    'Note': '> [!NOTE]',
+    'Warning': '> [!WARNING]',
+    'Important': '> [!IMPORTANT]',
+    'Tip': '> [!TIP]',
+    'Caution': '> [!CAUTION]',
+}
+# Anchor links and admonitions are rewritten in a single pass over the file
+_rewrite_for_github = _compile_github_rewrite(_ADMONITION_MAP)
+
+
 class GithubMarkdownMpConverter(ConverterPlugin):
     """Multi-page GitHub Flavored Markdown converter with GitHub-specific optimizations"""
 
@@ -14,13 +36,10 @@ class GithubMarkdownMpConverter(ConverterPlugin):
         super().__init__("github_markdown_mp", priority=2)
 
     def check_dependencies(self) -> bool:
-        try:
-            subprocess.run(["asciidoctor", "--version"], capture_output=True, check=True)
-            subprocess.run(["pandoc", "--version"], capture_output=True, check=True)
+        if probe_tool("asciidoctor", "--version") is not None and probe_tool("pandoc", "--version") is not None:
             return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            logger.error("Multi-page GitHub Markdown conversion requires both Asciidoctor and Pandoc.")
-            return False
+        logger.error("Multi-page GitHub Markdown conversion requires both Asciidoctor and Pandoc.")
+        return False
 
     def convert(self, context: BuildContext) -> Path:
         """Convert to multi-page GitHub Flavored Markdown structure"""
@@ -36,46 +55,20 @@ class GithubMarkdownMpConverter(ConverterPlugin):
         # Create a README.md as the index file (GitHub convention)
         readme_file = self._create_readme(output_dir, context, chapter_info)
 
-        # Clean up temporary files
-        temp_html.unlink()
-
         logger.info(f"Successfully created multi-page GitHub Markdown in: {output_dir}")
         return readme_file
 
     def _generate_intermediate_html(self, context: BuildContext) -> Path:
-        """Generate intermediate HTML file using Asciidoctor"""
-        temp_html_file = (context.output_dir / f"temp-{context.language}-{context.flavor}.html").absolute()
-        main_adoc_file = context.source_dir / "arc42-template.adoc"
-
+        """Return the shared intermediate HTML, after copying images next to the output"""
         # Copy images directory to output directory for relative referencing
         source_images_dir = context.source_dir / "images"
         output_images_dir = context.output_dir / "images"
 
         if source_images_dir.exists():
-            if output_images_dir.exists():
-                shutil.rmtree(output_images_dir)
-            shutil.copytree(source_images_dir, output_images_dir)
-            logger.debug(f"Copied images from {source_images_dir} to {output_images_dir}")
-
-        asciidoctor_cmd = [
-            "asciidoctor",
-            "-b", "html5",
-            "-a", f"flavor={context.flavor}",
-            # Use relative path to images directory
-            "-a", "imagesdir=images",
-            "-a", "sectids",
-            "-a", "toc=left",
-            str(main_adoc_file),
-            "-o", str(temp_html_file)
-        ]
-
-        if context.flavor == "withHelp":
-            asciidoctor_cmd.append("-a show-help")
+            link_images(source_images_dir, output_images_dir)
+            logger.debug(f"Linked images from {source_images_dir} to {output_images_dir}")
 
-        logger.debug(f"Generating intermediate HTML: {' '.join(asciidoctor_cmd)}")
-        subprocess.run(asciidoctor_cmd, check=True)
-
-        return temp_html_file
+        return intermediate_html(context, TOC_LEFT)
 
     def _split_and_convert(self, html_file: Path, output_dir: Path, context: BuildContext) -> list:
         """Split HTML by h2 headers and convert each to GitHub Markdown"""
@@ -83,86 +76,74 @@ class GithubMarkdownMpConverter(ConverterPlugin):
             content = f.read()
 
         # Split by h2 sections (main arc42 chapters)
-        pattern = r'<h2[^>]*>(.*?)</h2>'
-        parts = re.split(pattern, content, flags=re.DOTALL)
-
-        chapter_info = []
-
-        # Process chapter pairs (title, content)
-        for i in range(1, len(parts), 2):
-            if i + 1 < len(parts):
-                chapter_title = re.sub(r'<[^>]+>', '', parts[i])  # Strip HTML tags
-                chapter_content = parts[i - 1] + '<h2>' + parts[i] + '</h2>' + parts[i + 1]
-
-                # Sanitize filename
-                safe_title = re.sub(r'[^\w\s-]', '', chapter_title).strip()
-                safe_title = re.sub(r'[-\s]+', '-', safe_title).lower()
-                chapter_num = (i + 1) // 2
-
-                # Write chapter HTML to temp file
-                temp_chapter_html = output_dir / f"temp-{chapter_num:02d}.html"
-                with open(temp_chapter_html, 'w', encoding='utf-8') as f:
-                    f.write(chapter_content)
-
-                # Convert to GitHub Flavored Markdown
-                output_md = output_dir / f"{chapter_num:02d}-{safe_title}.md"
-                pandoc_cmd = [
-                    "pandoc",
-                    str(temp_chapter_html),
-                    "-f", "html",
-                    "-t", "gfm",
-                    "--wrap=preserve",
-                    "--atx-headers",
-                    "-o", str(output_md)
-                ]
+        chapters = [
+            (num, title, chapter_content)
+            for num, (title, chapter_content) in enumerate(iter_chapters(content), 1)
+        ]
 
-                subprocess.run(pandoc_cmd, check=True)
+        if not chapters:
+            return []
+
+        # Each chapter is an independent pandoc run; results keep chapter order
+        return map_chapters(context.chapter_executor, lambda chapter: self._convert_chapter(output_dir, *chapter), chapters)
+
+    def _convert_chapter(self, output_dir: Path, chapter_num: int, chapter_title: str, chapter_content: str) -> dict:
+        """Convert one chapter's HTML to a GitHub Markdown file"""
+        # Sanitize filename
+        safe_title = _FILENAME_STRIP.sub('', chapter_title).strip()
+        safe_title = _FILENAME_DASH.sub('-', safe_title).lower()
+
+        # Write chapter HTML to temp file
+        temp_chapter_html = output_dir / f"temp-{chapter_num:02d}.html"
+        with open(temp_chapter_html, 'w', encoding='utf-8') as f:
+            f.write(chapter_content)
+
+        # Convert to GitHub Flavored Markdown
+        output_md = output_dir / f"{chapter_num:02d}-{safe_title}.md"
+        pandoc_cmd = [
+            "pandoc",
+            str(temp_chapter_html),
+            "-f", "html",
+            "-t", "gfm",
+            "--wrap=preserve",
+            "--atx-headers",
+            "-o", str(output_md)
+        ]
 
-                # Apply GitHub-specific optimizations
-                self._optimize_for_github(output_md)
+        get_pandoc_server().run(pandoc_cmd)
 
-                temp_chapter_html.unlink()
+        # Apply GitHub-specific optimizations
+        self._optimize_for_github(output_md)
 
-                chapter_info.append({
-                    'num': chapter_num,
-                    'title': chapter_title.strip(),
-                    'file': output_md.name
-                })
+        temp_chapter_html.unlink()
 
-                logger.debug(f"Created chapter: {output_md.name}")
+        logger.debug(f"Created chapter: {output_md.name}")
 
-        return chapter_info
+        return {
+            'num': chapter_num,
+            'title': chapter_title.strip(),
+            'file': output_md.name
+        }
 
     def _optimize_for_github(self, md_file: Path):
         """Apply GitHub-specific optimizations to the Markdown file"""
-        with open(md_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # Fix anchor links for GitHub
-        def fix_anchor(match):
-            anchor = match.group(1)
-            github_anchor = anchor.lower().replace(' ', '-')
-            github_anchor = re.sub(r'[^\w\s-]', '', github_anchor)
-            github_anchor = re.sub(r'[-\s]+', '-', github_anchor)
-            return f'(#{github_anchor})'
-
-        content = re.sub(r'\(#([^)]+)\)', fix_anchor, content)
+        content = md_file.read_text(encoding='utf-8')
 
-        # Convert admonitions to GitHub alerts
-        content = re.sub(r'^\*\*Note:\*\*', '> [!NOTE]', content, flags=re.MULTILINE)
-        content = re.sub(r'^\*\*Warning:\*\*', '> [!WARNING]', content, flags=re.MULTILINE)
-        content = re.sub(r'^\*\*Important:\*\*', '> [!IMPORTANT]', content, flags=re.MULTILINE)
-        content = re.sub(r'^\*\*Tip:\*\*', '> [!TIP]', content, flags=re.MULTILINE)
-        content = re.sub(r'^\*\*Caution:\*\*', '> [!CAUTION]', content, flags=re.MULTILINE)
+        # Fix internal anchor references and convert admonitions to GitHub alerts
+        content = _rewrite_for_github(content)
 
-        with open(md_file, 'w', encoding='utf-8') as f:
-            f.write(content)
+        # Replace the file atomically so an interrupted build cannot truncate it
+        tmp_file = md_file.with_name(md_file.name + '.tmp')
+        tmp_file.write_text(content, encoding='utf-8')
+        os.replace(tmp_file, md_file)
 
     def _create_readme(self, output_dir: Path, context: BuildContext, chapter_info: list) -> Path:
         """Create README.md with links to all chapters (GitHub convention)"""
         readme_file = context.output_dir / "README.md"
+        tmp_file = readme_file.with_name(readme_file.name + '.tmp')
 
-        with open(readme_file, 'w', encoding='utf-8') as f:
+        # Written next to the target and renamed, so a README is always complete
+        with open(tmp_file, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
             f.write(f"# arc42 Template - {context.language} ({context.flavor})\n\n")
             f.write("This is the arc42 architecture documentation template in multi-page format.\n\n")
             f.write("## Table of Contents\n\n")
@@ -174,6 +155,7 @@ class GithubMarkdownMpConverter(ConverterPlugin):
             f.write("\n---\n\n")
             f.write("**About arc42**: arc42 is a template for documenting software and system architecture. ")
             f.write("Learn more at [arc42.org](https://arc42.org/)\n")
+        os.replace(tmp_file, readme_file)
 
         logger.info(f"Created README file: {readme_file}")
         return readme_file
@@ -1,9 +1,9 @@
 import subprocess
 from pathlib import Path
 import logging
-import shutil
 
-from .base import ConverterPlugin, BuildContext
+from .base import ConverterPlugin, BuildContext, link_images, probe_tool
+from ._asciidoctor_pool import get_asciidoctor_pool
 
 logger = logging.getLogger(__name__)
 
@@ -12,18 +12,12 @@ class HtmlConverter(ConverterPlugin):
         super().__init__("html", priority=1)
 
     def check_dependencies(self) -> bool:
-        try:
-            result = subprocess.run(
-                ["asciidoctor", "--version"],
-                capture_output=True,
-                check=True,
-                text=True
-            )
-            logger.info(f"Found Asciidoctor: {result.stdout.strip()}")
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        version = probe_tool("asciidoctor", "--version")
+        if version is None:
             logger.error("Asciidoctor not found. Please ensure it is installed and in the system's PATH.")
             return False
+        logger.info(f"Found Asciidoctor: {version.strip()}")
+        return True
 
     def convert(self, context: BuildContext) -> Path:
         output_file = (context.output_dir / f"arc42-template-{context.language}-{context.flavor}.html").absolute()
@@ -33,10 +27,8 @@ class HtmlConverter(ConverterPlugin):
         output_images_dir = context.output_dir / "images"
 
         if source_images_dir.exists():
-            if output_images_dir.exists():
-                shutil.rmtree(output_images_dir)
-            shutil.copytree(source_images_dir, output_images_dir)
-            logger.debug(f"Copied images from {source_images_dir} to {output_images_dir}")
+            link_images(source_images_dir, output_images_dir)
+            logger.debug(f"Linked images from {source_images_dir} to {output_images_dir}")
 
         # Build asciidoctor command
         cmd = [
@@ -62,14 +54,12 @@ class HtmlConverter(ConverterPlugin):
         logger.debug(f"Executing command: {' '.join(cmd)}")
 
         try:
-            result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+            get_asciidoctor_pool().run(cmd, capture_output=True, discard_stdout=True)
             logger.info(f"Successfully created HTML file: {output_file}")
             return output_file
         except subprocess.CalledProcessError as e:
             logger.error(f"HTML conversion failed for {context.language}-{context.flavor}")
             logger.error(f"Command: {' '.join(cmd)}")
-            if e.stdout:
-                logger.error(f"STDOUT: {e.stdout}")
             if e.stderr:
                 logger.error(f"STDERR: {e.stderr}")
             raise
@@ -1,27 +1,25 @@
 import subprocess
 from pathlib import Path
 import logging
-from .base import ConverterPlugin, BuildContext
+from .base import ConverterPlugin, BuildContext, probe_tool
+from ._asciidoctor_pool import get_asciidoctor_pool
 
 logger = logging.getLogger(__name__)
 
+# PDF themes installed by the Docker image
+BUILDER_THEMES_DIR = Path("/opt/arc42/pdf-themes")
+
 class PdfConverter(ConverterPlugin):
     def __init__(self):
         super().__init__("pdf", priority=1)
 
     def check_dependencies(self) -> bool:
-        try:
-            result = subprocess.run(
-                ["asciidoctor-pdf", "--version"],
-                capture_output=True,
-                check=True,
-                text=True
-            )
-            logger.info(f"Found Asciidoctor PDF: {result.stdout.strip()}")
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        version = probe_tool("asciidoctor-pdf", "--version")
+        if version is None:
             logger.error("Asciidoctor PDF not found. Please ensure it is installed.")
             return False
+        logger.info(f"Found Asciidoctor PDF: {version.strip()}")
+        return True
 
     def convert(self, context: BuildContext) -> Path:
         output_file = (context.output_dir / f"arc42-template-{context.language}-{context.flavor}.pdf").absolute()
@@ -48,7 +46,7 @@ class PdfConverter(ConverterPlugin):
         template_fonts_dir = context.source_dir / "pdf-theme" / "fonts"
 
         # 2. Builder-provided themes (from Docker image)
-        builder_themes_dir = Path("/opt/arc42/pdf-themes")
+        builder_themes_dir = BUILDER_THEMES_DIR
 
         if template_theme_path.exists():
             # Use template-specific theme (highest priority)
@@ -87,14 +85,12 @@ class PdfConverter(ConverterPlugin):
         logger.debug(f"Executing command: {' '.join(cmd)}")
 
         try:
-            result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+            get_asciidoctor_pool().run(cmd, capture_output=True, discard_stdout=True)
             logger.info(f"Successfully created PDF file: {output_file}")
             return output_file
         except subprocess.CalledProcessError as e:
             logger.error(f"PDF conversion failed for {context.language}-{context.flavor}")
             logger.error(f"Command: {' '.join(cmd)}")
-            if e.stdout:
-                logger.error(f"STDOUT: {e.stdout}")
             if e.stderr:
                 logger.error(f"STDERR: {e.stderr}")
             raise
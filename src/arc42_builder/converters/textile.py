@@ -1,8 +1,8 @@
-import subprocess
 from pathlib import Path
 import logging
-import shutil
-from .base import ConverterPlugin, BuildContext
+from .base import ConverterPlugin, BuildContext, link_images, probe_tool
+from ._intermediate_cache import intermediate_html
+from ._pandoc_server import get_pandoc_server
 
 logger = logging.getLogger(__name__)
 
@@ -13,47 +13,25 @@ class TextileConverter(ConverterPlugin):
         super().__init__("textile", priority=3)
 
     def check_dependencies(self) -> bool:
-        try:
-            subprocess.run(["asciidoctor", "--version"], capture_output=True, check=True)
-            subprocess.run(["pandoc", "--version"], capture_output=True, check=True)
+        if probe_tool("asciidoctor", "--version") is not None and probe_tool("pandoc", "--version") is not None:
             return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            logger.error("Textile conversion requires both Asciidoctor and Pandoc.")
-            return False
+        logger.error("Textile conversion requires both Asciidoctor and Pandoc.")
+        return False
 
     def convert(self, context: BuildContext) -> Path:
         """Convert to Textile format"""
         output_file = (context.output_dir / f"arc42-template-{context.language}-{context.flavor}.textile").absolute()
-        main_adoc_file = context.source_dir / "arc42-template.adoc"
 
         # Copy images directory to output directory for relative referencing
         source_images_dir = context.source_dir / "images"
         output_images_dir = context.output_dir / "images"
 
         if source_images_dir.exists():
-            if output_images_dir.exists():
-                shutil.rmtree(output_images_dir)
-            shutil.copytree(source_images_dir, output_images_dir)
-            logger.debug(f"Copied images from {source_images_dir} to {output_images_dir}")
+            link_images(source_images_dir, output_images_dir)
+            logger.debug(f"Linked images from {source_images_dir} to {output_images_dir}")
 
-        # Create a temporary HTML file via Asciidoctor
-        temp_html_file = (context.output_dir / f"temp-{context.language}-{context.flavor}.html").absolute()
-
-        asciidoctor_cmd = [
-            "asciidoctor",
-            "-b", "html5",
-            "-a", f"flavor={context.flavor}",
-            # Use relative path to images directory
-            "-a", "imagesdir=images",
-            str(main_adoc_file),
-            "-o", str(temp_html_file)
-        ]
-
-        if context.flavor == "withHelp":
-            asciidoctor_cmd.append("-a show-help")
-
-        logger.debug(f"Executing Asciidoctor for intermediate HTML: {' '.join(asciidoctor_cmd)}")
-        subprocess.run(asciidoctor_cmd, check=True)
+        # Intermediate HTML via Asciidoctor, shared with the other pandoc-based formats
+        temp_html_file = intermediate_html(context)
 
         # Convert the intermediate HTML to Textile using Pandoc
         # Use --resource-path to tell Pandoc where to find images
@@ -67,10 +45,7 @@ class TextileConverter(ConverterPlugin):
         ]
 
         logger.debug(f"Executing Pandoc for Textile conversion: {' '.join(pandoc_cmd)}")
-        subprocess.run(pandoc_cmd, check=True)
-
-        # Clean up the temporary HTML file
-        temp_html_file.unlink()
+        get_pandoc_server().run(pandoc_cmd)
 
         logger.info(f"Successfully created Textile file: {output_file}")
         return output_file
@@ -1,4 +1,5 @@
 import logging
+import re
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Dict, Any
@@ -7,15 +8,28 @@ from .validator import Validator
 from ..converters import get_converter
 from ..config.models import BuildConfig
 from ..converters.base import BuildContext
+from ..converters._cache import ArtifactCache
+from ..converters._intermediate_cache import IntermediateHtmlBuilder
+from ..config import default_cache_dir
 
 logger = logging.getLogger(__name__)
 
+# key=value lines of a version.properties file; '#' and '!' start comments
+_VERSION_PROP_RE = re.compile(r'^[ \t]*([^#!=\s][^=\n]*?)[ \t]*=[ \t]*(.*?)[ \t]*$', re.MULTILINE)
+
 class BuildPipeline:
     def __init__(self, config: BuildConfig):
         self.config = config
         self.validator = Validator(config)
         # self.packager = Packager() # To be implemented
-        self.template_path = Path(config.template.path)
+        # Resolved once, so context paths are absolute and converters'
+        # .absolute() calls no longer need a getcwd() per task
+        self.template_path = Path(config.template.path).absolute()
+        self.build_dir = Path('build').absolute()
+        self._version_props: Dict[str, Dict[str, str]] = {}
+        self.artifact_cache = ArtifactCache(default_cache_dir() / "artifacts") if config.build.incremental else None
+        self._html_builder = None
+        self._chapter_executor = None
 
     def run(self):
         """Execute the complete build pipeline."""
@@ -28,22 +42,39 @@ class BuildPipeline:
         
         build_matrix = self._generate_build_matrix()
         logger.info(f"Generated {len(build_matrix)} build tasks.")
+
+        # Every task of a language shares the same version.properties
+        self._version_props = {lang: self._load_version_props(lang) for lang in self.config.languages}
         
         results = []
-        if self.config.build.parallel:
-            with ThreadPoolExecutor(max_workers=self.config.build.max_workers) as executor:
-                futures = [executor.submit(self._build_single, task) for task in build_matrix]
-                for future in as_completed(futures):
+        # The pandoc converters share their intermediate HTML for the whole run
+        with IntermediateHtmlBuilder(self.artifact_cache) as self._html_builder:
+            if self.config.build.parallel:
+                # Chapters of the multi-page converters share one pool, so all
+                # chapter conversions of the run together stay within build.max_workers
+                with ThreadPoolExecutor(max_workers=self.config.build.max_workers) as executor, \
+                        ThreadPoolExecutor(max_workers=self.config.build.max_workers) as self._chapter_executor:
+                    futures = [executor.submit(self._build_single, task) for task in build_matrix]
+                    for future in as_completed(futures):
+                        try:
+                            results.append(future.result())
+                        except Exception as e:
+                            logger.error(f"A build task failed: {e}", exc_info=True)
+            else:
+                for task in build_matrix:
                     try:
-                        results.append(future.result())
+                        results.append(self._build_single(task))
                     except Exception as e:
-                        logger.error(f"A build task failed: {e}", exc_info=True)
-        else:
-            for task in build_matrix:
-                try:
-                    results.append(self._build_single(task))
-                except Exception as e:
-                    logger.error(f"Build task failed: {task}", exc_info=True)
+                        logger.error(f"Build task failed: {task}", exc_info=True)
+        html_builder, self._html_builder = self._html_builder, None
+        self._chapter_executor = None
+
+        if self.artifact_cache is not None:
+            self._log_cache_stats("Artifact", self.artifact_cache.hits, self.artifact_cache.misses)
+            self._log_cache_stats("Intermediate HTML", html_builder.hits, html_builder.misses)
+            removed = self.artifact_cache.prune()
+            if removed:
+                logger.debug(f"Pruned {removed} unused entries from the artifact cache.")
 
         successful_builds = [res for res in results if res]
         logger.info(f"Build finished. {len(successful_builds)}/{len(build_matrix)} artifacts created successfully.")
@@ -51,6 +82,12 @@ class BuildPipeline:
         # if self.config.build.create_zips:
         #     self.packager.create_packages(successful_builds)
 
+    def _log_cache_stats(self, name: str, hits: int, misses: int):
+        """Logs the hit rate of one of the incremental build caches."""
+        lookups = hits + misses
+        if lookups:
+            logger.info(f"{name} cache: {hits}/{lookups} hits ({hits / lookups:.0%}).")
+
     def _clean_workspace(self):
         """Cleans the contents of build, dist, and temp directories."""
         logger.info("Cleaning workspace contents...")
@@ -84,18 +121,12 @@ class BuildPipeline:
 
     def _load_version_props(self, language: str) -> Dict[str, str]:
         """Loads version.properties for a given language."""
-        props = {}
         props_file = self.template_path / language / "version.properties"
         if not props_file.is_file():
             logger.warning(f"version.properties not found for language {language}")
             return {}
-        
-        with open(props_file, 'r') as f:
-            for line in f:
-                if '=' in line:
-                    key, value = line.strip().split('=', 1)
-                    props[key] = value
-        return props
+
+        return dict(_VERSION_PROP_RE.findall(props_file.read_text(encoding='utf-8')))
 
     def _build_single(self, task: Dict[str, Any]) -> Path:
         """Build a single artifact."""
@@ -106,20 +137,37 @@ class BuildPipeline:
         logger.info(f"Building: {lang}/{flavor}/{format_name}")
         
         converter = get_converter(format_name)
-        
+
+        version_props = self._version_props.get(lang)
+        if version_props is None:
+            version_props = self._load_version_props(lang)
+
         context = BuildContext(
             language=lang,
             flavor=flavor,
             source_dir=self.template_path / lang,
-            output_dir=Path('build') / lang / flavor / format_name,
-            version_props=self._load_version_props(lang),
-            config=task['format_config'].options
+            output_dir=self.build_dir / lang / flavor / format_name,
+            version_props=version_props,
+            config=task['format_config'].options,
+            html_builder=self._html_builder,
+            chapter_executor=self._chapter_executor
         )
         
         context.output_dir.mkdir(parents=True, exist_ok=True)
         
+        cache_key = None
+        if self.artifact_cache is not None:
+            cache_key = self.artifact_cache.inputs_hash(context, converter)
+            cached_path = self.artifact_cache.restore(cache_key, context.output_dir)
+            if cached_path is not None:
+                logger.info(f"Up to date, reused cached artifact: {cached_path}")
+                return cached_path
+
         # The flavor processing is now handled by the converter via attributes
         output_path = converter.convert(context)
+
+        if cache_key is not None:
+            self.artifact_cache.store(cache_key, context.output_dir, output_path)
         
         logger.info(f"Created: {output_path}")
         return output_path
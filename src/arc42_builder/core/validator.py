@@ -1,33 +1,255 @@
+import json
 import logging
+import mmap
+import os
+import re
 import subprocess
+import threading
+import uuid
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
+from html.parser import HTMLParser
 from pathlib import Path
+from typing import Dict, FrozenSet, Iterator, List, Optional, Set
+
+from ..config import default_cache_dir
+from ..converters._asciidoctor_pool import get_asciidoctor_pool
+from ..converters._cache import _tree_stat_digest
+
+try:
+    from lxml import etree as _etree
+except ImportError:
+    _etree = None
 
 logger = logging.getLogger(__name__)
 
+# Font families PDF generation relies on
+REQUIRED_FONTS = (
+    "Noto Sans",
+    "Noto Sans CJK SC",
+    "Noto Sans Mono",
+    "Liberation Sans",
+)
+# Written by the Docker image build once it verified REQUIRED_FONTS
+FONTS_VERIFIED_MARKER = Path("/etc/arc42/fonts.ok")
+
+# Pattern to match image directives: image::path[] or image:path[]
+# Matched against raw bytes; only the references themselves are decoded
+_IMAGE_RE = re.compile(rb'image::?([^\[\]]+)\[')
+
+# Blocking file reads overlap well beyond the number of cores
+_SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+# Build artifact kinds checked by validate_build_artifacts, by file suffix
+_ARTIFACT_SUFFIXES = {".md": "md", ".html": "html", ".docx": "docx"}
+
+
+def _walk_files(root: str) -> Iterator[str]:
+    """Yield the paths of all files below root."""
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                else:
+                    yield entry.path
+
+
+def _collect_artifacts(build_dir: Path) -> Dict[str, List[Path]]:
+    """Sort the files below build_dir by artifact kind in a single walk."""
+    artifacts = {kind: [] for kind in _ARTIFACT_SUFFIXES.values()}
+    for path in _walk_files(str(build_dir)):
+        kind = _ARTIFACT_SUFFIXES.get(os.path.splitext(path)[1])
+        if kind is not None:
+            artifacts[kind].append(Path(path))
+    return artifacts
+
+
+def _scan_images(adoc_file: str) -> Set[str]:
+    """Return the image references of one AsciiDoc file."""
+    with open(adoc_file, 'rb') as f:
+        # mmap cannot map an empty file
+        if os.fstat(f.fileno()).st_size == 0:
+            return set()
+        # Scan the page cache directly instead of copying the file into a buffer
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            # Clean up the references (remove any leading/trailing whitespace)
+            return {match.decode('utf-8').strip() for match in _IMAGE_RE.findall(mapped)}
+
+# Characters fed to the HTML parser at a time
+_HTML_CHUNK_SIZE = 1 << 16
+
+
+class _ImageExtractor(HTMLParser):
+    """Collects the src attribute of every img tag."""
+
+    def __init__(self):
+        super().__init__()
+        self.images = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'img':
+            for attr, value in attrs:
+                if attr == 'src':
+                    self.images.append(value)
+
+
+class _DirectoryListings:
+    """
+    Answers "does this file exist" from one listing per directory, so many
+    references into the same images directory cost a single scandir.
+    """
+
+    def __init__(self):
+        self._names: Dict[str, FrozenSet[str]] = {}
+
+    def contains(self, path: str) -> bool:
+        directory, name = os.path.split(os.path.normpath(path))
+        names = self._names.get(directory)
+        if names is None:
+            try:
+                names = frozenset(os.listdir(directory))
+            except OSError:
+                names = frozenset()
+            # Concurrent callers may list a directory twice; the result is the same
+            self._names[directory] = names
+        return name in names
+
+
+def _extract_images(html_file: Path) -> List[str]:
+    """
+    Return the src of every img tag in an HTML file.
+    Uses lxml's C parser when installed and falls back to HTMLParser.
+    """
+    if _etree is not None:
+        images = []
+        for _, element in _etree.iterparse(str(html_file), tag='img', html=True, encoding='utf-8'):
+            src = element.get('src')
+            if src is not None:
+                images.append(src)
+            element.clear(keep_tail=True)
+        return images
+
+    # HTMLParser is incremental; feed it in chunks instead of holding
+    # the whole (possibly multi-MB) document in memory
+    parser = _ImageExtractor()
+    with open(html_file, 'r', encoding='utf-8') as f:
+        while chunk := f.read(_HTML_CHUNK_SIZE):
+            parser.feed(chunk)
+    parser.close()
+    return parser.images
+
+def _file_signature(path: Path) -> Optional[str]:
+    """Return the size and mtime of path as a cache signature, or None if it is gone."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return f"{st.st_size}:{st.st_mtime_ns}"
+
+
+class _ValidationCache:
+    """
+    Remembers which inputs passed a check, so unchanged files are not checked
+    again by later runs. Entries map a check and path to the stat signature
+    the input had when it passed.
+    """
+
+    def __init__(self, cache_file: Path):
+        self.cache_file = cache_file
+        self._entries: Optional[Dict[str, str]] = None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def load(self) -> Dict[str, str]:
+        with self._lock:
+            if self._entries is None:
+                try:
+                    self._entries = json.loads(self.cache_file.read_text(encoding="utf-8"))
+                except (OSError, ValueError):
+                    self._entries = {}
+            return self._entries
+
+    def save(self) -> None:
+        """Write the entries back; failures only cost the next cache hit."""
+        with self._lock:
+            if not self._dirty:
+                return
+            tmp = self.cache_file.with_name(f".{self.cache_file.name}.{uuid.uuid4().hex}")
+            try:
+                self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+                tmp.write_text(json.dumps(self._entries), encoding="utf-8")
+                os.replace(tmp, self.cache_file)
+                self._dirty = False
+            except OSError:
+                tmp.unlink(missing_ok=True)
+
+    def check(self, check: str, path: Path, signature: Optional[str]) -> bool:
+        """Return True if path passed check while it had this signature."""
+        return signature is not None and self.load().get(f"{check}:{Path(path).absolute()}") == signature
+
+    def mark(self, check: str, path: Path, signature: Optional[str]) -> None:
+        """Record that path passed check with this signature."""
+        if signature is None:
+            return
+        entries = self.load()
+        with self._lock:
+            entries[f"{check}:{Path(path).absolute()}"] = signature
+            self._dirty = True
+
+
 class Validator:
     """
     Performs pre-build validation checks on the template repository.
     """
+    # Installed font families reported by `fc-list`, shared by all instances;
+    # fonts do not change within a run
+    _FONTS_CACHE: Optional[FrozenSet[str]] = None
+
     def __init__(self, config):
         self.config = config
         self.template_path = Path(config.template.path)
+        # Inputs that passed before are skipped on incremental builds
+        self._cache = _ValidationCache(default_cache_dir() / "validator.json") if config.build.incremental else None
 
     def run_all_validations(self):
         """Runs all validation checks and raises an error if any fail."""
         logger.info("Running all validations...")
-        self.validate_template_path()
-        self.validate_languages()
-        self.verify_fonts_installed()
+        try:
+            self.validate_template_path()
+            self.validate_languages()
+            self.verify_fonts_installed()
+        finally:
+            self._save_cache()
         logger.info("All validations passed.")
 
     def validate_build_artifacts(self, build_dir: Path):
         """Validate generated build artifacts for syntax and completeness."""
         logger.info("Validating build artifacts...")
-        self.validate_markdown_artifacts(build_dir)
-        self.validate_html_artifacts(build_dir)
-        self.validate_docx_artifacts(build_dir)
+        # One walk of the build tree finds the files of every kind
+        artifacts = _collect_artifacts(build_dir)
+        try:
+            self.validate_markdown_artifacts(artifacts["md"])
+            self.validate_html_artifacts(artifacts["html"])
+            self.validate_docx_artifacts(artifacts["docx"])
+        finally:
+            self._save_cache()
         logger.info("Build artifact validation passed.")
 
+    def _save_cache(self):
+        if self._cache is not None:
+            self._cache.save()
+
+    def _is_cached(self, check: str, path: Path, signature: Optional[str]) -> bool:
+        return self._cache is not None and self._cache.check(check, path, signature)
+
+    def _mark_cached(self, check: str, path: Path, signature: Optional[str]):
+        if self._cache is not None:
+            self._cache.mark(check, path, signature)
+
     def validate_template_path(self):
         """Check if the template path exists and seems valid."""
         if not self.template_path.is_dir():
@@ -41,25 +263,49 @@ class Validator:
         2. The version.properties file.
         3. Broken includes or image references using `asciidoctor`.
         """
-        for lang in self.config.languages:
-            logger.info(f"Validating language: {lang}...")
-            lang_dir = self.template_path / lang
-            if not lang_dir.is_dir():
-                raise FileNotFoundError(f"Language directory not found for '{lang}' at: {lang_dir}")
-
-            # 1. Check for version.properties
-            version_file = lang_dir / "version.properties"
-            if not version_file.is_file():
-                raise FileNotFoundError(f"Missing version.properties for '{lang}' at: {version_file}")
-            
-            # 2. Check for broken references
-            main_adoc = lang_dir / "arc42-template.adoc"
-            if not main_adoc.is_file():
-                raise FileNotFoundError(f"Main AsciiDoc file not found for '{lang}' at: {main_adoc}")
-            
+        languages = self.config.languages
+        if not languages:
+            return
+
+        # Each language is checked by blocking subprocess and file system
+        # calls, so threads overlap them well
+        with ThreadPoolExecutor(max_workers=min(len(languages), self.config.build.max_workers)) as executor:
+            futures = [executor.submit(self._validate_one_language, lang) for lang in languages]
+            try:
+                for future in as_completed(futures):
+                    future.result()
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
+    def _validate_one_language(self, lang: str):
+        """Run the checks of validate_languages for a single language."""
+        logger.info(f"Validating language: {lang}...")
+        lang_dir = self.template_path / lang
+        if not lang_dir.is_dir():
+            raise FileNotFoundError(f"Language directory not found for '{lang}' at: {lang_dir}")
+
+        # 1. Check for version.properties
+        version_file = lang_dir / "version.properties"
+        if not version_file.is_file():
+            raise FileNotFoundError(f"Missing version.properties for '{lang}' at: {version_file}")
+
+        # 2. Check for broken references
+        main_adoc = lang_dir / "arc42-template.adoc"
+        if not main_adoc.is_file():
+            raise FileNotFoundError(f"Main AsciiDoc file not found for '{lang}' at: {main_adoc}")
+
+        # Includes can come from anywhere in the language tree, so the
+        # reference check is only skipped if no file in it changed
+        tree_signature = _tree_stat_digest(lang_dir) if self._cache is not None else None
+        if self._is_cached("references", lang_dir, tree_signature):
+            logger.debug(f"References in {main_adoc} unchanged since they last passed")
+        else:
             self._check_asciidoctor_references(main_adoc)
-            self._check_missing_images(lang_dir)
-            logger.info(f"Language '{lang}' validation passed.")
+            self._mark_cached("references", lang_dir, tree_signature)
+        self._check_missing_images(lang_dir)
+        logger.info(f"Language '{lang}' validation passed.")
 
     def _check_asciidoctor_references(self, adoc_file: Path):
         """
@@ -67,16 +313,17 @@ class Validator:
         """
         logger.debug(f"Checking references in {adoc_file}...")
         try:
-            subprocess.run(
+            # The warm Asciidoctor processes of the converters serve these
+            # checks too, so languages do not each pay for starting Ruby
+            get_asciidoctor_pool().run(
                 [
                     "asciidoctor",
                     str(adoc_file),
                     "-o", "/dev/null", # Discard output
                     "--failure-level", "WARN" # Fail on warnings (e.g., missing includes)
                 ],
-                check=True,
                 capture_output=True,
-                text=True
+                discard_stdout=True,
             )
         except subprocess.CalledProcessError as e:
             logger.error(f"Validation failed for {adoc_file}. Asciidoctor output:\n{e.stderr}")
@@ -90,28 +337,17 @@ class Validator:
             logger.warning("Skipping font verification.")
             return
 
+        # Fonts in the image never change; the image build already checked them
+        if FONTS_VERIFIED_MARKER.is_file():
+            logger.info("Required fonts were verified when the container image was built.")
+            return
+
         logger.info("Verifying required fonts are installed in the container...")
-        required_fonts = [
-            "Noto Sans",
-            "Noto Sans CJK SC",
-            "Noto Sans Mono",
-            "Liberation Sans",
-        ]
-        
-        try:
-            result = subprocess.run(
-                ["fc-list", ":", "family"], 
-                capture_output=True, 
-                text=True,
-                check=True
-            )
-        except (FileNotFoundError, subprocess.CalledProcessError):
+        missing = self.missing_fonts()
+        if missing is None:
             logger.warning("`fc-list` command not found. Skipping font verification. This is expected on non-Linux hosts.")
             return
 
-        installed_fonts = result.stdout
-        missing = [font for font in required_fonts if font not in installed_fonts]
-        
         if missing:
             raise RuntimeError(
                 f"Missing required fonts in container: {missing}. "
@@ -119,12 +355,55 @@ class Validator:
             )
         logger.info("All required fonts are installed.")
 
+    @classmethod
+    def missing_fonts(cls) -> Optional[List[str]]:
+        """
+        Return the REQUIRED_FONTS that `fc-list` does not report, or None if
+        `fc-list` is not available.
+        """
+        if cls._FONTS_CACHE is None:
+            try:
+                result = subprocess.run(
+                    ["fc-list", ":", "family"],
+                    capture_output=True,
+                    text=True,
+                    check=True
+                )
+            except (FileNotFoundError, subprocess.CalledProcessError):
+                return None
+            # One line per font, listing the family and its aliases separated by
+            # commas; match whole names so "Noto Sans CJK SC" is not "Noto Sans"
+            cls._FONTS_CACHE = frozenset(
+                family.strip()
+                for line in result.stdout.splitlines()
+                for family in line.split(":", 1)[-1].split(",")
+            )
+
+        installed_fonts = cls._FONTS_CACHE
+        return [font for font in REQUIRED_FONTS if font not in installed_fonts]
+
+    @classmethod
+    def record_fonts_verified(cls) -> bool:
+        """
+        Write FONTS_VERIFIED_MARKER if every required font is installed; run
+        once when the container image is built. Returns whether it was written.
+        Missing fonts or an unavailable `fc-list` leave the check to run time.
+        """
+        missing = cls.missing_fonts()
+        if missing is None:
+            logger.warning("`fc-list` command not found; fonts will be verified at run time.")
+            return False
+        if missing:
+            logger.warning(f"Missing required fonts: {missing}; fonts will be verified at run time.")
+            return False
+        FONTS_VERIFIED_MARKER.parent.mkdir(parents=True, exist_ok=True)
+        FONTS_VERIFIED_MARKER.touch()
+        return True
+
     def _check_missing_images(self, lang_dir: Path):
         """
         Parse AsciiDoc files to find image references and verify they exist.
         """
-        import re
-
         logger.debug(f"Checking for missing images in {lang_dir}...")
         images_dir = lang_dir / "images"
 
@@ -133,30 +412,34 @@ class Validator:
             logger.debug(f"No images directory found at {images_dir}, skipping image checks")
             return
 
-        # Find all .adoc files
-        adoc_files = list(lang_dir.glob("**/*.adoc"))
-
-        # Pattern to match image directives: image::path[] or image:path[]
-        image_pattern = re.compile(r'image::?([^\[\]]+)\[')
-
+        # One walk collects the .adoc files and every file present, relative
+        # to the language directory; the images directory lies inside it
+        root = str(lang_dir)
+        prefix_len = len(os.path.join(root, ""))
+        adoc_files = []
+        present = set()
+        for path in _walk_files(root):
+            present.add(path[prefix_len:])
+            if path.endswith(".adoc"):
+                adoc_files.append(path)
+
+        # Reads block on I/O and release the GIL; scan the files concurrently
         referenced_images = set()
-        for adoc_file in adoc_files:
-            with open(adoc_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-                matches = image_pattern.findall(content)
+        with ThreadPoolExecutor(max_workers=_SCAN_WORKERS) as executor:
+            for matches in executor.map(_scan_images, adoc_files):
                 referenced_images.update(matches)
 
-        # Check if referenced images exist
+        # Check if referenced images exist, relative to the language or the images directory
+        images_rel = os.path.relpath(images_dir, lang_dir)
         missing_images = []
         for img_ref in referenced_images:
-            # Clean up the reference (remove any leading/trailing whitespace)
-            img_ref = img_ref.strip()
-
-            # Try both absolute and relative to images directory
-            img_path = lang_dir / img_ref
-            img_path_in_images = images_dir / img_ref
-
-            if not img_path.exists() and not img_path_in_images.exists():
+            if not os.path.isabs(img_ref) and (
+                    os.path.normpath(img_ref) in present
+                    or os.path.normpath(os.path.join(images_rel, img_ref)) in present):
+                continue
+            # Absolute references, references leaving the language directory
+            # and directories are not in the set; look those up directly
+            if not os.path.exists(lang_dir / img_ref) and not os.path.exists(images_dir / img_ref):
                 missing_images.append(img_ref)
 
         if missing_images:
@@ -168,32 +451,41 @@ class Validator:
         else:
             logger.debug(f"All {len(referenced_images)} referenced images found")
 
-    def validate_markdown_artifacts(self, build_dir: Path):
+    def validate_markdown_artifacts(self, md_files: List[Path]):
         """
         Validate Markdown files for syntax correctness.
         Uses Pandoc to validate the syntax.
         """
         logger.info("Validating Markdown artifacts...")
 
-        md_files = list(build_dir.glob("**/*.md"))
-
         if not md_files:
             logger.warning("No Markdown files found to validate")
             return
 
+        signatures = {md_file: _file_signature(md_file) for md_file in md_files} if self._cache is not None else {}
+        pending = [md_file for md_file in md_files if not self._is_cached("markdown", md_file, signatures.get(md_file))]
+
+        # Pandoc reads all files in one run; only when that fails is every
+        # file parsed on its own (concurrently) to find the broken ones
         errors = []
-        for md_file in md_files:
+        if pending:
             try:
-                # Try to parse the Markdown file with Pandoc
-                result = subprocess.run(
-                    ["pandoc", str(md_file), "-t", "html", "-o", "/dev/null"],
-                    capture_output=True,
-                    text=True,
+                # Output is discarded; a failure is diagnosed by the per-file runs
+                subprocess.run(
+                    ["pandoc", *map(str, pending), "-t", "html", "-o", os.devnull],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
                     check=True
                 )
-            except subprocess.CalledProcessError as e:
-                errors.append(f"{md_file.name}: {e.stderr}")
-                logger.error(f"Markdown validation failed for {md_file}: {e.stderr}")
+                failed = []
+            except subprocess.CalledProcessError:
+                with ThreadPoolExecutor(max_workers=self.config.build.max_workers) as executor:
+                    results = list(executor.map(self._check_markdown_file, pending))
+                errors = [error for error in results if error]
+                failed = [md_file for md_file, error in zip(pending, results) if error]
+            for md_file in pending:
+                if md_file not in failed:
+                    self._mark_cached("markdown", md_file, signatures.get(md_file))
 
         if errors:
             raise ValueError(
@@ -203,62 +495,42 @@ class Validator:
 
         logger.info(f"All {len(md_files)} Markdown files validated successfully")
 
-    def validate_html_artifacts(self, build_dir: Path):
+    def _check_markdown_file(self, md_file: Path) -> Optional[str]:
+        """Parse one Markdown file with Pandoc; return an error message if it fails."""
+        try:
+            # Try to parse the Markdown file with Pandoc
+            # Only stderr is read, and only decoded when the file fails
+            subprocess.run(
+                ["pandoc", str(md_file), "-t", "html", "-o", "/dev/null"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                check=True
+            )
+        except subprocess.CalledProcessError as e:
+            stderr = e.stderr.decode('utf-8', 'replace')
+            logger.error(f"Markdown validation failed for {md_file}: {stderr}")
+            return f"{md_file.name}: {stderr}"
+        return None
+
+    def validate_html_artifacts(self, html_files: List[Path]):
         """
         Validate HTML files for broken image references.
         """
-        import re
-        from html.parser import HTMLParser
-
         logger.info("Validating HTML artifacts...")
 
-        html_files = list(build_dir.glob("**/*.html"))
-
         if not html_files:
             logger.warning("No HTML files found to validate")
             return
 
-        class ImageExtractor(HTMLParser):
-            def __init__(self):
-                super().__init__()
-                self.images = []
-
-            def handle_starttag(self, tag, attrs):
-                if tag == 'img':
-                    for attr, value in attrs:
-                        if attr == 'src':
-                            self.images.append(value)
-
-        errors = []
-        for html_file in html_files:
-            try:
-                with open(html_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-
-                parser = ImageExtractor()
-                parser.feed(content)
-
-                # Check if referenced images exist
-                for img_src in parser.images:
-                    # Skip absolute URLs (http://, https://, data:, etc.)
-                    if img_src.startswith(('http://', 'https://', 'data:', '//')):
-                        continue
-
-                    # Skip absolute paths (these shouldn't exist after our fix)
-                    if img_src.startswith('/'):
-                        errors.append(f"{html_file.name}: Image uses absolute path: {img_src}")
-                        continue
-
-                    # Check relative path
-                    img_path = html_file.parent / img_src
-                    if not img_path.exists():
-                        errors.append(f"{html_file.name}: Missing image: {img_src}")
-
-                logger.debug(f"HTML validation passed for {html_file.name} ({len(parser.images)} images found)")
-
-            except Exception as e:
-                errors.append(f"{html_file.name}: Validation error: {e}")
-                logger.error(f"HTML validation failed for {html_file}: {e}")
+        # Files are parsed independently; reading them overlaps across threads.
+        # Image lookups share directory listings across all files.
+        listings = _DirectoryListings()
+        with ThreadPoolExecutor(max_workers=self.config.build.max_workers) as executor:
+            errors = [
+                error
+                for file_errors in executor.map(partial(self._check_html_file, listings=listings), html_files)
+                for error in file_errors
+            ]
 
         if errors:
             raise ValueError(
@@ -268,43 +540,50 @@ class Validator:
 
         logger.info(f"All {len(html_files)} HTML files validated successfully")
 
-    def validate_docx_artifacts(self, build_dir: Path):
+    def _check_html_file(self, html_file: Path, listings: Optional["_DirectoryListings"] = None) -> List[str]:
+        """Check the image references of one HTML file; return the problems found."""
+        if listings is None:
+            listings = _DirectoryListings()
+        errors = []
+        try:
+            images = _extract_images(html_file)
+
+            # Check if referenced images exist
+            for img_src in images:
+                # Skip absolute URLs (http://, https://, data:, etc.)
+                if img_src.startswith(('http://', 'https://', 'data:', '//')):
+                    continue
+
+                # Skip absolute paths (these shouldn't exist after our fix)
+                if img_src.startswith('/'):
+                    errors.append(f"{html_file.name}: Image uses absolute path: {img_src}")
+                    continue
+
+                # Check relative path
+                if not listings.contains(os.path.join(html_file.parent, img_src)):
+                    errors.append(f"{html_file.name}: Missing image: {img_src}")
+
+            logger.debug(f"HTML validation passed for {html_file.name} ({len(images)} images found)")
+
+        except Exception as e:
+            errors.append(f"{html_file.name}: Validation error: {e}")
+            logger.error(f"HTML validation failed for {html_file}: {e}")
+        return errors
+
+    def validate_docx_artifacts(self, docx_files: List[Path]):
         """
         Validate DOCX files for embedded images.
         DOCX files are ZIP archives containing XML and media files.
         """
-        import zipfile
-
         logger.info("Validating DOCX artifacts...")
 
-        docx_files = list(build_dir.glob("**/*.docx"))
-
         if not docx_files:
             logger.warning("No DOCX files found to validate")
             return
 
-        errors = []
-        for docx_file in docx_files:
-            try:
-                # DOCX is a ZIP file - check if it has media folder with images
-                with zipfile.ZipFile(docx_file, 'r') as zip_ref:
-                    file_list = zip_ref.namelist()
-
-                    # Check for media files (images are stored in word/media/)
-                    media_files = [f for f in file_list if f.startswith('word/media/')]
-
-                    if not media_files:
-                        # This might be okay if the document has no images
-                        logger.debug(f"{docx_file.name}: No embedded images found (this may be expected)")
-                    else:
-                        logger.debug(f"{docx_file.name}: Found {len(media_files)} embedded media file(s)")
-
-            except zipfile.BadZipFile:
-                errors.append(f"{docx_file.name}: File is not a valid DOCX (corrupted ZIP)")
-                logger.error(f"DOCX validation failed for {docx_file}: Not a valid ZIP file")
-            except Exception as e:
-                errors.append(f"{docx_file.name}: Validation error: {e}")
-                logger.error(f"DOCX validation failed for {docx_file}: {e}")
+        # Archives are opened independently; their reads overlap across threads
+        with ThreadPoolExecutor(max_workers=self.config.build.max_workers) as executor:
+            errors = [error for error in executor.map(self._check_docx_file, docx_files) if error]
 
         if errors:
             raise ValueError(
@@ -313,3 +592,30 @@ class Validator:
             )
 
         logger.info(f"All {len(docx_files)} DOCX files validated successfully")
+
+    def _check_docx_file(self, docx_file: Path) -> Optional[str]:
+        """Check that one DOCX file is a readable archive; return an error message if not."""
+        signature = _file_signature(docx_file) if self._cache is not None else None
+        if self._is_cached("docx", docx_file, signature):
+            return None
+        try:
+            # DOCX is a ZIP file - check if it has media folder with images
+            with zipfile.ZipFile(docx_file, 'r') as zip_ref:
+                # Count media files (images are stored in word/media/); infolist()
+                # returns the archive's own entry list, where namelist() builds a new one
+                media_count = sum(1 for info in zip_ref.infolist() if info.filename.startswith('word/media/'))
+
+                if not media_count:
+                    # This might be okay if the document has no images
+                    logger.debug(f"{docx_file.name}: No embedded images found (this may be expected)")
+                else:
+                    logger.debug(f"{docx_file.name}: Found {media_count} embedded media file(s)")
+
+        except zipfile.BadZipFile:
+            logger.error(f"DOCX validation failed for {docx_file}: Not a valid ZIP file")
+            return f"{docx_file.name}: File is not a valid DOCX (corrupted ZIP)"
+        except Exception as e:
+            logger.error(f"DOCX validation failed for {docx_file}: {e}")
+            return f"{docx_file.name}: Validation error: {e}"
+        self._mark_cached("docx", docx_file, signature)
+        return None
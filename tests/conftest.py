@@ -1,49 +1,157 @@
 """Pytest configuration and shared fixtures"""
 
+import hashlib
+import os
 import pytest
 from pathlib import Path
+import shutil
+import subprocess
 import sys
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 
-@pytest.fixture
+def pytest_terminal_summary(terminalreporter):
+    """List the informational properties recorded by passing tests in verbose runs"""
+    if terminalreporter.verbosity < 1:
+        return
+    lines = [
+        f"{name}: {value}"
+        for report in terminalreporter.stats.get("passed", [])
+        for name, value in report.user_properties
+    ]
+    if lines:
+        terminalreporter.write_sep("-", "recorded properties")
+        for line in lines:
+            terminalreporter.write_line(line)
+
+
+@pytest.fixture(scope="session")
+def asciidoctor_gem():
+    """Skip the test unless Ruby can load the asciidoctor gem"""
+    ruby = shutil.which("ruby")
+    if ruby is None or subprocess.run([ruby, "-e", "require 'asciidoctor/cli'"],
+                                      capture_output=True).returncode != 0:
+        pytest.skip("asciidoctor gem not installed")
+
+
+@pytest.fixture(scope="session")
 def project_root():
     """Return path to project root directory"""
     return Path(__file__).parent.parent
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def config_dir(project_root):
     """Return path to config directory"""
     return project_root / "config"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def schema_file(config_dir):
     """Return path to schema.json file"""
     return config_dir / "schema.json"
 
 
+@pytest.fixture(scope="session")
+def schema_dict(schema_file):
+    """Return the parsed schema.json, read once per test session"""
+    return _json_loads(schema_file.read_bytes())
+
+
+@pytest.fixture(scope="session")
+def schema_digest(schema_file):
+    """Return the SHA-256 digest of schema.json"""
+    return hashlib.sha256(schema_file.read_bytes()).hexdigest()
+
+
+@pytest.fixture(scope="session")
+def schema_flat(schema_dict):
+    """Return every non-object value in schema.json keyed by its slash-separated path"""
+    flat = {}
+    stack = [("", schema_dict)]
+    while stack:
+        prefix, node = stack.pop()
+        for key, value in node.items():
+            path = prefix + key
+            if isinstance(value, dict):
+                stack.append((path + "/", value))
+            else:
+                flat[path] = value
+    return flat
+
+
+@pytest.fixture(scope="session")
+def schema_format_names(schema_dict):
+    """Return the format names schema.json accepts"""
+    return frozenset(schema_dict["properties"]["formats"]["properties"])
+
+
+@pytest.fixture(scope="session")
+def format_config_def(schema_dict):
+    """Return the formatConfig definition from schema.json"""
+    return schema_dict["definitions"]["formatConfig"]
+
+
+@pytest.fixture(scope="session")
+def schema_validator(schema_dict):
+    """
+    Return a function validating against the meta-schema schema.json declares.
+    Compiled once with fastjsonschema when installed, otherwise via jsonschema.
+    """
+    from jsonschema.validators import validator_for
+
+    cls = validator_for(schema_dict)
+    try:
+        import fastjsonschema
+    except ImportError:
+        cls.check_schema(cls.META_SCHEMA)
+        return cls(cls.META_SCHEMA).validate
+    return fastjsonschema.compile(cls.META_SCHEMA)
+
+
 @pytest.fixture
 def build_config_file(config_dir):
     """Return path to build.yaml file"""
     return config_dir / "build.yaml"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def src_dir(project_root):
     """Return path to src directory"""
     return project_root / "src"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def converters_dir(src_dir):
     """Return path to converters directory"""
     return src_dir / "arc42_builder" / "converters"
 
 
+@pytest.fixture(scope="session")
+def converter_stems(converters_dir):
+    """Return the module names of all converter files (except base, __init__ and private helpers)"""
+    with os.scandir(converters_dir) as entries:
+        return frozenset(
+            entry.name[:-len(".py")]
+            for entry in entries
+            if entry.name.endswith(".py") and entry.name != "base.py" and not entry.name.startswith("_")
+        )
+
+
+@pytest.fixture(scope="session")
+def converters():
+    """Return the converter registry, discovered once per test session"""
+    from arc42_builder.converters import list_converters
+    return list_converters()
+
+
 @pytest.fixture
 def valid_minimal_config():
     """Return a minimal valid configuration dictionary"""
@@ -64,22 +172,3 @@ def valid_minimal_config():
         },
         "flavors": ["withHelp"]
     }
-
-
-@pytest.fixture
-def all_format_names():
-    """Return list of all supported format names"""
-    return [
-        "html",
-        "pdf",
-        "docx",
-        "markdown",
-        "markdown_mp",
-        "asciidoc",
-        "github_markdown",
-        "github_markdown_mp",
-        "confluence",
-        "latex",
-        "rst",
-        "textile"
-    ]
@@ -0,0 +1,157 @@
+"""Tests for the content-addressed artifact cache"""
+
+import os
+
+import pytest
+
+
+@pytest.mark.unit
+class TestSourceDigest:
+    """Test suite for hashing template source trees"""
+
+    @pytest.fixture
+    def counted_hashing(self, monkeypatch):
+        """Count full content hashes of a source tree"""
+        from arc42_builder.converters import _cache
+
+        calls = []
+        real = _cache._tree_digest
+
+        def counting(root):
+            calls.append(root)
+            return real(root)
+
+        monkeypatch.setattr(_cache, "_tree_digest", counting)
+        return calls
+
+    @pytest.fixture
+    def source_dir(self, tmp_path):
+        source = tmp_path / "EN"
+        (source / "src").mkdir(parents=True)
+        (source / "arc42-template.adoc").write_text("= arc42\n", encoding="utf-8")
+        (source / "src" / "01_introduction.adoc").write_text("== Intro\n", encoding="utf-8")
+        return source
+
+    def test_unchanged_tree_is_not_reread(self, source_dir, tmp_path, counted_hashing):
+        """Verify a later run reuses the content hash when no file stat changed"""
+        from arc42_builder.converters._cache import ArtifactCache
+
+        first = ArtifactCache(tmp_path / "cache").source_digest(source_dir)
+        second = ArtifactCache(tmp_path / "cache").source_digest(source_dir)
+
+        assert first == second
+        assert len(counted_hashing) == 1
+
+    def test_modified_file_is_rehashed(self, source_dir, tmp_path, counted_hashing):
+        """Verify an edited file changes the digest"""
+        from arc42_builder.converters._cache import ArtifactCache
+
+        first = ArtifactCache(tmp_path / "cache").source_digest(source_dir)
+        chapter = source_dir / "src" / "01_introduction.adoc"
+        chapter.write_text("== Einleitung\n", encoding="utf-8")
+        st = chapter.stat()
+        os.utime(chapter, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        second = ArtifactCache(tmp_path / "cache").source_digest(source_dir)
+
+        assert first != second
+        assert len(counted_hashing) == 2
+
+
+@pytest.mark.unit
+class TestCodeDigest:
+    """Test suite for hashing the converter code that produced an artifact"""
+
+    def test_shared_module_edit_changes_digest(self, tmp_path):
+        """Verify editing any module of the package changes the digest"""
+        from arc42_builder.converters._cache import _package_digest
+
+        (tmp_path / "html.py").write_text("CONVERTER = 1\n", encoding="utf-8")
+        (tmp_path / "_chapters.py").write_text("SPLIT = 1\n", encoding="utf-8")
+        first = _package_digest(tmp_path)
+        (tmp_path / "_chapters.py").write_text("SPLIT = 2\n", encoding="utf-8")
+
+        assert _package_digest(tmp_path) != first
+
+
+@pytest.mark.unit
+class TestToolchainDigest:
+    """Test suite for hashing the external tools and themes behind an artifact"""
+
+    @pytest.fixture
+    def toolchain(self, tmp_path, monkeypatch):
+        """Report fixed tool versions and use a builder theme directory in tmp_path"""
+        from arc42_builder.converters import _cache
+
+        versions = {"asciidoctor": "Asciidoctor 2.0.20\n", "asciidoctor-pdf": "Asciidoctor PDF 2.3.9\n",
+                    "pandoc": "pandoc 2.9.2.1\n"}
+        themes_dir = tmp_path / "pdf-themes"
+        themes_dir.mkdir()
+        (themes_dir / "default-theme.yml").write_text("base:\n  font-size: 10\n", encoding="utf-8")
+        monkeypatch.setattr(_cache, "probe_tool", lambda *cmd: versions.get(cmd[0]))
+        monkeypatch.setattr(_cache, "BUILDER_THEMES_DIR", themes_dir)
+        return versions, themes_dir
+
+    def test_tool_upgrade_changes_digest(self, toolchain, tmp_path):
+        """Verify a different reported tool version changes the digest"""
+        from arc42_builder.converters._cache import ArtifactCache
+
+        versions, _ = toolchain
+        first = ArtifactCache(tmp_path / "cache").toolchain_digest()
+        versions["pandoc"] = "pandoc 3.1.11\n"
+
+        assert ArtifactCache(tmp_path / "cache").toolchain_digest() != first
+
+    def test_theme_edit_changes_digest(self, toolchain, tmp_path):
+        """Verify editing a builder-provided PDF theme changes the digest"""
+        from arc42_builder.converters._cache import ArtifactCache
+
+        _, themes_dir = toolchain
+        first = ArtifactCache(tmp_path / "cache").toolchain_digest()
+        (themes_dir / "default-theme.yml").write_text("base:\n  font-size: 11\n", encoding="utf-8")
+
+        assert ArtifactCache(tmp_path / "cache").toolchain_digest() != first
+
+
+@pytest.mark.unit
+class TestPrune:
+    """Test suite for removing unused cache entries"""
+
+    def test_old_entries_are_removed(self, tmp_path):
+        """Verify entries unused past the age limit go while fresh ones and the manifest stay"""
+        import time
+        from arc42_builder.converters._cache import ArtifactCache
+
+        cache = ArtifactCache(tmp_path / "cache")
+        cache.html_dir.mkdir(parents=True)
+        old_entry = cache.cache_dir / "old"
+        old_entry.mkdir()
+        fresh_entry = cache.cache_dir / "fresh"
+        fresh_entry.mkdir()
+        old_html = cache.html_dir / "old.html"
+        old_html.write_text("<p/>", encoding="utf-8")
+        manifest = cache.cache_dir / "sources.json"
+        manifest.write_text("{}", encoding="utf-8")
+        long_ago = time.time() - 90 * 86400
+        for path in (old_entry, old_html, manifest, cache.html_dir):
+            os.utime(path, (long_ago, long_ago))
+
+        assert cache.prune(max_age_days=30) == 2
+        assert sorted(p.name for p in cache.cache_dir.iterdir()) == ["fresh", "html", "sources.json"]
+        assert not any(cache.html_dir.iterdir())
+
+    def test_restore_marks_entry_as_used(self, tmp_path):
+        """Verify a cache hit refreshes the entry so it is not pruned"""
+        import time
+        from arc42_builder.converters._cache import ArtifactCache
+
+        cache = ArtifactCache(tmp_path / "cache")
+        output_dir = tmp_path / "out"
+        output_dir.mkdir()
+        (output_dir / "doc.html").write_text("<p/>", encoding="utf-8")
+        cache.store("key", output_dir, output_dir / "doc.html")
+        long_ago = time.time() - 90 * 86400
+        os.utime(cache.cache_dir / "key", (long_ago, long_ago))
+
+        assert cache.restore("key", tmp_path / "restored") is not None
+        assert cache.prune(max_age_days=30) == 0
@@ -0,0 +1,126 @@
+"""Tests for the AsciiDoc bundling converter"""
+
+import pytest
+
+
+@pytest.fixture
+def adoc_tree(tmp_path):
+    """Create a main document with a nested include and conditional blocks"""
+    (tmp_path / "src").mkdir()
+    (tmp_path / "arc42-template.adoc").write_text(
+        "= arc42\n"
+        "include::src/01_intro.adoc[]\n"
+        "ifdef::show-help[]\n"
+        "Help text\n"
+        "endif::[]\n"
+        "Trailing text with a::colon\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "src" / "01_intro.adoc").write_text(
+        "== Introduction\n"
+        "include::missing.adoc[leveloffset=+1]\n",
+        encoding="utf-8",
+    )
+    return tmp_path
+
+
+@pytest.mark.unit
+class TestProcessIncludes:
+    """Test suite for include and conditional handling"""
+
+    def test_includes_are_inlined(self, adoc_tree):
+        """Verify includes are replaced by their content between markers"""
+        from arc42_builder.converters.asciidoc import AsciidocConverter
+
+        content = AsciidocConverter()._process_includes(adoc_tree / "arc42-template.adoc", adoc_tree, "plain")
+
+        assert "// BEGIN INCLUDE: src/01_intro.adoc\n== Introduction\n" in content
+        assert "// END INCLUDE: src/01_intro.adoc\n" in content
+        assert "// WARNING: File not found:" in content
+
+    def test_help_blocks_kept_for_with_help(self, adoc_tree):
+        """Verify withHelp keeps help content without the resolved directives"""
+        from arc42_builder.converters.asciidoc import AsciidocConverter
+
+        content = AsciidocConverter()._process_includes(adoc_tree / "arc42-template.adoc", adoc_tree, "withHelp")
+
+        assert content.startswith("= arc42\n")
+        assert "// END INCLUDE: src/01_intro.adoc\nHelp text\nTrailing" in content
+        assert "show-help" not in content
+        assert content.endswith("Trailing text with a::colon\n")
+
+    def test_help_blocks_dropped_for_plain(self, adoc_tree):
+        """Verify plain drops help-only branches, including their includes"""
+        from arc42_builder.converters.asciidoc import AsciidocConverter
+
+        (adoc_tree / "arc42-template.adoc").write_text(
+            "ifdef::show-help[]\n"
+            "Help text\n"
+            "include::src/01_intro.adoc[]\n"
+            "endif::show-help[]\n"
+            "ifndef::show-help[]\n"
+            "Plain text\n"
+            "endif::[]\n",
+            encoding="utf-8",
+        )
+
+        content = AsciidocConverter()._process_includes(adoc_tree / "arc42-template.adoc", adoc_tree, "plain")
+
+        assert content == "Plain text\n"
+
+    def test_unknown_conditionals_are_left_to_asciidoctor(self, adoc_tree):
+        """Verify conditionals on other attributes pass through with their content"""
+        from arc42_builder.converters.asciidoc import AsciidocConverter
+
+        (adoc_tree / "arc42-template.adoc").write_text(
+            "ifdef::backend-html5[]\n"
+            "HTML only\n"
+            "endif::[]\n",
+            encoding="utf-8",
+        )
+
+        content = AsciidocConverter()._process_includes(adoc_tree / "arc42-template.adoc", adoc_tree, "plain")
+
+        assert content == "ifdef::backend-html5[]\nHTML only\nendif::[]\n"
+
+    def test_nested_include_change_invalidates_cache(self, adoc_tree):
+        """Verify an edit to an included file is picked up on the next run"""
+        import os
+        from arc42_builder.converters.asciidoc import AsciidocConverter
+
+        converter = AsciidocConverter()
+        main = adoc_tree / "arc42-template.adoc"
+        assert "== Introduction\n" in converter._process_includes(main, adoc_tree, "plain")
+
+        intro = adoc_tree / "src" / "01_intro.adoc"
+        intro.write_text("== Einführung\n", encoding="utf-8")
+        st = intro.stat()
+        os.utime(intro, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        content = converter._process_includes(main, adoc_tree, "plain")
+        assert "== Einführung\n" in content
+        assert "== Introduction\n" not in content
+
+
+@pytest.mark.unit
+class TestAsciidocConvert:
+    """Test suite for writing the bundled AsciiDoc file"""
+
+    def test_convert_writes_bundle(self, adoc_tree, tmp_path):
+        """Verify convert writes the same content _process_includes returns"""
+        from arc42_builder.converters.asciidoc import AsciidocConverter
+        from arc42_builder.converters.base import BuildContext
+
+        output_dir = tmp_path / "out"
+        output_dir.mkdir()
+        context = BuildContext(
+            language="EN", flavor="plain", source_dir=adoc_tree,
+            output_dir=output_dir, version_props={}, config={},
+        )
+        converter = AsciidocConverter()
+
+        output = converter.convert(context)
+
+        assert output.name == "arc42-template-EN-plain.adoc"
+        expected = converter._process_includes(adoc_tree / "arc42-template.adoc", adoc_tree, "plain")
+        assert output.read_text(encoding="utf-8") == expected
@@ -0,0 +1,104 @@
+"""Tests for the shared Asciidoctor process pool"""
+
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+# Stands in for the Asciidoctor server: exits with the code passed as argv[0]
+_FAKE_SERVER = r"""
+require 'json'
+STDOUT.sync = true
+STDOUT.puts 'ready'
+STDIN.each_line do |line|
+  argv = JSON.parse(line)
+  STDOUT.puts JSON.generate('code' => argv[0].to_i, 'stdout' => argv.join(' '), 'stderr' => '')
+end
+"""
+
+
+@pytest.mark.unit
+class TestAsciidoctorPool:
+    """Test suite for running Asciidoctor commands through the pool"""
+
+    def test_falls_back_to_subprocess(self):
+        """Verify commands still run when no server can be started"""
+        from arc42_builder.converters._asciidoctor_pool import AsciidoctorPool
+
+        pool = AsciidoctorPool()
+        pool._available = False
+
+        result = pool.run([sys.executable, "-c", "print('converted')"], capture_output=True)
+        assert result.stdout == "converted\n"
+
+        with pytest.raises(subprocess.CalledProcessError):
+            pool.run([sys.executable, "-c", "raise SystemExit(3)"], capture_output=True)
+
+    def test_discard_stdout_keeps_stderr(self):
+        """Verify discarded stdout is not read while stderr stays available"""
+        from arc42_builder.converters._asciidoctor_pool import AsciidoctorPool
+
+        pool = AsciidoctorPool()
+        pool._available = False
+        script = "import sys; print('progress'); sys.stderr.write('broken'); sys.exit(1)"
+
+        with pytest.raises(subprocess.CalledProcessError) as excinfo:
+            pool.run([sys.executable, "-c", script], capture_output=True, discard_stdout=True)
+        assert excinfo.value.stdout is None
+        assert excinfo.value.stderr == "broken"
+
+    def test_other_executables_bypass_server(self):
+        """Verify only Asciidoctor command lines are sent to a server"""
+        from arc42_builder.converters._asciidoctor_pool import AsciidoctorPool
+
+        pool = AsciidoctorPool()
+        result = pool.run([sys.executable, "-c", "print('direct')"], capture_output=True)
+
+        assert result.stdout == "direct\n"
+        assert pool._available is None
+
+    @pytest.mark.skipif(shutil.which("ruby") is None, reason="ruby not installed")
+    def test_server_process_is_reused(self, monkeypatch):
+        """Verify one server answers consecutive requests and reports failures"""
+        from arc42_builder.converters import _asciidoctor_pool
+
+        monkeypatch.setattr(_asciidoctor_pool, "_SERVER", _FAKE_SERVER)
+        pool = _asciidoctor_pool.AsciidoctorPool()
+        try:
+            assert pool.run(["asciidoctor", "0", "a.adoc"], capture_output=True).stdout == "0 a.adoc"
+            assert len(pool._idle) == 1
+            server = pool._idle[0]
+
+            with pytest.raises(subprocess.CalledProcessError) as excinfo:
+                pool.run(["asciidoctor", "1", "b.adoc"], capture_output=True)
+            assert excinfo.value.returncode == 1
+            assert pool._idle == [server]
+
+            result = pool.run(["asciidoctor-pdf", "0", "c.adoc"], capture_output=True)
+            assert result.stdout == "-r asciidoctor-pdf 0 c.adoc"
+        finally:
+            pool.close()
+
+    def test_real_server_converts_and_reports_failures(self, asciidoctor_gem, tmp_path):
+        """Verify the bundled server script drives Asciidoctor's CLI invoker"""
+        from arc42_builder.converters._asciidoctor_pool import AsciidoctorPool
+
+        source = tmp_path / "doc.adoc"
+        source.write_text("= Title\n\nHello from the pool.\n", encoding="utf-8")
+        broken = tmp_path / "broken.adoc"
+        broken.write_text("= Title\n\ninclude::missing.adoc[]\n", encoding="utf-8")
+        output = tmp_path / "doc.html"
+
+        pool = AsciidoctorPool()
+        try:
+            pool.run(["asciidoctor", "-o", str(output), str(source)], capture_output=True)
+            assert pool._available is True
+            assert "Hello from the pool." in output.read_text(encoding="utf-8")
+
+            with pytest.raises(subprocess.CalledProcessError):
+                pool.run(["asciidoctor", "--failure-level", "WARN", "-o", str(output), str(broken)],
+                         capture_output=True)
+            assert len(pool._idle) == 1
+        finally:
+            pool.close()
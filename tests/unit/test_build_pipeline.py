@@ -0,0 +1,144 @@
+"""Tests for the build pipeline"""
+
+import pytest
+
+
+@pytest.fixture
+def pipeline_config(tmp_path, valid_minimal_config):
+    """Return a BuildConfig whose template lives in tmp_path"""
+    from arc42_builder.config.loader import ConfigLoader
+
+    config = ConfigLoader(cache_dir=tmp_path / "cache")._build_config_from_dict(valid_minimal_config)
+    config.template.path = str(tmp_path / "template")
+    return config
+
+
+@pytest.mark.unit
+class TestVersionProperties:
+    """Test suite for version.properties parsing"""
+
+    def test_parses_key_value_pairs(self, pipeline_config, tmp_path):
+        """Verify keys and values are stripped and comments ignored"""
+        from arc42_builder.core.builder import BuildPipeline
+
+        lang_dir = tmp_path / "template" / "EN"
+        lang_dir.mkdir(parents=True)
+        (lang_dir / "version.properties").write_text(
+            "# revnumber=ignored\n"
+            "revnumber=9.0-EN\n"
+            "revdate = July 2025 \n"
+            "\n"
+            "revremark=(based upon AsciiDoc version)\n",
+            encoding="utf-8",
+        )
+
+        props = BuildPipeline(pipeline_config)._load_version_props("EN")
+
+        assert props == {
+            "revnumber": "9.0-EN",
+            "revdate": "July 2025",
+            "revremark": "(based upon AsciiDoc version)",
+        }
+
+    def test_missing_file_returns_empty_dict(self, pipeline_config):
+        """Verify a missing version.properties is not an error"""
+        from arc42_builder.core.builder import BuildPipeline
+
+        assert BuildPipeline(pipeline_config)._load_version_props("EN") == {}
+
+
+@pytest.mark.unit
+class TestIncrementalBuild:
+    """Test suite for reusing cached artifacts"""
+
+    @pytest.fixture
+    def counting_converter(self, monkeypatch):
+        """Replace the HTML converter with one that counts its runs"""
+        from arc42_builder.core import builder
+        from arc42_builder.converters.base import ConverterPlugin
+
+        class CountingConverter(ConverterPlugin):
+            runs = 0
+
+            def __init__(self):
+                super().__init__("html")
+
+            def check_dependencies(self):
+                return True
+
+            def convert(self, context):
+                CountingConverter.runs += 1
+                CountingConverter.last_context = context
+                output = (context.output_dir / "out.html").absolute()
+                output.write_text(f"run {CountingConverter.runs}", encoding="utf-8")
+                return output
+
+        monkeypatch.setattr(builder, "get_converter", lambda name: CountingConverter())
+        return CountingConverter
+
+    def _task(self, config):
+        return {"language": "EN", "flavor": "withHelp", "format_name": "html",
+                "format_config": config.formats["html"]}
+
+    def test_unchanged_inputs_reuse_artifact(self, pipeline_config, counting_converter, tmp_path, monkeypatch):
+        """Verify a second build with identical inputs skips the converter"""
+        import shutil
+        from arc42_builder.core.builder import BuildPipeline
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        (tmp_path / "template" / "EN").mkdir(parents=True)
+        (tmp_path / "template" / "EN" / "arc42-template.adoc").write_text("= arc42\n")
+
+        first = BuildPipeline(pipeline_config)._build_single(self._task(pipeline_config))
+        shutil.rmtree(tmp_path / "build")
+        second = BuildPipeline(pipeline_config)._build_single(self._task(pipeline_config))
+
+        assert counting_converter.runs == 1
+        assert second == first
+        assert second.read_text(encoding="utf-8") == "run 1"
+
+    def test_changed_source_rebuilds(self, pipeline_config, counting_converter, tmp_path, monkeypatch):
+        """Verify editing a template source invalidates the cached artifact"""
+        from arc42_builder.core.builder import BuildPipeline
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        source = tmp_path / "template" / "EN" / "arc42-template.adoc"
+        source.parent.mkdir(parents=True)
+        source.write_text("= arc42\n")
+
+        BuildPipeline(pipeline_config)._build_single(self._task(pipeline_config))
+        source.write_text("= arc42 (edited)\n")
+        output = BuildPipeline(pipeline_config)._build_single(self._task(pipeline_config))
+
+        assert counting_converter.runs == 2
+        assert output.read_text(encoding="utf-8") == "run 2"
+
+    def test_disabled_incremental_always_converts(self, pipeline_config, counting_converter, tmp_path, monkeypatch):
+        """Verify build.incremental=False never consults the cache"""
+        from arc42_builder.core.builder import BuildPipeline
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        pipeline_config.build.incremental = False
+
+        for _ in range(2):
+            BuildPipeline(pipeline_config)._build_single(self._task(pipeline_config))
+
+        assert counting_converter.runs == 2
+        assert not (tmp_path / "cache" / "arc42-builder" / "artifacts").exists()
+
+    def test_context_paths_are_absolute(self, pipeline_config, counting_converter, tmp_path, monkeypatch):
+        """Verify converters receive absolute source and output directories"""
+        from arc42_builder.core.builder import BuildPipeline
+
+        monkeypatch.chdir(tmp_path)
+        pipeline_config.build.incremental = False
+        pipeline_config.template.path = "template"
+
+        BuildPipeline(pipeline_config)._build_single(self._task(pipeline_config))
+
+        context = counting_converter.last_context
+        assert context.source_dir == tmp_path / "template" / "EN"
+        assert context.output_dir == tmp_path / "build" / "EN" / "withHelp" / "html"
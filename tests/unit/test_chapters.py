@@ -0,0 +1,42 @@
+"""Tests for splitting Asciidoctor HTML into chapters"""
+
+import pytest
+
+
+@pytest.mark.unit
+class TestSplitChapters:
+    """Test suite for splitting Asciidoctor HTML into chapters"""
+
+    _HTML = (
+        '<html><body><div id="header"><h1>arc42</h1></div>'
+        '<div class="sect1"><h2 id="_intro">1. Introduction &amp; Goals</h2>'
+        '<div class="sectionbody"><p>first</p></div></div>'
+        '<div class="sect1"><h2 id="_constraints">2. Constraints</h2>'
+        '<div class="sectionbody"><p>second</p></div></div>'
+        '</body></html>'
+    )
+
+    @pytest.mark.parametrize("use_lxml", [True, False])
+    def test_chapter_holds_only_its_section(self, use_lxml, monkeypatch):
+        """Verify each chapter gets its own title and body, with or without lxml"""
+        from arc42_builder.converters import _chapters
+
+        if use_lxml and _chapters._lxml_html is None:
+            pytest.skip("lxml not installed")
+        if not use_lxml:
+            monkeypatch.setattr(_chapters, "_lxml_html", None)
+
+        chapters = list(_chapters.iter_chapters(self._HTML))
+
+        assert [title for title, _ in chapters] == ["1. Introduction & Goals", "2. Constraints"]
+        assert "first" in chapters[0][1] and "second" not in chapters[0][1]
+        assert "second" in chapters[1][1] and "first" not in chapters[1][1]
+
+    def test_unterminated_header_ends_scan(self, monkeypatch):
+        """Verify the substring scan stops at an h2 without a closing tag"""
+        from arc42_builder.converters import _chapters
+
+        monkeypatch.setattr(_chapters, "_lxml_html", None)
+        chapters = list(_chapters.iter_chapters("<h2>One</h2><p>a</p><h2>Two"))
+
+        assert chapters == [("One", "<h2>One</h2><p>a</p>")]
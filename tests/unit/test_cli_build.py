@@ -0,0 +1,49 @@
+"""Tests for the build command's CLI overrides"""
+
+import pytest
+from click.testing import CliRunner
+
+
+@pytest.fixture
+def captured_config(monkeypatch, tmp_path):
+    """Replace BuildPipeline with a stub that records the config it receives"""
+    from arc42_builder.core import builder
+
+    captured = {}
+
+    class _StubPipeline:
+        def __init__(self, config):
+            captured["config"] = config
+
+        def run(self):
+            pass
+
+    monkeypatch.setattr(builder, "BuildPipeline", _StubPipeline)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    return captured
+
+
+@pytest.mark.unit
+class TestBuildFormatOverride:
+    """Test suite for the --format option"""
+
+    def test_format_filters_config(self, build_config_file, captured_config):
+        """Verify only the requested formats are passed to the pipeline"""
+        from arc42_builder.cli import cli
+
+        result = CliRunner().invoke(cli, ["--config", str(build_config_file), "build", "--format", "html"], obj={})
+
+        assert result.exit_code == 0, result.output
+        assert list(captured_config["config"].formats) == ["html"]
+
+    def test_unknown_format_warns(self, build_config_file, captured_config):
+        """Verify a format missing from the config is reported instead of silently dropped"""
+        from arc42_builder.cli import cli
+
+        result = CliRunner().invoke(cli, [
+            "--config", str(build_config_file), "build", "--format", "html", "--format", "pfd",
+        ], obj={})
+
+        assert result.exit_code == 0, result.output
+        assert "pfd" in result.output
+        assert list(captured_config["config"].formats) == ["html"]
@@ -0,0 +1,67 @@
+"""Tests for the dist command"""
+
+import zipfile
+
+import pytest
+from click.testing import CliRunner
+
+
+@pytest.fixture
+def build_tree(tmp_path):
+    """Create a minimal build tree: {LANG}/{FLAVOR}/{FORMAT}/files"""
+    build_dir = tmp_path / "build"
+    html_dir = build_dir / "EN" / "plain" / "html"
+    (html_dir / "images").mkdir(parents=True)
+    (html_dir / "arc42-template-EN-plain.html").write_text("<html></html>")
+    (html_dir / "images" / "logo.png").write_bytes(b"\x89PNG")
+
+    pdf_dir = build_dir / "DE" / "withHelp" / "pdf"
+    pdf_dir.mkdir(parents=True)
+    (pdf_dir / "arc42-template-DE-withHelp.pdf").write_bytes(b"%PDF-1.4")
+    return build_dir
+
+
+@pytest.mark.unit
+class TestDistCommand:
+    """Test suite for ZIP distribution creation"""
+
+    def test_dist_creates_one_zip_per_format(self, build_config_file, build_tree, tmp_path, monkeypatch):
+        """Verify each {LANG}/{FLAVOR}/{FORMAT} directory becomes one archive"""
+        from arc42_builder.cli import cli
+
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        dist_dir = tmp_path / "dist"
+        result = CliRunner().invoke(cli, [
+            "--config", str(build_config_file),
+            "dist", "--build-dir", str(build_tree), "--dist-dir", str(dist_dir),
+        ], obj={})
+
+        assert result.exit_code == 0, result.output
+        assert "Created 2 ZIP distributions" in result.output
+
+        html_zip = dist_dir / "EN" / "plain" / "html" / "arc42-template-EN-plain-html.zip"
+        with zipfile.ZipFile(html_zip) as zf:
+            assert sorted(zf.namelist()) == ["arc42-template-EN-plain.html", "images/logo.png"]
+
+        pdf_zip = dist_dir / "DE" / "withHelp" / "pdf" / "arc42-template-DE-withHelp-pdf.zip"
+        with zipfile.ZipFile(pdf_zip) as zf:
+            assert zf.read("arc42-template-DE-withHelp.pdf") == b"%PDF-1.4"
+
+    def test_dist_stores_already_compressed_formats(self, build_config_file, build_tree, tmp_path, monkeypatch):
+        """Verify PDF archives are stored while HTML archives are deflated"""
+        from arc42_builder.cli import cli
+
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+        dist_dir = tmp_path / "dist"
+        CliRunner().invoke(cli, [
+            "--config", str(build_config_file),
+            "dist", "--build-dir", str(build_tree), "--dist-dir", str(dist_dir),
+        ], obj={})
+
+        pdf_zip = dist_dir / "DE" / "withHelp" / "pdf" / "arc42-template-DE-withHelp-pdf.zip"
+        with zipfile.ZipFile(pdf_zip) as zf:
+            assert all(i.compress_type == zipfile.ZIP_STORED for i in zf.infolist())
+
+        html_zip = dist_dir / "EN" / "plain" / "html" / "arc42-template-EN-plain-html.zip"
+        with zipfile.ZipFile(html_zip) as zf:
+            assert all(i.compress_type == zipfile.ZIP_DEFLATED for i in zf.infolist())
@@ -116,3 +116,133 @@ class TestConfigValidation:
         assert "repository" in template
         assert "ref" in template
         assert "path" in template
+
+    def test_validate_basic_collects_all_errors(self, valid_minimal_config):
+        """Verify every problem is reported by default"""
+        from arc42_builder.config.loader import ConfigLoader
+
+        valid_minimal_config["languages"] = ["EN", "XX"]
+        valid_minimal_config["flavors"] = ["noHelp"]
+        config = ConfigLoader()._build_config_from_dict(valid_minimal_config)
+
+        assert config.validate_basic() == ["Invalid language: XX", "Invalid flavor: noHelp"]
+
+    def test_validate_basic_fail_fast_stops_at_first_error(self, valid_minimal_config):
+        """Verify advanced.fail_fast reports only the first problem"""
+        from arc42_builder.config.loader import ConfigLoader
+
+        valid_minimal_config["languages"] = ["EN", "XX"]
+        valid_minimal_config["flavors"] = ["noHelp"]
+        valid_minimal_config["advanced"] = {"fail_fast": True}
+        config = ConfigLoader()._build_config_from_dict(valid_minimal_config)
+
+        assert config.validate_basic() == ["Invalid language: XX"]
+
+    def test_invalid_schema_raises_config_error(self, tmp_path):
+        """Verify a malformed schema file is reported as a ConfigError"""
+        from arc42_builder.config.loader import ConfigLoader, ConfigError
+
+        schema = tmp_path / "schema.json"
+        schema.write_text("{not json")
+
+        with pytest.raises(ConfigError, match="Invalid JSON schema"):
+            ConfigLoader(schema_path=schema).schema
+
+
+@pytest.mark.unit
+class TestConfigCache:
+    """Test suite for the on-disk configuration cache"""
+
+    def test_load_writes_cache_entry(self, build_config_file, tmp_path):
+        """Verify a successful load stores the validated config"""
+        from arc42_builder.config.loader import ConfigLoader
+
+        loader = ConfigLoader(cache_dir=tmp_path / "cache")
+        config = loader.load(build_config_file)
+
+        cache_files = list((tmp_path / "cache").glob("*.pkl"))
+        assert len(cache_files) == 1, "Expected exactly one cache entry"
+        assert loader.load(build_config_file) == config
+
+    def test_cache_invalidated_when_config_changes(self, build_config_file, tmp_path):
+        """Verify editing the YAML file bypasses the stale cache entry"""
+        from arc42_builder.config.loader import ConfigLoader
+
+        config_file = tmp_path / "build.yaml"
+        config_file.write_text(build_config_file.read_text())
+        loader = ConfigLoader(cache_dir=tmp_path / "cache")
+        assert loader.load(config_file).build.max_workers == 4
+
+        config_file.write_text(config_file.read_text().replace("max_workers: 4", "max_workers: 2"))
+        assert loader.load(config_file).build.max_workers == 2
+
+    def test_env_override_is_part_of_cache_key(self, build_config_file, tmp_path, monkeypatch):
+        """Verify environment overrides are not served from a stale entry"""
+        from arc42_builder.config.loader import ConfigLoader
+
+        loader = ConfigLoader(cache_dir=tmp_path / "cache")
+        loader.load(build_config_file)
+
+        monkeypatch.setenv("ARC42_BUILD_MAX_WORKERS", "7")
+        assert loader.load(build_config_file).build.max_workers == 7
+
+    def test_load_without_schema_validation_is_not_cached(self, build_config_file, tmp_path):
+        """Verify the schema-less fast path never populates the cache"""
+        from arc42_builder.config.loader import ConfigLoader
+
+        loader = ConfigLoader(cache_dir=tmp_path / "cache")
+        config = loader.load(build_config_file, validate_schema=False)
+
+        assert config.languages
+        assert not (tmp_path / "cache").exists()
+
+
+@pytest.mark.unit
+class TestEnvOverrides:
+    """Test suite for ARC42_* environment variable overrides"""
+
+    def test_overrides_create_missing_sections(self, monkeypatch):
+        """Verify overrides are converted and nested under their section"""
+        from arc42_builder.config.loader import ConfigLoader
+
+        monkeypatch.setenv("ARC42_BUILD_PARALLEL", "False")
+        monkeypatch.setenv("ARC42_BUILD_MAX_WORKERS", "8")
+        monkeypatch.setenv("ARC42_LOG_LEVEL", "DEBUG")
+
+        data = ConfigLoader()._apply_env_overrides({})
+
+        assert data == {"build": {"parallel": False, "max_workers": 8}, "logging": {"level": "DEBUG"}}
+
+    def test_empty_override_is_ignored(self, monkeypatch):
+        """Verify an empty variable leaves the config untouched"""
+        from arc42_builder.config.loader import ConfigLoader
+
+        monkeypatch.setenv("ARC42_BUILD_MAX_WORKERS", "")
+        assert ConfigLoader()._apply_env_overrides({"build": {"max_workers": 2}}) == {"build": {"max_workers": 2}}
+
+
+@pytest.mark.unit
+class TestConfigPaths:
+    """Test suite for the Path helpers on config models"""
+
+    def test_template_path_is_resolved_once(self, tmp_path):
+        """Verify get_path reuses the resolved Path until path changes"""
+        from arc42_builder.config.models import TemplateConfig
+
+        template = TemplateConfig(repository="repo", ref="main", path=str(tmp_path / "a"))
+        first = template.get_path()
+        assert template.get_path() is first
+
+        template.path = str(tmp_path / "b")
+        assert template.get_path() == (tmp_path / "b").resolve()
+
+    def test_build_paths_follow_settings(self):
+        """Verify the build directory helpers reflect the configured strings"""
+        from pathlib import Path
+        from arc42_builder.config.models import BuildSettings
+
+        settings = BuildSettings()
+        assert settings.get_output_path() is settings.get_output_path()
+
+        settings.dist_dir = "out/dist"
+        assert settings.get_dist_path() == Path("out/dist")
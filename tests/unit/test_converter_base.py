@@ -0,0 +1,81 @@
+"""Tests for shared converter helpers"""
+
+import pytest
+
+
+@pytest.mark.unit
+class TestLinkImages:
+    """Test suite for populating a converter's images directory"""
+
+    def test_images_are_hardlinked(self, tmp_path):
+        """Verify images share the source inode instead of being copied"""
+        from arc42_builder.converters.base import link_images
+
+        source = tmp_path / "src" / "images"
+        (source / "sub").mkdir(parents=True)
+        (source / "logo.png").write_bytes(b"\x89PNG")
+        (source / "sub" / "diagram.svg").write_text("<svg/>")
+
+        target = tmp_path / "out" / "images"
+        link_images(source, target)
+
+        assert (target / "logo.png").stat().st_ino == (source / "logo.png").stat().st_ino
+        assert (target / "sub" / "diagram.svg").read_text() == "<svg/>"
+
+    def test_existing_directory_is_replaced(self, tmp_path):
+        """Verify stale files from a previous build are removed"""
+        from arc42_builder.converters.base import link_images
+
+        source = tmp_path / "src" / "images"
+        source.mkdir(parents=True)
+        (source / "logo.png").write_bytes(b"\x89PNG")
+        target = tmp_path / "out" / "images"
+        target.mkdir(parents=True)
+        (target / "stale.png").write_bytes(b"old")
+
+        link_images(source, target)
+
+        assert sorted(p.name for p in target.iterdir()) == ["logo.png"]
+
+    def test_linked_directory_is_kept(self, tmp_path, monkeypatch):
+        """Verify a repeat build leaves an already linked directory untouched"""
+        from arc42_builder.converters.base import link_images
+
+        source = tmp_path / "src" / "images"
+        source.mkdir(parents=True)
+        (source / "logo.png").write_bytes(b"\x89PNG")
+        target = tmp_path / "out" / "images"
+        link_images(source, target)
+
+        from arc42_builder.converters import base
+        monkeypatch.setattr(base.shutil, "rmtree", lambda *a, **k: pytest.fail("images relinked"))
+        link_images(source, target)
+
+        assert (target / "logo.png").exists()
+
+
+@pytest.mark.unit
+class TestResolveCommand:
+    """Test suite for resolving executables on PATH"""
+
+    def test_executable_is_resolved_per_path(self, tmp_path, monkeypatch):
+        """Verify the executable becomes a full path that follows PATH changes"""
+        from arc42_builder.converters.base import resolve_command
+
+        for name in ("first", "second"):
+            tool = tmp_path / name / "pandoc"
+            tool.parent.mkdir()
+            tool.write_text("#!/bin/sh\n")
+            tool.chmod(0o755)
+
+        monkeypatch.setenv("PATH", str(tmp_path / "first"))
+        assert resolve_command(["pandoc", "-o", "x"]) == [str(tmp_path / "first" / "pandoc"), "-o", "x"]
+        monkeypatch.setenv("PATH", str(tmp_path / "second"))
+        assert resolve_command(["pandoc"]) == [str(tmp_path / "second" / "pandoc")]
+
+    def test_missing_executable_is_unchanged(self, tmp_path, monkeypatch):
+        """Verify a command whose executable is not on PATH is left as is"""
+        from arc42_builder.converters.base import resolve_command
+
+        monkeypatch.setenv("PATH", str(tmp_path))
+        assert resolve_command(["asciidoctor", "a.adoc"]) == ["asciidoctor", "a.adoc"]
@@ -1,7 +1,21 @@
 """Tests for converter registry and discovery"""
 
+import importlib
+from collections import defaultdict
+from operator import attrgetter
+
 import pytest
-from pathlib import Path
+
+from arc42_builder.converters import available_formats, get_converter
+
+CORE_FORMATS = frozenset({"html", "pdf", "docx"})
+MARKDOWN_FORMATS = frozenset({"markdown", "markdown_mp", "github_markdown", "github_markdown_mp"})
+
+
+def pytest_generate_tests(metafunc):
+    """Run converter_name tests once per registered format"""
+    if "converter_name" in metafunc.fixturenames:
+        metafunc.parametrize("converter_name", available_formats())
 
 
 @pytest.mark.unit
@@ -10,125 +24,122 @@ class TestConverterRegistry:
 
     def test_can_import_list_converters(self):
         """Verify list_converters function can be imported"""
-        from arc42_builder.converters import list_converters
-        assert list_converters is not None
+        converters_module = importlib.import_module("arc42_builder.converters")
+        assert converters_module.list_converters is not None
 
-    def test_list_converters_returns_dict(self):
+    def test_list_converters_returns_dict(self, converters):
         """Verify list_converters returns a dictionary"""
-        from arc42_builder.converters import list_converters
-        converters = list_converters()
         assert isinstance(converters, dict), "list_converters should return a dict"
 
-    def test_converters_are_discovered(self):
+    def test_converters_are_discovered(self, converters):
         """Verify at least some converters are discovered"""
-        from arc42_builder.converters import list_converters
-        converters = list_converters()
         assert len(converters) > 0, "No converters were discovered"
 
-    def test_expected_core_converters_exist(self):
+    def test_expected_core_converters_exist(self, converters):
         """Verify core converters (html, pdf, docx) are discovered"""
-        from arc42_builder.converters import list_converters
-        converters = list_converters()
-
-        core_formats = ["html", "pdf", "docx"]
-        for format_name in core_formats:
-            assert format_name in converters, \
-                f"Core converter '{format_name}' not found"
+        missing = CORE_FORMATS - converters.keys()
+        assert not missing, f"Core converters not found: {missing}"
 
-    def test_markdown_converters_exist(self):
+    def test_markdown_converters_exist(self, converters):
         """Verify markdown variants are discovered"""
-        from arc42_builder.converters import list_converters
-        converters = list_converters()
-
-        markdown_formats = ["markdown", "markdown_mp", "github_markdown", "github_markdown_mp"]
-        for format_name in markdown_formats:
-            assert format_name in converters, \
-                f"Markdown converter '{format_name}' not found"
-
-    def test_converter_has_name_attribute(self):
-        """Verify each converter has a name attribute"""
-        from arc42_builder.converters import list_converters
-        converters = list_converters()
-
-        for name, converter in converters.items():
-            assert hasattr(converter, 'name'), \
-                f"Converter '{name}' missing 'name' attribute"
-
-    def test_converter_has_priority_attribute(self):
-        """Verify each converter has a priority attribute"""
-        from arc42_builder.converters import list_converters
-        converters = list_converters()
-
-        for name, converter in converters.items():
-            assert hasattr(converter, 'priority'), \
-                f"Converter '{name}' missing 'priority' attribute"
-            assert isinstance(converter.priority, int), \
-                f"Converter '{name}' priority should be an integer"
-            assert 1 <= converter.priority <= 3, \
-                f"Converter '{name}' priority {converter.priority} out of range (1-3)"
-
-    def test_converter_has_convert_method(self):
-        """Verify each converter has a convert method"""
-        from arc42_builder.converters import list_converters
-        converters = list_converters()
-
-        for name, converter in converters.items():
-            assert hasattr(converter, 'convert'), \
-                f"Converter '{name}' missing 'convert' method"
-            assert callable(converter.convert), \
-                f"Converter '{name}' convert should be callable"
-
-    def test_converter_has_check_dependencies_method(self):
-        """Verify each converter has a check_dependencies method"""
-        from arc42_builder.converters import list_converters
-        converters = list_converters()
-
-        for name, converter in converters.items():
-            assert hasattr(converter, 'check_dependencies'), \
-                f"Converter '{name}' missing 'check_dependencies' method"
-            assert callable(converter.check_dependencies), \
-                f"Converter '{name}' check_dependencies should be callable"
-
-    def test_converter_names_match_registry_keys(self):
-        """Verify converter name attribute matches registry key"""
-        from arc42_builder.converters import list_converters
-        converters = list_converters()
-
-        for key, converter in converters.items():
-            assert converter.name == key, \
-                f"Converter key '{key}' doesn't match name '{converter.name}'"
-
-    def test_all_converter_files_are_loaded(self, converters_dir):
-        """Verify all converter files are loaded (except base and __init__)"""
-        from arc42_builder.converters import list_converters
-
-        # Get converter Python files
-        converter_files = [f.stem for f in converters_dir.glob("*.py")
-                          if f.stem not in ["__init__", "base"]]
-
+        missing = MARKDOWN_FORMATS - converters.keys()
+        assert not missing, f"Markdown converters not found: {missing}"
+
+    def test_converter_is_complete(self, converters, converter_name):
+        """Verify a converter's name, priority and methods in one pass"""
+        converter = converters[converter_name]
+
+        assert converter.name == converter_name, \
+            f"Converter key '{converter_name}' doesn't match name '{getattr(converter, 'name', None)}'"
+        assert isinstance(getattr(converter, 'priority', None), int), \
+            f"Converter '{converter_name}' priority should be an integer"
+        assert 1 <= converter.priority <= 3, \
+            f"Converter '{converter_name}' priority {converter.priority} out of range (1-3)"
+        assert callable(getattr(converter, 'convert', None)), \
+            f"Converter '{converter_name}' convert should be callable"
+        assert callable(getattr(converter, 'check_dependencies', None)), \
+            f"Converter '{converter_name}' check_dependencies should be callable"
+
+    def test_all_converter_files_are_loaded(self, converter_stems, converters):
+        """Verify all converter files are loaded (except base, __init__ and private helpers)"""
         # Get registered converters
-        registered = set(list_converters().keys())
+        registered = set(converters.keys())
 
         # Check all files are loaded
-        for file_name in converter_files:
+        for file_name in converter_stems:
             assert file_name in registered, \
                 f"Converter file '{file_name}.py' not registered"
 
-    def test_no_duplicate_priorities_within_same_tier(self):
+    def test_no_duplicate_priorities_within_same_tier(self, request, converters):
         """Verify converters don't have conflicting priorities in same tier"""
-        from arc42_builder.converters import list_converters
-        converters = list_converters()
+        if not request.config.getoption("verbose"):
+            pytest.skip("informational only; run with -v to list priority tiers")
 
         # Group by priority
-        priority_groups = {}
+        priority_groups = defaultdict(list)
+        get_priority = attrgetter('priority')
         for name, converter in converters.items():
-            priority = converter.priority
-            if priority not in priority_groups:
-                priority_groups[priority] = []
-            priority_groups[priority].append(name)
+            priority_groups[get_priority(converter)].append(name)
 
         # This is informational - multiple converters can have same priority
         # They would be processed in arbitrary order within the same priority
-        # This test just documents the current state
+        # This test just documents the current state; the tiers are listed
+        # in the terminal summary of verbose runs
         for priority, names in priority_groups.items():
-            print(f"Priority {priority}: {', '.join(names)}")
+            request.node.user_properties.append((f"Priority {priority}", ", ".join(names)))
+
+    def test_get_converter_imports_lazily(self):
+        """Verify converters are instantiated on first use and then reused"""
+        assert "html" in available_formats()
+        converter = get_converter("html")
+        assert converter.name == "html"
+        assert get_converter("html") is converter
+
+    def test_get_converter_unknown_format(self):
+        """Verify an unknown format raises ValueError"""
+        with pytest.raises(ValueError):
+            get_converter("no-such-format")
+
+
+@pytest.mark.unit
+class TestDependencyProbe:
+    """Test suite for the memoized dependency probe"""
+
+    def test_missing_tool_returns_none(self):
+        """Verify a tool that is not installed is reported as None"""
+        from arc42_builder.converters.base import probe_tool
+        assert probe_tool("arc42-no-such-tool", "--version") is None
+
+    def test_missing_tool_is_not_spawned(self, monkeypatch):
+        """Verify no process is started for a tool that is not on PATH"""
+        import subprocess
+        from arc42_builder.converters.base import probe_tool
+
+        monkeypatch.setattr(subprocess, "run", lambda *a, **k: pytest.fail("probe spawned a process"))
+        probe_tool.cache_clear()
+        try:
+            assert probe_tool("arc42-no-such-tool", "--version") is None
+        finally:
+            probe_tool.cache_clear()
+
+    def test_probe_runs_once_per_command(self, monkeypatch):
+        """Verify repeated probes of the same command reuse the first result"""
+        import shutil
+        import subprocess
+        from arc42_builder.converters.base import probe_tool
+
+        calls = []
+
+        def fake_run(cmd, **kwargs):
+            calls.append(cmd)
+            return subprocess.CompletedProcess(cmd, 0, stdout="fake 1.0\n", stderr="")
+
+        monkeypatch.setattr(subprocess, "run", fake_run)
+        monkeypatch.setattr(shutil, "which", lambda name: f"/usr/bin/{name}")
+        probe_tool.cache_clear()
+        try:
+            assert probe_tool("fake-tool", "--version") == "fake 1.0\n"
+            assert probe_tool("fake-tool", "--version") == "fake 1.0\n"
+            assert calls == [["fake-tool", "--version"]]
+        finally:
+            probe_tool.cache_clear()
@@ -0,0 +1,59 @@
+"""Tests for the GitHub Markdown post-processing"""
+
+import pytest
+
+
+@pytest.mark.unit
+class TestOptimizeForGithub:
+    """Test suite for the GitHub-specific Markdown rewrites"""
+
+    _SAMPLE = (
+        "See [context](#Context and Scope!) for details.\n"
+        "**Note:** keep it short\n"
+        "**Tip:** use diagrams\n"
+        "Some **Note:** in the middle stays\n"
+    )
+
+    def test_single_page(self, tmp_path):
+        """Verify anchors are normalized and known admonitions become alerts"""
+        from arc42_builder.converters.github_markdown import GithubMarkdownConverter
+
+        md_file = tmp_path / "out.md"
+        md_file.write_text(self._SAMPLE, encoding="utf-8")
+        GithubMarkdownConverter()._optimize_for_github(md_file)
+
+        assert md_file.read_text(encoding="utf-8") == (
+            "See [context](#context-and-scope) for details.\n"
+            "> [!NOTE] keep it short\n"
+            "**Tip:** use diagrams\n"
+            "Some **Note:** in the middle stays\n"
+        )
+
+    def test_multi_page_converts_all_admonitions(self, tmp_path):
+        """Verify the multi-page converter also handles Tip and Caution"""
+        from arc42_builder.converters.github_markdown_mp import GithubMarkdownMpConverter
+
+        md_file = tmp_path / "chapter.md"
+        md_file.write_text(self._SAMPLE, encoding="utf-8")
+        GithubMarkdownMpConverter()._optimize_for_github(md_file)
+
+        content = md_file.read_text(encoding="utf-8")
+        assert "> [!NOTE] keep it short\n> [!TIP] use diagrams\n" in content
+        assert "(#context-and-scope)" in content
+
+
+@pytest.mark.unit
+class TestSlugify:
+    """Test suite for the GitHub anchor slugifier"""
+
+    @pytest.mark.parametrize("anchor, expected", [
+        ("Context and Scope!", "context-and-scope"),
+        ("_section_1.2 -- Goals", "_section_12-goals"),
+        ("tabs\tand\nnewlines", "tabs-and-newlines"),
+        ("Qualitäts–Anforderungen “neu”", "qualitätsanforderungen-neu"),
+    ])
+    def test_matches_github_rules(self, anchor, expected):
+        """Verify ASCII and non-ASCII anchors follow GitHub's header anchor rules"""
+        from arc42_builder.converters.github_markdown import _slugify
+        assert _slugify(anchor) == expected
+
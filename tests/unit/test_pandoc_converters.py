@@ -0,0 +1,188 @@
+"""Tests for the pandoc-based converters (DOCX, RST, ...)"""
+
+import os
+import stat
+import sys
+
+import pytest
+
+_FAKE_ASCIIDOCTOR = """\
+import os, sys
+with open(sys.argv[sys.argv.index("-o") + 1], "w", encoding="utf-8") as f:
+    f.write(os.environ.get("FAKE_ASCIIDOCTOR_HTML", "<html><body><p>Hallo Welt</p></body></html>"))
+with open(os.environ["FAKE_ASCIIDOCTOR_LOG"], "a") as log:
+    log.write("run\\n")
+"""
+
+_FAKE_PANDOC = """\
+import sys
+with open(sys.argv[1], encoding="utf-8") as f:
+    html = f.read()
+with open(sys.argv[sys.argv.index("-o") + 1], "w", encoding="utf-8") as f:
+    f.write(html)
+"""
+
+
+@pytest.fixture
+def fake_tools(tmp_path, monkeypatch):
+    """Put stand-ins for asciidoctor and pandoc first on PATH"""
+    from arc42_builder.converters import _asciidoctor_pool, _pandoc_server
+
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    for name, source in [("asciidoctor", _FAKE_ASCIIDOCTOR), ("pandoc", _FAKE_PANDOC)]:
+        tool = bin_dir / name
+        tool.write_text(f"#!{sys.executable}\n{source}")
+        tool.chmod(tool.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv("PATH", f"{bin_dir}:{os.environ['PATH']}")
+    monkeypatch.setenv("FAKE_ASCIIDOCTOR_LOG", str(tmp_path / "asciidoctor.log"))
+
+    pool = _asciidoctor_pool.AsciidoctorPool()
+    pool._available = False
+    monkeypatch.setattr(_asciidoctor_pool, "_pool", pool)
+
+    server = _pandoc_server.PandocServer()
+    server._available = False
+    monkeypatch.setattr(_pandoc_server, "_server", server)
+    return bin_dir
+
+
+@pytest.mark.unit
+class TestPandocConverters:
+    """Test suite for the Asciidoctor to Pandoc pipeline"""
+
+    def _context(self, tmp_path, name, html_builder=None, chapter_executor=None):
+        from arc42_builder.converters.base import BuildContext
+
+        source_dir = tmp_path / "src"
+        if not source_dir.exists():
+            source_dir.mkdir()
+            (source_dir / "arc42-template.adoc").write_text("= arc42\n", encoding="utf-8")
+        output_dir = tmp_path / name
+        output_dir.mkdir()
+        return BuildContext(
+            language="DE", flavor="plain", source_dir=source_dir,
+            output_dir=output_dir, version_props={}, config={},
+            html_builder=html_builder, chapter_executor=chapter_executor,
+        )
+
+    @pytest.fixture
+    def chapter_executor(self):
+        """A small shared chapter pool that counts the chapters it converts"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        class CountingExecutor(ThreadPoolExecutor):
+            def __init__(self):
+                super().__init__(max_workers=2)
+                self.chapters = 0
+
+            def map(self, fn, *iterables, **kwargs):
+                items = list(iterables[0])
+                self.chapters += len(items)
+                return super().map(fn, items, **kwargs)
+
+        with CountingExecutor() as executor:
+            yield executor
+
+    def test_docx_uses_shared_html(self, fake_tools, tmp_path):
+        """Verify Asciidoctor output reaches Pandoc and no temp HTML is left in the output"""
+        from arc42_builder.converters.docx import DocxConverter
+
+        context = self._context(tmp_path, "docx")
+        output = DocxConverter().convert(context)
+
+        assert "Hallo Welt" in output.read_text(encoding="utf-8")
+        assert list(context.output_dir.glob("temp-*.html")) == []
+
+    def test_html_rendered_once_for_several_formats(self, fake_tools, tmp_path):
+        """Verify DOCX and RST of the same language and flavor share one Asciidoctor run"""
+        from arc42_builder.converters.docx import DocxConverter
+        from arc42_builder.converters.rst import RstConverter
+
+        DocxConverter().convert(self._context(tmp_path, "docx"))
+        RstConverter().convert(self._context(tmp_path, "rst"))
+
+        assert (tmp_path / "asciidoctor.log").read_text().count("run") == 1
+
+    def test_pipeline_builder_renders_toc_variant_separately(self, fake_tools, tmp_path):
+        """Verify GitHub Markdown gets its own TOC rendering and the builder cleans up on exit"""
+        from arc42_builder.converters._intermediate_cache import IntermediateHtmlBuilder
+        from arc42_builder.converters.docx import DocxConverter
+        from arc42_builder.converters.github_markdown import GithubMarkdownConverter
+        from arc42_builder.converters.markdown import MarkdownConverter
+
+        with IntermediateHtmlBuilder() as builder:
+            DocxConverter().convert(self._context(tmp_path, "docx", builder))
+            MarkdownConverter().convert(self._context(tmp_path, "markdown", builder))
+            GithubMarkdownConverter().convert(self._context(tmp_path, "gfm", builder))
+            tmp_dir = builder._tmp_dir
+            assert len(list(tmp_dir.glob("*.html"))) == 2
+
+        assert (tmp_path / "asciidoctor.log").read_text().count("run") == 2
+        assert not tmp_dir.exists()
+
+    def test_cached_html_survives_builder(self, fake_tools, tmp_path):
+        """Verify a later run reuses the intermediate HTML stored in the artifact cache"""
+        from arc42_builder.converters._cache import ArtifactCache
+        from arc42_builder.converters._intermediate_cache import IntermediateHtmlBuilder
+        from arc42_builder.converters.docx import DocxConverter
+
+        for run in ("first", "second"):
+            with IntermediateHtmlBuilder(ArtifactCache(tmp_path / "cache")) as builder:
+                output = DocxConverter().convert(self._context(tmp_path, run, builder))
+
+        assert (builder.hits, builder.misses) == (1, 0)
+        assert "Hallo Welt" in output.read_text(encoding="utf-8")
+        assert (tmp_path / "asciidoctor.log").read_text().count("run") == 1
+
+    def test_github_chapters_keep_order(self, fake_tools, tmp_path, monkeypatch, chapter_executor):
+        """Verify chapters converted on the shared pool are listed in document order"""
+        from arc42_builder.converters.github_markdown_mp import GithubMarkdownMpConverter
+
+        titles = ["Introduction and Goals", "Constraints", "Context and Scope", "Solution Strategy"]
+        chapters = "".join(f"<h2>{title}</h2><p>Text {n}</p>" for n, title in enumerate(titles, 1))
+        monkeypatch.setenv("FAKE_ASCIIDOCTOR_HTML", f"<html><body>{chapters}</body></html>")
+
+        readme = GithubMarkdownMpConverter().convert(
+            self._context(tmp_path, "gfm_mp", chapter_executor=chapter_executor))
+
+        chapter_dir = readme.parent / "chapters"
+        assert sorted(p.name for p in chapter_dir.iterdir()) == [
+            "01-introduction-and-goals.md", "02-constraints.md",
+            "03-context-and-scope.md", "04-solution-strategy.md",
+        ]
+        assert "Text 3" in (chapter_dir / "03-context-and-scope.md").read_text(encoding="utf-8")
+        assert "3. [Context and Scope](chapters/03-context-and-scope.md)" in readme.read_text(encoding="utf-8")
+        assert list(readme.parent.rglob("*.tmp")) == []
+        assert chapter_executor.chapters == 4
+
+    def test_github_converters_share_toc_html(self, fake_tools, tmp_path, monkeypatch):
+        """Verify single- and multi-page GitHub Markdown use one TOC rendering"""
+        from arc42_builder.converters._intermediate_cache import IntermediateHtmlBuilder
+        from arc42_builder.converters.github_markdown import GithubMarkdownConverter
+        from arc42_builder.converters.github_markdown_mp import GithubMarkdownMpConverter
+
+        monkeypatch.setenv("FAKE_ASCIIDOCTOR_HTML", "<html><body><h2>Constraints</h2><p>Text</p></body></html>")
+        with IntermediateHtmlBuilder() as builder:
+            GithubMarkdownConverter().convert(self._context(tmp_path, "gfm", builder))
+            GithubMarkdownMpConverter().convert(self._context(tmp_path, "gfm_mp", builder))
+
+        assert (tmp_path / "asciidoctor.log").read_text().count("run") == 1
+
+    def test_markdown_index_lists_chapters(self, fake_tools, tmp_path, monkeypatch, chapter_executor):
+        """Verify the multi-page Markdown index links every chapter in order"""
+        from arc42_builder.converters.markdown_mp import MarkdownMpConverter
+
+        chapters = "<h2>Constraints</h2><p>one</p><h2>Solution Strategy</h2><p>two</p>"
+        monkeypatch.setenv("FAKE_ASCIIDOCTOR_HTML", f"<html><body>{chapters}</body></html>")
+
+        index = MarkdownMpConverter().convert(
+            self._context(tmp_path, "markdown_mp", chapter_executor=chapter_executor))
+
+        assert index.read_text(encoding="utf-8").endswith(
+            "## Chapters\n\n"
+            "- [Constraints](chapters/01-constraints.md)\n"
+            "- [Solution Strategy](chapters/02-solution-strategy.md)\n"
+        )
+        assert not index.with_name("index.md.tmp").exists()
+        assert chapter_executor.chapters == 2
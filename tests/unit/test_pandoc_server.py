@@ -0,0 +1,94 @@
+"""Tests for the shared pandoc server"""
+
+import stat
+import subprocess
+import sys
+
+import pytest
+
+# Stands in for `pandoc server --port N`: upper-cases the posted text
+_FAKE_PANDOC = """\
+import json, sys
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+class Handler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        reply = json.dumps({"output": request["to"] + ":" + request["text"].upper(), "messages": []}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(reply)))
+        self.end_headers()
+        self.wfile.write(reply)
+
+    def log_message(self, *args):
+        pass
+
+assert sys.argv[1] == "server"
+HTTPServer(("127.0.0.1", int(sys.argv[3])), Handler).serve_forever()
+"""
+
+
+@pytest.mark.unit
+class TestServerRequest:
+    """Test suite for translating pandoc command lines into server requests"""
+
+    def test_text_conversion_is_translated(self):
+        """Verify the options used by the converters map to server options"""
+        from arc42_builder.converters._pandoc_server import _server_request
+
+        cmd = ["pandoc", "in.html", "-f", "html", "-t", "gfm", "--wrap=preserve",
+               "--atx-headers", "--resource-path", "out", "-o", "out/README.md"]
+        assert _server_request(cmd) == (
+            {"from": "html", "to": "gfm", "wrap": "preserve", "markdown-headings": "atx"},
+            "in.html", "out/README.md",
+        )
+
+    @pytest.mark.parametrize("cmd", [
+        ["pandoc", "in.html", "-f", "html", "-t", "docx", "-o", "out.docx"],
+        ["pandoc", "in.html", "-f", "html", "-t", "rst", "--standalone", "-o", "out.rst"],
+        ["pandoc", "in.html", "-f", "html", "-t", "rst"],
+        ["pandoc", "in.html", "-f", "html", "-t"],
+    ])
+    def test_unsupported_commands_are_rejected(self, cmd):
+        """Verify binary output, unknown options and incomplete commands stay on the CLI"""
+        from arc42_builder.converters._pandoc_server import _server_request
+        assert _server_request(cmd) is None
+
+
+@pytest.mark.unit
+class TestPandocServer:
+    """Test suite for running conversions through the pandoc server"""
+
+    def test_falls_back_to_subprocess(self):
+        """Verify commands still run when no server can be started"""
+        from arc42_builder.converters._pandoc_server import PandocServer
+
+        server = PandocServer()
+        server._available = False
+        with pytest.raises(subprocess.CalledProcessError):
+            server.run([sys.executable, "-c", "raise SystemExit(2)"])
+
+    def test_server_converts_text(self, tmp_path, monkeypatch):
+        """Verify text conversions are posted to one server and written to the output file"""
+        from arc42_builder.converters._pandoc_server import PandocServer
+
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir()
+        pandoc = bin_dir / "pandoc"
+        pandoc.write_text(f"#!{sys.executable}\n{_FAKE_PANDOC}")
+        pandoc.chmod(pandoc.stat().st_mode | stat.S_IEXEC)
+        monkeypatch.setenv("PATH", str(bin_dir), prepend=":")
+
+        source = tmp_path / "in.html"
+        source.write_text("<p>hallo</p>", encoding="utf-8")
+        server = PandocServer()
+        try:
+            for name in ("a.md", "b.md"):
+                server.run(["pandoc", str(source), "-f", "html", "-t", "gfm", "-o", str(tmp_path / name)])
+            proc = server._proc
+            assert (tmp_path / "a.md").read_text(encoding="utf-8") == "gfm:<P>HALLO</P>\n"
+            assert (tmp_path / "b.md").read_text(encoding="utf-8") == "gfm:<P>HALLO</P>\n"
+            assert server._proc is proc
+        finally:
+            server.close()
@@ -0,0 +1,402 @@
+"""Tests for the pre-build and artifact validator"""
+
+import pytest
+
+
+@pytest.fixture
+def validator_config(tmp_path, valid_minimal_config, monkeypatch):
+    """Return a BuildConfig for two languages whose template lives in tmp_path"""
+    from arc42_builder.config.loader import ConfigLoader
+
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg-cache"))
+    valid_minimal_config["languages"] = ["EN", "DE"]
+    config = ConfigLoader(cache_dir=tmp_path / "cache")._build_config_from_dict(valid_minimal_config)
+    config.template.path = str(tmp_path / "template")
+    return config
+
+
+def _make_language(template_dir, lang):
+    lang_dir = template_dir / lang
+    lang_dir.mkdir(parents=True)
+    (lang_dir / "version.properties").write_text("revnumber=9.0\n", encoding="utf-8")
+    (lang_dir / "arc42-template.adoc").write_text("= arc42\n", encoding="utf-8")
+    return lang_dir
+
+
+@pytest.mark.unit
+class TestValidateLanguages:
+    """Test suite for the per-language template checks"""
+
+    def test_every_language_is_checked(self, validator_config, tmp_path, monkeypatch):
+        """Verify the references of each configured language are checked"""
+        from arc42_builder.core.validator import Validator
+
+        for lang in ("EN", "DE"):
+            _make_language(tmp_path / "template", lang)
+        checked = []
+        monkeypatch.setattr(Validator, "_check_asciidoctor_references", lambda self, adoc: checked.append(adoc.parent.name))
+
+        Validator(validator_config).validate_languages()
+
+        assert sorted(checked) == ["DE", "EN"]
+
+    def test_missing_language_directory_fails(self, validator_config, tmp_path, monkeypatch):
+        """Verify an error in one language is raised from validate_languages"""
+        from arc42_builder.core.validator import Validator
+
+        _make_language(tmp_path / "template", "EN")
+        monkeypatch.setattr(Validator, "_check_asciidoctor_references", lambda self, adoc: None)
+
+        with pytest.raises(FileNotFoundError, match="'DE'"):
+            Validator(validator_config).validate_languages()
+
+    def test_reference_check_runs_asciidoctor(self, asciidoctor_gem, validator_config, tmp_path):
+        """Verify the reference check passes clean sources and rejects broken includes"""
+        from arc42_builder.core.validator import Validator
+
+        lang_dir = _make_language(tmp_path / "template", "EN")
+        validator = Validator(validator_config)
+        validator._check_asciidoctor_references(lang_dir / "arc42-template.adoc")
+
+        broken = lang_dir / "broken.adoc"
+        broken.write_text("= arc42\n\ninclude::missing.adoc[]\n", encoding="utf-8")
+        with pytest.raises(ValueError, match="Broken references"):
+            validator._check_asciidoctor_references(broken)
+
+
+@pytest.mark.unit
+class TestValidationCache:
+    """Test suite for skipping checks of unchanged inputs"""
+
+    def test_unchanged_language_is_not_rechecked(self, validator_config, tmp_path, monkeypatch):
+        """Verify a later validator skips the reference check until a file changes"""
+        import os
+
+        from arc42_builder.core.validator import Validator
+
+        for lang in ("EN", "DE"):
+            _make_language(tmp_path / "template", lang)
+        checked = []
+        monkeypatch.setattr(Validator, "_check_asciidoctor_references", lambda self, adoc: checked.append(adoc.parent.name))
+        validator_config.build.verify_fonts = False
+
+        Validator(validator_config).run_all_validations()
+        Validator(validator_config).run_all_validations()
+        assert sorted(checked) == ["DE", "EN"]
+
+        chapter = tmp_path / "template" / "DE" / "src" / "01_introduction.adoc"
+        chapter.parent.mkdir()
+        chapter.write_text("== Einführung\n", encoding="utf-8")
+        os.utime(chapter, ns=(1, 1))
+        Validator(validator_config).run_all_validations()
+        assert sorted(checked) == ["DE", "DE", "EN"]
+
+    def test_disabled_incremental_always_checks(self, validator_config, tmp_path, monkeypatch):
+        """Verify build.incremental=False neither reads nor writes the cache"""
+        from arc42_builder.core.validator import Validator
+
+        _make_language(tmp_path / "template", "EN")
+        checked = []
+        monkeypatch.setattr(Validator, "_check_asciidoctor_references", lambda self, adoc: checked.append(adoc))
+        validator_config.languages = ["EN"]
+        validator_config.build.incremental = False
+
+        Validator(validator_config).validate_languages()
+        Validator(validator_config).validate_languages()
+
+        assert len(checked) == 2
+        assert not (tmp_path / "xdg-cache").exists()
+
+@pytest.mark.unit
+class TestCheckMissingImages:
+    """Test suite for image references in the AsciiDoc sources"""
+
+    def test_warns_about_missing_images(self, validator_config, tmp_path, caplog):
+        """Verify only images found neither in the language nor images directory are reported"""
+        from arc42_builder.core.validator import Validator
+
+        lang_dir = _make_language(tmp_path / "template", "EN")
+        (lang_dir / "images").mkdir()
+        (lang_dir / "images" / "logo.png").write_bytes(b"\x89PNG")
+        (lang_dir / "src").mkdir()
+        (lang_dir / "src" / "01_introduction.adoc").write_text(
+            "image::logo.png[arc42]\nSee image:gone.png[] inline.\n"
+            "image:: images/logo.png[]\nimage::./src/../images/logo.png[]\n",
+            encoding="utf-8",
+        )
+        (lang_dir / "src" / "02_empty.adoc").write_text("", encoding="utf-8")
+
+        with caplog.at_level("WARNING"):
+            Validator(validator_config)._check_missing_images(lang_dir)
+
+        assert "gone.png" in caplog.text
+        assert "logo.png" not in caplog.text
+
+    def test_accepts_references_outside_the_file_set(self, validator_config, tmp_path, caplog):
+        """Verify references leaving the language directory or naming a directory still resolve"""
+        from arc42_builder.core.validator import Validator
+
+        lang_dir = _make_language(tmp_path / "template", "EN")
+        (lang_dir / "images" / "icons").mkdir(parents=True)
+        (tmp_path / "template" / "shared.png").write_bytes(b"\x89PNG")
+        (lang_dir / "arc42-template.adoc").write_text(
+            "image::../shared.png[]\nimage::icons[]\nimage::../nowhere.png[]\n", encoding="utf-8"
+        )
+
+        with caplog.at_level("WARNING"):
+            Validator(validator_config)._check_missing_images(lang_dir)
+
+        assert "nowhere.png" in caplog.text
+        assert "shared.png" not in caplog.text
+        assert "icons" not in caplog.text
+
+
+@pytest.mark.unit
+class TestValidateHtmlArtifacts:
+    """Test suite for HTML image reference checks"""
+
+    def test_reports_missing_and_absolute_images(self, validator_config, tmp_path):
+        """Verify problems from every HTML file are collected"""
+        from arc42_builder.core.validator import Validator
+
+        build_dir = tmp_path / "build"
+        (build_dir / "EN" / "images").mkdir(parents=True)
+        (build_dir / "EN" / "images" / "logo.png").write_bytes(b"\x89PNG")
+        (build_dir / "EN" / "ok.html").write_text('<img src="images/logo.png">', encoding="utf-8")
+        (build_dir / "EN" / "bad.html").write_text(
+            '<img src="images/gone.png"><img src="/abs/logo.png"><img src="https://x/y.png">',
+            encoding="utf-8",
+        )
+
+        with pytest.raises(ValueError) as excinfo:
+            Validator(validator_config).validate_build_artifacts(build_dir)
+
+        message = str(excinfo.value)
+        assert "2 issue(s)" in message
+        assert "bad.html: Missing image: images/gone.png" in message
+        assert "bad.html: Image uses absolute path: /abs/logo.png" in message
+
+
+@pytest.mark.unit
+class TestExtractImages:
+    """Test suite for reading image sources from HTML"""
+
+    @pytest.mark.parametrize("use_lxml", [True, False])
+    def test_img_sources_are_found(self, use_lxml, tmp_path, monkeypatch):
+        """Verify every img src is returned, with or without lxml"""
+        from arc42_builder.core import validator
+
+        if use_lxml and validator._etree is None:
+            pytest.skip("lxml not installed")
+        if not use_lxml:
+            monkeypatch.setattr(validator, "_etree", None)
+
+        html_file = tmp_path / "a.html"
+        html_file.write_text(
+            '<html><body><p><img src="images/a&amp;b.png" alt="x">text</p>'
+            '<img alt="no source"><div><IMG SRC="images/c.png"></div></body></html>',
+            encoding="utf-8",
+        )
+
+        assert validator._extract_images(html_file) == ["images/a&b.png", "images/c.png"]
+
+@pytest.mark.unit
+class TestCollectArtifacts:
+    """Test suite for finding build artifacts"""
+
+    def test_files_are_grouped_by_kind(self, tmp_path):
+        """Verify one walk finds Markdown, HTML and DOCX files at any depth"""
+        from arc42_builder.core.validator import _collect_artifacts
+
+        for name in ("EN/md/index.md", "EN/md/chapters/01-intro.md", "EN/html/a.html", "DE/docx/a.docx", "EN/html/logo.png"):
+            path = tmp_path / name
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(b"")
+
+        artifacts = _collect_artifacts(tmp_path)
+
+        assert sorted(p.relative_to(tmp_path).as_posix() for p in artifacts["md"]) == [
+            "EN/md/chapters/01-intro.md",
+            "EN/md/index.md",
+        ]
+        assert [p.name for p in artifacts["html"]] == ["a.html"]
+        assert [p.name for p in artifacts["docx"]] == ["a.docx"]
+
+
+@pytest.mark.unit
+class TestVerifyFonts:
+    """Test suite for the installed font check"""
+
+    @pytest.fixture
+    def fc_list(self, monkeypatch):
+        """Answer `fc-list` with a fixed font list and record its runs"""
+        import subprocess
+        from pathlib import Path
+
+        from arc42_builder.core import validator
+
+        monkeypatch.setattr(validator.Validator, "_FONTS_CACHE", None)
+        monkeypatch.setattr(validator, "FONTS_VERIFIED_MARKER", Path("/nonexistent/fonts.ok"))
+        calls = []
+
+        installed = [
+            "Noto Sans,Noto Sans Regular",
+            "Noto Sans CJK SC,Noto Sans CJK SC Regular",
+            "Noto Sans Mono",
+            "Liberation Sans",
+        ]
+
+        def fake_run(cmd, **kwargs):
+            calls.append(cmd)
+            return subprocess.CompletedProcess(cmd, 0, stdout="".join(f"{line}\n" for line in installed))
+
+        monkeypatch.setattr(validator.subprocess, "run", fake_run)
+        return installed, calls
+
+    def test_fc_list_runs_once(self, validator_config, fc_list):
+        """Verify repeated validations reuse the first `fc-list` result"""
+        from arc42_builder.core.validator import Validator
+
+        validator_config.build.verify_fonts = True
+        Validator(validator_config).verify_fonts_installed()
+        Validator(validator_config).verify_fonts_installed()
+
+        assert len(fc_list[1]) == 1
+
+    def test_image_marker_skips_fc_list(self, validator_config, fc_list, tmp_path, monkeypatch):
+        """Verify fonts checked at image build time are not checked again"""
+        from arc42_builder.core import validator
+
+        marker = tmp_path / "fonts.ok"
+        marker.touch()
+        monkeypatch.setattr(validator, "FONTS_VERIFIED_MARKER", marker)
+        validator_config.build.verify_fonts = True
+
+        validator.Validator(validator_config).verify_fonts_installed()
+
+        assert fc_list[1] == []
+
+    def test_family_prefix_does_not_count(self, validator_config, fc_list):
+        """Verify a longer family name does not satisfy a required font"""
+        from arc42_builder.core.validator import Validator
+
+        installed, _ = fc_list
+        installed.remove("Noto Sans,Noto Sans Regular")
+        validator_config.build.verify_fonts = True
+
+        with pytest.raises(RuntimeError, match="'Noto Sans'"):
+            Validator(validator_config).verify_fonts_installed()
+
+    def test_marker_written_only_when_all_fonts_present(self, fc_list, tmp_path, monkeypatch):
+        """Verify the image build records fonts only after a complete check"""
+        from arc42_builder.core import validator
+
+        marker = tmp_path / "arc42" / "fonts.ok"
+        monkeypatch.setattr(validator, "FONTS_VERIFIED_MARKER", marker)
+
+        assert validator.Validator.record_fonts_verified() is True
+        assert marker.is_file()
+
+        marker.unlink()
+        monkeypatch.setattr(validator.Validator, "_FONTS_CACHE", None)
+        fc_list[0].remove("Liberation Sans")
+        assert validator.Validator.record_fonts_verified() is False
+        assert not marker.exists()
+
+    def test_marker_not_written_without_fc_list(self, fc_list, tmp_path, monkeypatch):
+        """Verify an unavailable `fc-list` leaves the fonts unverified"""
+        from arc42_builder.core import validator
+
+        marker = tmp_path / "fonts.ok"
+        monkeypatch.setattr(validator, "FONTS_VERIFIED_MARKER", marker)
+
+        def missing_fc_list(cmd, **kwargs):
+            raise FileNotFoundError(cmd[0])
+
+        monkeypatch.setattr(validator.subprocess, "run", missing_fc_list)
+
+        assert validator.Validator.record_fonts_verified() is False
+        assert not marker.exists()
+
+
+@pytest.mark.unit
+class TestValidateDocxArtifacts:
+    """Test suite for DOCX archive checks"""
+
+    def test_corrupted_docx_is_reported(self, validator_config, tmp_path):
+        """Verify a DOCX that is not a ZIP archive fails while valid ones pass"""
+        import zipfile
+
+        from arc42_builder.core.validator import Validator
+
+        good = tmp_path / "good.docx"
+        with zipfile.ZipFile(good, "w") as docx:
+            docx.writestr("word/document.xml", "<w:document/>")
+            docx.writestr("word/media/image1.png", b"\x89PNG")
+        bad = tmp_path / "bad.docx"
+        bad.write_bytes(b"not a zip")
+
+        validator = Validator(validator_config)
+        validator.validate_docx_artifacts([good])
+        with pytest.raises(ValueError, match="bad.docx: File is not a valid DOCX"):
+            validator.validate_docx_artifacts([good, bad])
+
+
+@pytest.mark.unit
+class TestValidateMarkdownArtifacts:
+    """Test suite for the Markdown syntax check"""
+
+    @pytest.fixture
+    def fake_pandoc(self, monkeypatch):
+        """Fail every pandoc run that is given a file named bad.md; record the runs"""
+        import subprocess
+
+        from arc42_builder.core import validator
+
+        calls = []
+
+        def fake_run(cmd, **kwargs):
+            calls.append(cmd)
+            if any(arg.endswith("bad.md") for arg in cmd):
+                raise subprocess.CalledProcessError(64, cmd, stderr=b"parse error")
+            return subprocess.CompletedProcess(cmd, 0)
+
+        monkeypatch.setattr(validator.subprocess, "run", fake_run)
+        return calls
+
+    def test_files_are_checked_in_one_run(self, validator_config, tmp_path, fake_pandoc):
+        """Verify valid files need a single pandoc invocation"""
+        from arc42_builder.core.validator import Validator
+
+        md_files = [tmp_path / "index.md", tmp_path / "01-intro.md"]
+        Validator(validator_config).validate_markdown_artifacts(md_files)
+
+        assert len(fake_pandoc) == 1
+        assert fake_pandoc[0][1:3] == [str(md_files[0]), str(md_files[1])]
+
+    def test_failures_are_attributed_per_file(self, validator_config, tmp_path, fake_pandoc):
+        """Verify a failed batch is retried file by file to name the broken one"""
+        from arc42_builder.core.validator import Validator
+
+        md_files = [tmp_path / "index.md", tmp_path / "bad.md"]
+        with pytest.raises(ValueError, match="1 file") as excinfo:
+            Validator(validator_config).validate_markdown_artifacts(md_files)
+
+        assert "bad.md: parse error" in str(excinfo.value)
+        assert len(fake_pandoc) == 3
+
+    def test_passed_files_are_skipped_next_run(self, validator_config, tmp_path, fake_pandoc):
+        """Verify only files not yet seen passing reach pandoc on a later run"""
+        from arc42_builder.core.validator import Validator
+
+        md_files = [tmp_path / "index.md", tmp_path / "01-intro.md"]
+        for md_file in md_files:
+            md_file.write_text("# Title\n", encoding="utf-8")
+        Validator(validator_config).validate_build_artifacts(tmp_path)
+
+        new_file = tmp_path / "02-constraints.md"
+        new_file.write_text("# Constraints\n", encoding="utf-8")
+        Validator(validator_config).validate_build_artifacts(tmp_path)
+
+        assert len(fake_pandoc) == 2
+        assert fake_pandoc[1][1:-4] == [str(new_file)]